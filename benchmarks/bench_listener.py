@@ -0,0 +1,141 @@
+"""Upload latency through Home Assistant's HTTP server and the dedicated listener.
+
+Runs offline: an in-process Home Assistant with only the `http` component
+and a `StationListener` are started on free localhost ports, both serving
+the same stand-in upload handler. The difference is the cost of the HTTP
+stack in front of the integration, which the listener avoids. Run from
+repository root with Home Assistant installed:
+
+    python benchmarks/bench_listener.py
+"""
+
+import argparse
+import asyncio
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+from homeassistant import loader
+from homeassistant.auth import auth_manager_from_config
+from homeassistant.config_entries import ConfigEntries
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# pylint: disable=wrong-import-position
+from custom_components.sws12500.const import DEFAULT_URL
+from custom_components.sws12500.listener import StationListener
+
+PAYLOAD = {
+    "ID": "STATION1",
+    "PASSWORD": "secret",
+    "tempf": "50.5",
+    "humidity": "60",
+    "dewptf": "37.1",
+    "baromin": "29.92",
+    "windspeedmph": "4.3",
+    "windgustmph": "7.8",
+    "winddir": "225",
+    "dailyrainin": "0.12",
+    "solarradiation": "120.5",
+    "UV": "1",
+}
+
+
+def free_port() -> int:
+    """Return a localhost port nothing listens on."""
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def handler(request: web.Request) -> web.Response:
+    """Stand in for the integration, read the query like it does."""
+
+    _ = dict(request.query)
+    return web.Response(body="OK")
+
+
+async def start_hass(config_dir: str, port: int) -> HomeAssistant:
+    """Start Home Assistant with only the http component."""
+
+    hass = HomeAssistant(config_dir)
+    loader.async_setup(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    hass.auth = await auth_manager_from_config(hass, [], [])
+
+    config = {"http": {"server_host": ["127.0.0.1"], "server_port": port}}
+    if not await async_setup_component(hass, "http", config):
+        raise RuntimeError("Unable to set up http component")
+    hass.http.app.router.add_get(DEFAULT_URL, handler)
+    await hass.async_start()
+    return hass
+
+
+async def run(
+    session: aiohttp.ClientSession, url: str, count: int, pause: float
+) -> list[float]:
+    """Send uploads one by one, return latencies in ms."""
+
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        async with session.get(url, params=PAYLOAD) as resp:
+            await resp.read()
+            resp.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(pause)
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    """Print latency summary."""
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:<10} n={len(latencies):<5} "
+        f"mean={statistics.fmean(latencies):7.3f} ms "
+        f"p50={statistics.median(latencies):7.3f} ms p95={p95:7.3f} ms"
+    )
+
+
+async def main() -> None:
+    """Run benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument(
+        "--pause", type=float, default=0.0, help="seconds between uploads"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        ha_port, listener_port = free_port(), free_port()
+        hass = await start_hass(config_dir, ha_port)
+        listener = StationListener(hass, listener_port, handler, False)
+        if not await listener.async_start():
+            raise RuntimeError(f"Unable to listen on port {listener_port}")
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                for label, port in (("ha", ha_port), ("listener", listener_port)):
+                    url = f"http://127.0.0.1:{port}{DEFAULT_URL}"
+                    # warm up connection
+                    await run(session, url, 10, args.pause)
+                    report(label, await run(session, url, args.count, args.pause))
+        finally:
+            await listener.async_stop()
+            await hass.async_stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
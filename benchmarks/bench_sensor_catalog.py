@@ -0,0 +1,128 @@
+"""Import and setup timing of the full sensor set.
+
+Module import is timed in a fresh interpreter per run, so nothing is
+cached between runs. The integration package, which pulls in Home
+Assistant, is imported before the clock starts and the sensor module is
+then executed again on its own. The keyed catalog is compared with the former
+approach, a tuple of every description built at import and scanned by
+key. The tuple is built from the catalog's own partials, so both sides
+construct identical descriptions. Run from repository root with Home
+Assistant installed:
+
+    python benchmarks/bench_sensor_catalog.py
+"""
+
+import argparse
+import importlib
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+PACKAGE = "custom_components.sws12500"
+CATALOGS = {
+    "sensors_wslink": "SENSOR_TYPES_WSLINK",
+    "sensors_weather": "SENSOR_TYPES_WEATHER_API",
+}
+
+# Timed in a fresh interpreter, prints import time in seconds. With
+# `eager` set every description is built into a tuple like the former
+# module level SENSOR_TYPES tuples did.
+IMPORT_SCRIPT = """
+import importlib, sys, time
+sys.path.insert(0, {root!r})
+importlib.import_module({package!r})
+del sys.modules[{module!r}]
+start = time.perf_counter()
+module = importlib.import_module({module!r})
+if {eager!r}:
+    catalog = getattr(module, {catalog!r})
+    descriptions = tuple(catalog[key] for key in catalog)
+print(time.perf_counter() - start)
+"""
+
+
+def timed(label: str, func, repeat: int = 1):
+    """Run func, print mean duration."""
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<40} {elapsed * 1e6:>10.1f} us")
+    return result
+
+
+def import_time(module: str, catalog: str, eager: bool, runs: int) -> float:
+    """Return median import time of module over fresh interpreters."""
+
+    script = IMPORT_SCRIPT.format(
+        root=str(ROOT),
+        package=PACKAGE,
+        module=f"{PACKAGE}.{module}",
+        catalog=catalog,
+        eager=eager,
+    )
+    return statistics.median(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    )
+
+
+def main() -> None:
+    """Run benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--runs", type=int, default=10, help="fresh interpreters per import"
+    )
+    args = parser.parse_args()
+
+    for module, catalog in CATALOGS.items():
+        for label, eager in (("tuple", True), ("catalog", False)):
+            elapsed = import_time(module, catalog, eager, args.runs)
+            print(f"{f'import {module} ({label})':<40} {elapsed * 1e6:>10.1f} us")
+
+    sensor = importlib.import_module(f"{PACKAGE}.sensor")
+    for module, name in CATALOGS.items():
+        catalog = getattr(importlib.import_module(f"{PACKAGE}.{module}"), name)
+        keys = list(catalog)
+        descriptions = tuple(catalog[key] for key in keys)
+
+        timed(
+            f"scan {len(keys)} {module} tuple",
+            lambda descriptions=descriptions, keys=keys: [
+                next(item for item in descriptions if item.key == key) for key in keys
+            ],
+            1000,
+        )
+        timed(
+            f"lookup {len(keys)} {module} catalog",
+            lambda catalog=catalog, keys=keys: [catalog[key] for key in keys],
+            1000,
+        )
+
+        coordinator = SimpleNamespace(config=SimpleNamespace(options={}), data={})
+        timed(
+            f"construct {len(keys)} {module} entities",
+            lambda catalog=catalog, keys=keys, coordinator=coordinator: [
+                sensor.WeatherSensor(None, catalog[key], coordinator) for key in keys
+            ],
+            100,
+        )
+
+
+if __name__ == "__main__":
+    main()
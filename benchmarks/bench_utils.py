@@ -0,0 +1,286 @@
+"""Micro-benchmarks of upload decoding helpers and sensor values.
+
+Runs offline on generated WU and WSLink payloads, `hass` and the config
+entry are plain stand-ins. Run from repository root with Home Assistant
+installed:
+
+    python benchmarks/bench_utils.py             # print timings
+    python benchmarks/bench_utils.py --update    # store them as baseline
+    python benchmarks/bench_utils.py --compare   # fail on regression
+
+Timings are nanoseconds per payload, the best of several repeats. Each
+run also times a fixed reference loop, and --compare checks timings
+relative to it, so a machine that is uniformly faster or slower does not
+show up as a change. Interpreters and platforms differ in more than
+speed, so --compare refuses a baseline recorded on another one.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# pylint: disable=wrong-import-position
+from custom_components.sws12500 import sensor
+from custom_components.sws12500.const import (
+    REMAP_WSLINK_ITEMS,
+    SENSORS_TO_LOAD,
+)
+from custom_components.sws12500.sensors_wslink import SENSOR_TYPES_WSLINK
+from custom_components.sws12500.utils import (
+    anonymize,
+    battery_level_to_text,
+    check_disabled,
+    chill_index,
+    heat_index,
+    remap_items,
+    remap_wslink_items,
+    wind_dir_to_text,
+)
+
+BASELINE = Path(__file__).with_name("baseline.json")
+CORPUS_SIZE = 200
+REPEAT = 5
+THRESHOLD = 0.25
+
+
+def wu_payload(rng: random.Random) -> dict[str, str]:
+    """Return query of a PWS (WU) upload."""
+
+    temp = rng.uniform(-15, 95)
+    return {
+        "ID": "STATION1",
+        "PASSWORD": "secret",
+        "action": "updateraw",
+        "dateutc": "now",
+        "tempf": f"{temp:.1f}",
+        "humidity": str(rng.randint(15, 100)),
+        "dewptf": f"{temp - rng.uniform(0, 30):.1f}",
+        "baromin": f"{rng.uniform(29.2, 30.6):.2f}",
+        "windspeedmph": f"{rng.uniform(0, 30):.1f}",
+        "windgustmph": f"{rng.uniform(0, 45):.1f}",
+        "winddir": str(rng.randint(0, 359)),
+        "rainin": f"{rng.choice((0, 0, 0, rng.uniform(0, 1))):.2f}",
+        "dailyrainin": f"{rng.uniform(0, 2):.2f}",
+        "solarradiation": f"{rng.uniform(0, 1000):.1f}",
+        "UV": str(rng.randint(0, 11)),
+        "indoortempf": f"{rng.uniform(60, 80):.1f}",
+        "indoorhumidity": str(rng.randint(30, 60)),
+        "softwaretype": "EasyWeatherPro_V5.1.6",
+    }
+
+
+def wslink_payload(rng: random.Random) -> dict[str, str]:
+    """Return query of a WSLink upload."""
+
+    temp = rng.uniform(-25, 35)
+    return {
+        "wsid": "STATION1",
+        "wspw": "secret",
+        "t1tem": f"{temp:.1f}",
+        "t1hum": str(rng.randint(15, 100)),
+        "t1dew": f"{temp - rng.uniform(0, 15):.1f}",
+        "t1wdir": str(rng.randint(0, 359)),
+        "t1ws": f"{rng.uniform(0, 15):.1f}",
+        "t1wgust": f"{rng.uniform(0, 25):.1f}",
+        "t1rainra": f"{rng.choice((0, 0, 0, rng.uniform(0, 20))):.1f}",
+        "t1raindy": f"{rng.uniform(0, 40):.1f}",
+        "t1rainhr": f"{rng.uniform(0, 10):.1f}",
+        "t1rainwy": f"{rng.uniform(0, 80):.1f}",
+        "t1rainmth": f"{rng.uniform(0, 150):.1f}",
+        "t1rainyr": f"{rng.uniform(0, 900):.1f}",
+        "t1solrad": f"{rng.uniform(0, 1000):.1f}",
+        "t1uvi": str(rng.randint(0, 11)),
+        "t1chill": f"{temp - rng.uniform(0, 5):.1f}",
+        "t1heat": f"{temp + rng.uniform(0, 5):.1f}",
+        "t1cn": "1",
+        "t1bat": str(rng.randint(0, 1)),
+        "rbar": f"{rng.uniform(990, 1035):.1f}",
+        "intem": f"{rng.uniform(18, 26):.1f}",
+        "inhum": str(rng.randint(30, 60)),
+        "inbat": str(rng.randint(0, 1)),
+        "t234c1tem": f"{rng.uniform(-5, 25):.1f}",
+        "t234c1hum": str(rng.randint(20, 90)),
+        "t234c1cn": "1",
+        "t234c1bat": rng.choice(("0", "1", "")),
+    }
+
+
+def benchmarks() -> dict:
+    """Return benchmark name: (callable over corpus, payloads per call)."""
+
+    rng = random.Random(12500)
+    wu = [wu_payload(rng) for _ in range(CORPUS_SIZE)]
+    wslink = [wslink_payload(rng) for _ in range(CORPUS_SIZE)]
+    wslink_items = [remap_wslink_items(payload) for payload in wslink]
+    directions = [float(items["wind_dir"]) for items in wslink_items]
+    batteries = [payload["t1bat"] for payload in wslink]
+
+    hass = SimpleNamespace()
+    # half of the decoded sensors are loaded, so check_disabled finds the rest
+    loaded = list(REMAP_WSLINK_ITEMS.values())[::2]
+    config_entry = SimpleNamespace(options={SENSORS_TO_LOAD: loaded})
+
+    coordinator = SimpleNamespace(config=SimpleNamespace(options={}), data={})
+    entities = [
+        sensor.WeatherSensor(hass, description, coordinator)  # type: ignore[arg-type]
+        for description in SENSOR_TYPES_WSLINK.values()
+    ]
+
+    def native_values() -> None:
+        for items in wslink_items:
+            coordinator.data = items
+            for entity in entities:
+                entity._data = items.get(entity.entity_description.key)
+                entity.native_value  # noqa: B018
+
+    return {
+        "remap_items": (lambda: [remap_items(p) for p in wu], len(wu)),
+        "remap_wslink_items": (
+            lambda: [remap_wslink_items(p) for p in wslink],
+            len(wslink),
+        ),
+        "anonymize_wu": (lambda: [anonymize(p) for p in wu], len(wu)),
+        "anonymize_wslink": (lambda: [anonymize(p) for p in wslink], len(wslink)),
+        "check_disabled": (
+            lambda: [
+                check_disabled(hass, i, config_entry)  # type: ignore[arg-type]
+                for i in wslink_items
+            ],
+            len(wslink_items),
+        ),
+        "heat_index": (
+            lambda: [heat_index(i) for i in wslink_items],
+            len(wslink_items),
+        ),
+        "chill_index": (
+            lambda: [chill_index(i) for i in wslink_items],
+            len(wslink_items),
+        ),
+        "wind_dir_to_text": (
+            lambda: [wind_dir_to_text(d) for d in directions],
+            len(directions),
+        ),
+        "battery_level_to_text": (
+            lambda: [
+                battery_level_to_text(b)  # type: ignore[arg-type]
+                for b in batteries
+            ],
+            len(batteries),
+        ),
+        "native_value": (native_values, len(wslink_items)),
+    }
+
+
+def reference() -> None:
+    """Convert a string dict like decoding does, the speed reference."""
+
+    data = {str(i): f"{i * 1.5:.1f}" for i in range(32)}
+    {key: float(value) for key, value in data.items() if value}
+
+
+def environment() -> dict[str, str]:
+    """Return interpreter and platform the timings are valid for."""
+
+    return {
+        "interpreter": (
+            f"{platform.python_implementation()} {platform.python_version()}"
+        ),
+        "platform": f"{platform.system()} {platform.machine()}",
+    }
+
+
+def measure(func, payloads: int) -> float:
+    """Return best time of func in ns per payload."""
+
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(REPEAT, number)) / number / payloads * 1e9
+
+
+def main() -> None:
+    """Run benchmarks, store or compare baseline."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--update", action="store_true", help="write baseline.json")
+    mode.add_argument("--compare", action="store_true", help="compare with baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="allowed slowdown as a fraction, default %(default)s",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    args = parser.parse_args()
+
+    baseline: dict[str, float] = {}
+    recorded: dict = {}
+    if args.compare:
+        if not args.baseline.exists():
+            parser.error(f"{args.baseline} not found, record it with --update")
+        recorded = json.loads(args.baseline.read_text())
+        env = environment()
+        if any(recorded.get(key) != value for key, value in env.items()):
+            parser.error(
+                f"{args.baseline} was recorded with {recorded.get('interpreter')} "
+                f"on {recorded.get('platform')}, this is {env['interpreter']} "
+                f"on {env['platform']}; record it here with --update"
+            )
+        baseline = recorded["results"]
+
+    # reference is timed between benchmarks, its best time is the least
+    # disturbed by frequency scaling and other load
+    results: dict[str, float] = {}
+    references: list[float] = []
+    for name, (func, payloads) in benchmarks().items():
+        references.append(measure(reference, 1))
+        results[name] = round(measure(func, payloads), 1)
+    references.append(measure(reference, 1))
+    ref = round(min(references), 1)
+    scale = ref / recorded["reference"] if recorded else 1.0
+
+    print(f"{'reference':<24} {ref:>10.1f} ns")
+    regressions: list[str] = []
+    for name, elapsed in results.items():
+        line = f"{name:<24} {elapsed:>10.1f} ns"
+        if (base := baseline.get(name)) is not None:
+            # relative to reference loop, machine speed cancels out
+            change = elapsed / (base * scale) - 1
+            line += f"  {change:+7.1%}"
+            if change > args.threshold:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+
+    if args.update:
+        args.baseline.write_text(
+            json.dumps(
+                {
+                    **environment(),
+                    "unit": "ns per payload",
+                    "reference": ref,
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"Baseline written to {args.baseline}")
+
+    if regressions:
+        print(
+            f"Slower than baseline by more than {args.threshold:.0%}:",
+            ", ".join(regressions),
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,76 @@
 """The Sencor SWS 12500 Weather Station integration."""
 
+import asyncio
 import logging
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
 
 import aiohttp.web
-from aiohttp.web_exceptions import HTTPUnauthorized
-
+from aiohttp.web_exceptions import (
+    HTTPForbidden,
+    HTTPTooManyRequests,
+    HTTPUnauthorized,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import InvalidStateError, PlatformNotReady
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .admission import AdmissionControl, parse_sources
+from .aggregate import IntervalAggregator
+from .archive import UploadArchive, read_segment
+from .auth import CredentialGuard
 from .const import (
+    AGGREGATE_ITEMS,
+    ALLOWED_SOURCES,
     API_ID,
     API_KEY,
+    ARCHIVE_ENABLED,
     DEFAULT_URL,
     DEV_DBG,
     DOMAIN,
+    HISTORY_CAPACITY,
+    LISTENER_DEFAULT_PORT,
+    LISTENER_ENABLED,
+    LISTENER_PORT,
     POCASI_CZ_ENABLED,
+    PRESSURE_TENDENCY,
+    RAIN_INCREMENT,
+    REALTIME_AGGREGATE_ITEMS,
+    REALTIME_ENABLED,
+    REALTIME_INTERVAL,
+    REMAP_ITEMS,
+    REMAP_WSLINK_ITEMS,
+    REPLAY_COORDINATOR,
+    REPLAY_WINDY,
     SENSORS_TO_LOAD,
+    STATISTICS_ENABLED,
     WINDY_ENABLED,
+    WINDY_INTERVAL,
     WSLINK,
     WSLINK_URL,
 )
+from .counters import RainCounters
+from .derived import DerivedMetrics
+from .forecast import PressureForecast
+from .history import ObservationHistory
+from .listener import StationListener
+from .live import LiveStream
+from .longterm import HourlyPublisher
+from .normalize import normalize
 from .pocasti_cz import PocasiPush
+from .rolling import RollingStatistics
 from .routes import Routes, unregistred
+from .sensors_weather import SENSOR_TYPES_WEATHER_API
+from .sensors_wslink import SENSOR_TYPES_WSLINK
+from .services import async_setup_services
+from .significance import SignificanceFilter
+from .trace import UploadTrace, UploadTracer
 from .utils import (
-    anonymize,
     check_disabled,
     loaded_sensors,
     remap_items,
@@ -35,10 +79,13 @@ from .utils import (
     translations,
     update_options,
 )
+from .validation import UploadValidator, purge_rejected
+from .views import BulkIngestView, ExportView
+from .websocket_api import async_register_websocket_api
 from .windy_func import WindyPush
 
 _LOGGER = logging.getLogger(__name__)
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.WEATHER]
 
 
 class IncorrectDataError(InvalidStateError):
@@ -52,52 +99,242 @@ class WeatherDataUpdateCoordinator(DataUpdateCoordinator):
         """Init global updater."""
         self.hass = hass
         self.config = config
+        self._wslink = config.options.get(WSLINK, False)
+        self.admission = AdmissionControl(
+            parse_sources(config.options.get(ALLOWED_SOURCES))
+        )
+        self.guard = CredentialGuard(
+            config.options.get(API_ID), config.options.get(API_KEY)
+        )
+        self.archive = (
+            UploadArchive(hass) if config.options.get(ARCHIVE_ENABLED) else None
+        )
+        self.listener: StationListener | None = None
         self.windy = WindyPush(hass, config)
         self.pocasi: PocasiPush = PocasiPush(hass, config)
+        self.tracer = UploadTracer(config.options.get(DEV_DBG, False))
+        self.validator = UploadValidator()
+        self.history = ObservationHistory(HISTORY_CAPACITY)
+        self.live = LiveStream()
+        self.counters = RainCounters()
+        self.rolling = RollingStatistics()
+        self.derived = DerivedMetrics()
+        self.forecast = PressureForecast(
+            self.rolling.windows[PRESSURE_TENDENCY][1], hass.config.latitude < 0
+        )
+        # last values of counters, rolling windows and forecast and time of
+        # the upload they came from
+        self._accumulated: dict[str, Any] = {}
+        self._accumulated_at = 0.0
+        self.significance = SignificanceFilter(
+            SENSOR_TYPES_WSLINK
+            if config.options.get(WSLINK)
+            else SENSOR_TYPES_WEATHER_API
+        )
+        self.longterm = (
+            HourlyPublisher(
+                hass,
+                SENSOR_TYPES_WSLINK
+                if config.options.get(WSLINK)
+                else SENSOR_TYPES_WEATHER_API,
+            )
+            if config.options.get(STATISTICS_ENABLED)
+            else None
+        )
         super().__init__(hass, _LOGGER, name=DOMAIN)
 
+        self.realtime: IntervalAggregator | None = None
+        self._realtime_unsub: CALLBACK_TYPE | None = None
+        if config.options.get(REALTIME_ENABLED):
+            self.realtime = IntervalAggregator(REALTIME_AGGREGATE_ITEMS)
+            self._realtime_unsub = async_track_time_interval(
+                hass,
+                self._async_publish_realtime,
+                timedelta(seconds=REALTIME_INTERVAL),
+            )
+
+    async def async_shutdown(self) -> None:
+        """Stop timers, end live subscriptions and close forwarder sessions."""
+
+        await super().async_shutdown()
+        self.live.close()
+        if self._realtime_unsub is not None:
+            self._realtime_unsub()
+            self._realtime_unsub = None
+        if self.longterm is not None:
+            self.longterm.async_stop()
+        # stop scheduled sends and drop data pending for them before the
+        # sessions they would use are closed
+        await self.windy.scheduler.async_cancel()
+        await self.pocasi.scheduler.async_cancel()
+        self.windy.aggregator.reset()
+        self.pocasi.aggregator.reset()
+        await self.windy.client.async_close()
+        await self.pocasi.client.async_close()
+        if self.archive is not None:
+            await self.archive.async_close()
+        if self.listener is not None:
+            await self.listener.async_stop()
+
     async def recieved_data(self, webdata):
         """Handle incoming data query."""
-        _wslink = self.config_entry.options.get(WSLINK)
+        _wslink = self._wslink
+        source = webdata.remote or ""
+
+        if not self.admission.allowed(source):
+            raise HTTPForbidden
+        if not self.admission.admit(source) or self.guard.is_locked(source):
+            raise HTTPTooManyRequests
+
         data = webdata.query
 
-        response = None
+        if _wslink:
+            id_data = data.get("wsid")
+            key_data = data.get("wspw")
+        else:
+            id_data = data.get("ID")
+            key_data = data.get("PASSWORD")
 
-        if not _wslink and ("ID" not in data or "PASSWORD" not in data):
-            _LOGGER.error("Invalid request. No security data provided!")
+        if id_data is None or key_data is None:
+            self.guard.missing(source)
             raise HTTPUnauthorized
 
-        if _wslink and ("wsid" not in data or "wspw" not in data):
-            _LOGGER.error("Invalid request. No security data provided!")
+        if not self.guard.check(source, id_data, key_data):
             raise HTTPUnauthorized
 
-        if _wslink:
-            id_data = data["wsid"]
-            key_data = data["wspw"]
+        response = await self.async_ingest(data, _wslink)
+
+        response = response or "OK"
+        return aiohttp.web.Response(body=f"{response or 'OK'}", status=200)
+
+    async def async_ingest(
+        self,
+        data,
+        _wslink: bool,
+        replay: bool = False,
+        timestamp: float | None = None,
+    ):
+        """Process authorized upload.
+
+        Replayed uploads are neither archived again nor forwarded.
+        Returns response from Windy, if any.
+        """
+
+        trace = self.tracer.start(data)
+        remaped_items, response = await self._async_process(
+            data,
+            _wslink,
+            timestamp,
+            forward=not replay,
+            archive=not replay,
+            replay=replay,
+            trace=trace,
+        )
+
+        if self.realtime is not None and not replay:
+            # every sample goes to the live stream, entities get aggregates
+            self.realtime.add(remaped_items)
         else:
-            id_data = data["ID"]
-            key_data = data["PASSWORD"]
+            self.significance.update(remaped_items)
+            self.async_set_updated_data(remaped_items)
+        self.live.publish(remaped_items)
+
+        if trace:
+            trace.mark("publish")
+            self.tracer.finish(trace)
+
+        return response
+
+    @callback
+    def _async_publish_realtime(self, now: datetime | None = None) -> None:
+        """Update entities with aggregate of realtime samples."""
+
+        if self.realtime is None or not self.realtime.samples:
+            return
+
+        items = self.realtime.result()
+        self.realtime.reset()
+        self.significance.update(items)
+        self.async_set_updated_data(items)
+
+    async def async_ingest_batch(
+        self, uploads: list[tuple[float, dict[str, str]]], _wslink: bool
+    ) -> int:
+        """Process batch of buffered uploads with one coordinator update.
+
+        Uploads are archived but not forwarded, they may be hours old.
+        Uploads older than live data already processed do not feed
+        counters and windows.
+        """
+
+        merged: dict[str, Any] = {}
+        for timestamp, data in uploads:
+            remaped_items, _ = await self._async_process(
+                data, _wslink, timestamp, forward=False, archive=True
+            )
+            merged.update(remaped_items)
+
+        if merged:
+            self.significance.update(merged)
+            self.async_set_updated_data(merged)
+            self.live.publish(merged)
+
+        return len(uploads)
+
+    async def _async_process(
+        self,
+        data,
+        _wslink: bool,
+        timestamp: float | None,
+        forward: bool,
+        archive: bool,
+        replay: bool = False,
+        trace: UploadTrace | None = None,
+    ) -> tuple[dict[str, Any], Any]:
+        """Decode, validate, forward and accumulate upload.
+
+        Counters, rolling windows, forecast, spike windows and long-term
+        statistics assume that timestamps only move forward. Replayed
+        uploads and uploads older than the newest accumulated one do not
+        feed them and get their current values instead.
+
+        Returns decoded items with derived values and Windy response.
+        """
 
-        _id = self.config_entry.options.get(API_ID)
-        _key = self.config_entry.options.get(API_KEY)
+        response = None
+        moment = time.time() if timestamp is None else timestamp
+        accumulate = not replay and moment >= self._accumulated_at
 
-        if id_data != _id or key_data != _key:
-            _LOGGER.error("Unauthorised access!")
-            raise HTTPUnauthorized
+        if self.archive is not None and archive:
+            self.archive.add(data, _wslink, timestamp)
 
-        if self.config_entry.options.get(WINDY_ENABLED):
+        remaped_items = normalize(
+            remap_wslink_items(data) if _wslink else remap_items(data), _wslink
+        )
+        if trace:
+            trace.mark("decode")
+
+        if rejected := self.validator.validate(remaped_items, learn=accumulate):
+            data = purge_rejected(
+                data, REMAP_WSLINK_ITEMS if _wslink else REMAP_ITEMS, rejected
+            )
+        if trace:
+            trace.mark("validate")
+            if rejected:
+                trace.note("rejected", sorted(rejected))
+
+        if forward and self.config_entry.options.get(WINDY_ENABLED):
             response = await self.windy.push_data_to_windy(data, _wslink)
 
-        if self.config.options.get(POCASI_CZ_ENABLED):
+        if forward and self.config.options.get(POCASI_CZ_ENABLED):
             await self.pocasi.push_data_to_server(data, "WSLINK" if _wslink else "WU")
 
-        remaped_items = (
-            remap_wslink_items(data)
-            if self.config_entry.options.get(WSLINK)
-            else remap_items(data)
-        )
+        if trace:
+            trace.mark("forward")
 
         if sensors := check_disabled(self.hass, remaped_items, self.config):
+            if trace:
+                trace.note("new_sensors", list(sensors))
             translate_sensors = [
                 await translations(
                     self.hass, DOMAIN, f"sensor.{t_key}", key="name", category="entity"
@@ -121,13 +358,83 @@ class WeatherDataUpdateCoordinator(DataUpdateCoordinator):
             await update_options(self.hass, self.config_entry, SENSORS_TO_LOAD, sensors)
             # await self.hass.config_entries.async_reload(self.config.entry_id)
 
-        self.async_set_updated_data(remaped_items)
-
-        if self.config_entry.options.get(DEV_DBG):
-            _LOGGER.info("Dev log: %s", anonymize(data))
+        if trace:
+            trace.mark("discovery")
+
+        if accumulate:
+            accumulated = self.counters.update(remaped_items)
+            remaped_items.update(accumulated)
+            accumulated.update(self.rolling.update(remaped_items, moment))
+            accumulated.update(self.forecast.update(remaped_items, moment))
+            remaped_items.update(accumulated)
+            accumulated.pop(RAIN_INCREMENT, None)
+            self._accumulated = accumulated
+            self._accumulated_at = moment
+        else:
+            remaped_items.update(self._accumulated)
+        remaped_items.update(self.derived.update(remaped_items))
+
+        if accumulate:
+            # ring buffers, like the windows above, only move forward in time
+            self.history.add(remaped_items, moment)
+            if self.longterm is not None:
+                self.longterm.add(moment, remaped_items)
+
+        if trace:
+            trace.mark("statistics")
+
+        return remaped_items, response
+
+    async def async_replay(
+        self, segment: Path, speed: float = 0, target: str = REPLAY_COORDINATOR
+    ) -> int:
+        """Replay archived segment to coordinator or Windy.
+
+        speed: 1 replays in real time, 0 as fast as possible.
+        Windy receives one aggregated observation per 5 minutes of archive.
+        """
+
+        replayed = 0
+        offset = 0
+        previous: float | None = None
+        aggregator = IntervalAggregator(AGGREGATE_ITEMS)
+        window_start: float | None = None
+        wslink = False
+
+        while True:
+            records, offset = await self.hass.async_add_executor_job(
+                read_segment, segment, offset
+            )
 
-        response = response or "OK"
-        return aiohttp.web.Response(body=f"{response or 'OK'}", status=200)
+            for timestamp, wslink, data in records:
+                if speed and previous is not None:
+                    await asyncio.sleep(max(timestamp - previous, 0) / speed)
+                previous = timestamp
+
+                if target == REPLAY_WINDY:
+                    if window_start is None:
+                        window_start = timestamp
+                    elif timestamp - window_start >= WINDY_INTERVAL:
+                        await self.windy.push_archived(
+                            aggregator.result(), wslink, window_start
+                        )
+                        aggregator.reset()
+                        window_start = timestamp
+                    aggregator.add(data)
+                else:
+                    await self.async_ingest(
+                        data, wslink, replay=True, timestamp=timestamp
+                    )
+                replayed += 1
+
+            if not offset:
+                break
+
+        if aggregator.samples and window_start is not None:
+            await self.windy.push_archived(aggregator.result(), wslink, window_start)
+
+        _LOGGER.info("Replayed %s uploads from %s", replayed, segment.name)
+        return replayed
 
 
 def register_path(
@@ -228,6 +535,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass_data["route"] = route
 
+    if entry.options.get(LISTENER_ENABLED):
+        listener = StationListener(
+            hass,
+            entry.options.get(LISTENER_PORT, LISTENER_DEFAULT_PORT),
+            coordinator.recieved_data,
+            bool(_wslink),
+        )
+        if await listener.async_start():
+            coordinator.listener = listener
+
+    async_setup_services(hass)
+
+    if not hass_data.get("websocket_api"):
+        async_register_websocket_api(hass)
+        hass_data["websocket_api"] = True
+
+    if not hass_data.get("views"):
+        hass.http.register_view(BulkIngestView())
+        hass.http.register_view(ExportView())
+        hass_data["views"] = True
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
@@ -248,6 +576,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if _ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: WeatherDataUpdateCoordinator = hass.data[DOMAIN].pop(
+            entry.entry_id
+        )
+        # aiohttp routes can not be removed, stop them calling the coordinator
+        if (routes := hass.data[DOMAIN].get("routes")) is not None:
+            routes.disable()
+        await coordinator.async_shutdown()
 
     return _ok
@@ -0,0 +1,106 @@
+"""Admission control of incoming uploads."""
+
+import ipaddress
+import time
+from collections.abc import Iterable
+
+from .const import ADMISSION_BURST, ADMISSION_MAX_SOURCES, ADMISSION_RATE
+
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+def parse_sources(value: str | None) -> list[IPNetwork]:
+    """Parse comma separated addresses and networks.
+
+    Raises ValueError on invalid entry.
+    """
+
+    return [
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in (value or "").replace(";", ",").split(",")
+        if item.strip()
+    ]
+
+
+class AdmissionControl:
+    """Allowlist and token bucket rate limit per source address.
+
+    Checked before the request is parsed, so unwanted traffic costs a set
+    lookup and a few float operations.
+    """
+
+    def __init__(
+        self,
+        allowed: Iterable[IPNetwork] = (),
+        rate: float = ADMISSION_RATE,
+        burst: float = ADMISSION_BURST,
+    ) -> None:
+        """Init."""
+        self._networks = tuple(allowed)
+        self._rate = rate
+        self._burst = burst
+
+        # decisions of allowlist, keyed by address as sent by aiohttp
+        self._allowed: dict[str, bool] = {}
+        # source -> (tokens, last refill)
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+        self.accepted = 0
+        self.dropped_not_allowed = 0
+        self.dropped_rate_limited = 0
+
+    def allowed(self, source: str) -> bool:
+        """Return True if source is in allowlist, or allowlist is empty."""
+
+        if not self._networks:
+            return True
+
+        if (allowed := self._allowed.get(source)) is None:
+            try:
+                address = ipaddress.ip_address(source)
+            except ValueError:
+                allowed = False
+            else:
+                allowed = any(address in network for network in self._networks)
+            if len(self._allowed) >= ADMISSION_MAX_SOURCES:
+                self._allowed.clear()
+            self._allowed[source] = allowed
+
+        if not allowed:
+            self.dropped_not_allowed += 1
+        return allowed
+
+    def admit(self, source: str) -> bool:
+        """Return True if allowed source is within its rate limit."""
+
+        now = time.monotonic()
+        tokens, last = self._buckets.get(source, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - last) * self._rate)
+
+        if tokens < 1:
+            self._buckets[source] = (tokens, now)
+            self.dropped_rate_limited += 1
+            return False
+
+        if source not in self._buckets and len(self._buckets) >= ADMISSION_MAX_SOURCES:
+            # drop sources with full bucket, they are the same as unknown ones
+            self._buckets = {
+                key: bucket
+                for key, bucket in self._buckets.items()
+                if bucket[0] + (now - bucket[1]) * self._rate < self._burst
+            }
+
+        self._buckets[source] = (tokens - 1, now)
+        self.accepted += 1
+        return True
+
+    def diagnostics(self) -> dict[str, int]:
+        """Return counters."""
+
+        return {
+            "allowlist": len(self._networks),
+            "accepted": self.accepted,
+            "dropped_not_allowed": self.dropped_not_allowed,
+            "dropped_rate_limited": self.dropped_rate_limited,
+            "tracked_sources": len(self._buckets),
+        }
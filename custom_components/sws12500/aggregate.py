@@ -0,0 +1,125 @@
+"""Streaming aggregation of station uploads."""
+
+import math
+from collections.abc import Mapping
+from typing import Any
+
+from .const import AggregateKind
+
+
+class FieldAggregate:
+    """Running statistics of one field, constant memory."""
+
+    __slots__ = ("cos_sum", "count", "last", "max", "mean", "min", "sin_sum")
+
+    def __init__(self) -> None:
+        """Init."""
+        self.count = 0
+        self.mean = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sin_sum = 0.0
+        self.cos_sum = 0.0
+        self.last = 0.0
+
+    def add(self, value: float) -> None:
+        """Add sample."""
+
+        self.count += 1
+        self.mean += (value - self.mean) / self.count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.last = value
+
+    def add_direction(self, degrees: float) -> None:
+        """Add direction sample, keep unit vector sums."""
+
+        self.add(degrees)
+        rad = math.radians(degrees)
+        self.sin_sum += math.sin(rad)
+        self.cos_sum += math.cos(rad)
+
+    def direction(self) -> float:
+        """Return vector averaged direction in degrees."""
+
+        if abs(self.sin_sum) < 1e-9 and abs(self.cos_sum) < 1e-9:
+            return self.last
+        return math.degrees(math.atan2(self.sin_sum, self.cos_sum)) % 360
+
+
+class IntervalAggregator:
+    """Aggregate uploads between two sends.
+
+    Fields listed in `kinds` are aggregated incrementally, every other
+    field keeps the last received value.
+    """
+
+    def __init__(self, kinds: Mapping[str, AggregateKind]) -> None:
+        """Init."""
+        self.kinds = kinds
+        self.fields: dict[str, FieldAggregate] = {}
+        self.latest: dict[str, Any] = {}
+        self.samples = 0
+
+    def add(self, data: Mapping[str, Any]) -> None:
+        """Add one upload."""
+
+        self.samples += 1
+        self.latest.update(data)
+
+        for key, kind in self.kinds.items():
+            if (value := data.get(key)) is None:
+                continue
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                continue
+
+            if (field := self.fields.get(key)) is None:
+                field = self.fields[key] = FieldAggregate()
+
+            if kind is AggregateKind.VECTOR:
+                field.add_direction(number)
+            else:
+                field.add(number)
+
+    def result(self) -> dict[str, Any]:
+        """Return aggregated upload for the interval."""
+
+        result = dict(self.latest)
+
+        for key, field in self.fields.items():
+            kind = self.kinds[key]
+            if kind is AggregateKind.MEAN:
+                result[key] = round(field.mean, 2)
+            elif kind is AggregateKind.MAX:
+                result[key] = field.max
+            elif kind is AggregateKind.VECTOR:
+                result[key] = round(field.direction())
+            else:
+                result[key] = field.last
+
+        return result
+
+    def reset(self) -> None:
+        """Start new interval."""
+
+        self.fields.clear()
+        self.latest.clear()
+        self.samples = 0
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return running statistics of current interval."""
+
+        return {
+            "samples": self.samples,
+            "fields": {
+                key: {
+                    "count": field.count,
+                    "mean": round(field.mean, 2),
+                    "min": field.min,
+                    "max": field.max,
+                }
+                for key, field in self.fields.items()
+            },
+        }
@@ -0,0 +1,216 @@
+"""Binary archive of raw station uploads."""
+
+import asyncio
+import logging
+import mmap
+import struct
+import time
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ARCHIVE_DIR,
+    ARCHIVE_MAX_SEGMENTS,
+    ARCHIVE_SEGMENT_SIZE,
+    REMAP_ITEMS,
+    REMAP_WSLINK_ITEMS,
+)
+from .utils import anonymize
+
+_LOGGER = logging.getLogger(__name__)
+
+# Segment layout:
+#   header:  magic, version, u16 table length, table ("\n" joined field names)
+#   records: u32 length, f64 timestamp, u8 wslink, u8 field count, fields
+#   field:   u8 id (0 = inline name: u8 length + name), u16 length, value
+MAGIC = b"SWSA"
+VERSION = 1
+SUFFIX = ".swsa"
+
+FIELD_NAMES: tuple[str, ...] = tuple(
+    dict.fromkeys([*REMAP_ITEMS, *REMAP_WSLINK_ITEMS, "dateutc"])
+)
+FIELD_IDS: dict[str, int] = {name: idx for idx, name in enumerate(FIELD_NAMES, 1)}
+
+_LEN = struct.Struct("<I")
+_HEAD = struct.Struct("<dBB")
+_VALUE = struct.Struct("<H")
+
+
+def encode_record(timestamp: float, wslink: bool, data: Mapping[str, Any]) -> bytes:
+    """Encode anonymized upload as length prefixed record."""
+
+    body = bytearray(_HEAD.pack(timestamp, int(wslink), 0))
+    count = 0
+
+    for key, value in anonymize(data).items():
+        if count == 255:
+            break
+        if field_id := FIELD_IDS.get(key):
+            body.append(field_id)
+        else:
+            name = key.encode()[:255]
+            body.append(0)
+            body.append(len(name))
+            body += name
+        raw = str(value).encode()[:65535]
+        body += _VALUE.pack(len(raw))
+        body += raw
+        count += 1
+
+    body[_HEAD.size - 1] = count
+    return _LEN.pack(len(body)) + bytes(body)
+
+
+def segment_header() -> bytes:
+    """Return header of new segment with field table."""
+
+    table = "\n".join(FIELD_NAMES).encode()
+    return MAGIC + bytes([VERSION]) + _VALUE.pack(len(table)) + table
+
+
+def read_segment(
+    path: Path, offset: int = 0, limit: int = 500
+) -> tuple[list[tuple[float, bool, dict[str, str]]], int]:
+    """Read up to `limit` records from segment starting at `offset`.
+
+    Returns records and offset of next record, offset is 0 when
+    segment is exhausted. Runs in executor.
+    """
+
+    records: list[tuple[float, bool, dict[str, str]]] = []
+
+    with (
+        path.open("rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view,
+    ):
+        if view[:4] != MAGIC:
+            raise ValueError(f"{path} is not an archive segment")
+
+        (table_len,) = _VALUE.unpack_from(view, 5)
+        start = 5 + _VALUE.size
+        names = view[start : start + table_len].decode().split("\n")
+        pos = max(offset, start + table_len)
+
+        for record in _iter_records(view, pos, names):
+            if len(records) >= limit:
+                return records, pos
+            records.append(record[1:])
+            pos = record[0]
+
+    return records, 0
+
+
+def _iter_records(
+    view: mmap.mmap, pos: int, names: list[str]
+) -> Iterator[tuple[int, float, bool, dict[str, str]]]:
+    """Decode records, yield end offset with every record."""
+
+    size = len(view)
+    while pos + _LEN.size <= size:
+        (length,) = _LEN.unpack_from(view, pos)
+        end = pos + _LEN.size + length
+        if end > size:
+            # truncated write, ignore tail
+            return
+
+        timestamp, wslink, count = _HEAD.unpack_from(view, pos + _LEN.size)
+        cursor = pos + _LEN.size + _HEAD.size
+        data: dict[str, str] = {}
+        for _ in range(count):
+            field_id = view[cursor]
+            cursor += 1
+            if field_id:
+                name = names[field_id - 1]
+            else:
+                name_len = view[cursor]
+                name = view[cursor + 1 : cursor + 1 + name_len].decode()
+                cursor += 1 + name_len
+            (value_len,) = _VALUE.unpack_from(view, cursor)
+            cursor += _VALUE.size
+            data[name] = view[cursor : cursor + value_len].decode()
+            cursor += value_len
+
+        yield end, timestamp, bool(wslink), data
+        pos = end
+
+
+class UploadArchive:
+    """Append anonymized uploads to rotating segment files."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+        self.hass = hass
+        self.path = Path(hass.config.path(ARCHIVE_DIR))
+        self._buffer = bytearray()
+        self._flush_task: asyncio.Task | None = None
+        self._segment: Path | None = None
+        self.records = 0
+
+    def add(
+        self, data: Mapping[str, Any], wslink: bool, timestamp: float | None = None
+    ) -> None:
+        """Queue upload for writing."""
+
+        self._buffer += encode_record(
+            time.time() if timestamp is None else timestamp, wslink, data
+        )
+        self.records += 1
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self.hass.async_create_background_task(
+                self._async_flush(), "sws12500 archive flush"
+            )
+
+    async def _async_flush(self) -> None:
+        """Write queued records in order."""
+
+        while self._buffer:
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+            try:
+                await self.hass.async_add_executor_job(self._write, chunk)
+            except OSError as ex:
+                _LOGGER.error("Unable to write upload archive: %s", ex)
+                return
+
+    def _write(self, chunk: bytes) -> None:
+        """Append chunk to current segment, rotate when full."""
+
+        if (
+            self._segment is None
+            or not self._segment.exists()
+            or self._segment.stat().st_size >= ARCHIVE_SEGMENT_SIZE
+        ):
+            self._segment = self._new_segment()
+
+        with self._segment.open("ab") as file:
+            file.write(chunk)
+
+    def _new_segment(self) -> Path:
+        """Create new segment and remove the oldest ones."""
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        segment = self.path / f"segment-{time.time_ns()}{SUFFIX}"
+        segment.write_bytes(segment_header())
+
+        for old in self.segments()[:-ARCHIVE_MAX_SEGMENTS]:
+            old.unlink(missing_ok=True)
+
+        return segment
+
+    def segments(self) -> list[Path]:
+        """Return segment files, oldest first."""
+
+        if not self.path.exists():
+            return []
+        return sorted(self.path.glob(f"*{SUFFIX}"))
+
+    async def async_close(self) -> None:
+        """Wait for pending writes."""
+
+        if self._flush_task is not None:
+            await self._flush_task
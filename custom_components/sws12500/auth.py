@@ -0,0 +1,138 @@
+"""Credential check of incoming uploads."""
+
+import hmac
+import logging
+import time
+
+from .const import (
+    AUTH_FAILURE_WINDOW,
+    AUTH_LOCKOUT,
+    AUTH_LOG_INTERVAL,
+    AUTH_MAX_FAILURES,
+    AUTH_MAX_SOURCES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CredentialGuard:
+    """Compare station credentials and lock out repeatedly failing sources.
+
+    Credentials are encoded once at setup, options changes reload the
+    entry, so cached values never go stale.
+    """
+
+    def __init__(self, api_id: str | None, api_key: str | None) -> None:
+        """Init."""
+        self._id = (api_id or "").encode()
+        self._key = (api_key or "").encode()
+        self._configured = bool(api_id and api_key)
+
+        # source -> (failures, first failure time, locked until)
+        self._failures: dict[str, tuple[int, float, float]] = {}
+        self._last_log = 0.0
+        self._suppressed = 0
+
+        self.accepted = 0
+        self.rejected = 0
+        self.locked_out = 0
+
+    def is_locked(self, source: str) -> bool:
+        """Return True if source is locked out, cheap check before parsing."""
+
+        if (state := self._failures.get(source)) is None:
+            return False
+        if state[2] > time.monotonic():
+            self.locked_out += 1
+            return True
+        if state[2]:
+            # lockout expired, start counting again
+            del self._failures[source]
+        return False
+
+    def check(self, source: str, api_id: str, api_key: str) -> bool:
+        """Return True if credentials match."""
+
+        # compare both values every time, so timing does not tell which one failed
+        id_ok = hmac.compare_digest(api_id.encode(), self._id)
+        key_ok = hmac.compare_digest(api_key.encode(), self._key)
+
+        if id_ok and key_ok and self._configured:
+            self.accepted += 1
+            self._failures.pop(source, None)
+            return True
+
+        self.rejected += 1
+        self._failed(source, "Unauthorised access from %s")
+        return False
+
+    def missing(self, source: str) -> None:
+        """Count upload without credentials as failure of source."""
+
+        self.rejected += 1
+        self._failed(source, "Invalid request from %s. No security data provided!")
+
+    def _failed(self, source: str, msg: str) -> None:
+        """Count failure of source, lock it out after too many."""
+
+        now = time.monotonic()
+        if source not in self._failures and len(self._failures) >= AUTH_MAX_SOURCES:
+            self._prune(now)
+
+        failures, first, _ = self._failures.get(source, (0, now, 0.0))
+        if now - first > AUTH_FAILURE_WINDOW:
+            failures, first = 0, now
+        failures += 1
+
+        locked_until = now + AUTH_LOCKOUT if failures >= AUTH_MAX_FAILURES else 0.0
+        self._failures[source] = (failures, first, locked_until)
+
+        if locked_until:
+            self.log(f"{msg}, locked out for %s s", source, AUTH_LOCKOUT)
+        else:
+            self.log(msg, source)
+
+    def _prune(self, now: float) -> None:
+        """Forget sources with expired failures and lockouts.
+
+        If too many sources are still tracked, the oldest failures are
+        forgotten first and lockouts last, down to three quarters of the
+        limit, so a flood of new addresses can not grow the dict.
+        """
+
+        active = [
+            (source, state)
+            for source, state in self._failures.items()
+            if state[2] > now or now - state[1] <= AUTH_FAILURE_WINDOW
+        ]
+        if len(active) >= AUTH_MAX_SOURCES:
+            active.sort(key=lambda item: (item[1][2] > now, item[1][1]))
+            del active[: len(active) - AUTH_MAX_SOURCES * 3 // 4]
+        self._failures = dict(active)
+
+    def log(self, msg: str, *args: object) -> None:
+        """Log error at most once per interval."""
+
+        now = time.monotonic()
+        if now - self._last_log < AUTH_LOG_INTERVAL:
+            self._suppressed += 1
+            return
+
+        if self._suppressed:
+            msg += " (%s similar messages suppressed)"
+            args = (*args, self._suppressed)
+        _LOGGER.error(msg, *args)
+        self._last_log = now
+        self._suppressed = 0
+
+    def diagnostics(self) -> dict[str, int]:
+        """Return counters."""
+
+        return {
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "locked_out": self.locked_out,
+            "locked_sources": sum(
+                1 for _, _, until in self._failures.values() if until > time.monotonic()
+            ),
+        }
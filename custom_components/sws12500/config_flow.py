@@ -1,26 +1,33 @@
 """Config flow for Sencor SWS 12500 Weather Station integration."""
 
-from typing import Any
+from typing import Any, ClassVar
 
 import voluptuous as vol
-
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 
+from .admission import parse_sources
 from .const import (
+    ALLOWED_SOURCES,
     API_ID,
     API_KEY,
+    ARCHIVE_ENABLED,
     DEV_DBG,
     DOMAIN,
     INVALID_CREDENTIALS,
+    LISTENER_DEFAULT_PORT,
+    LISTENER_ENABLED,
+    LISTENER_PORT,
     POCASI_CZ_API_ID,
     POCASI_CZ_API_KEY,
     POCASI_CZ_ENABLED,
     POCASI_CZ_LOGGER_ENABLED,
     POCASI_CZ_SEND_INTERVAL,
     POCASI_CZ_SEND_MINIMUM,
+    REALTIME_ENABLED,
     SENSORS_TO_LOAD,
+    STATISTICS_ENABLED,
     WINDY_ENABLED,
     WINDY_LOGGER_ENABLED,
     WINDY_STATION_ID,
@@ -52,6 +59,8 @@ class ConfigOptionsFlowHandler(OptionsFlow):
         self.migrate_schema = {}
         self.pocasi_cz: dict[str, Any] = {}
         self.pocasi_cz_schema = {}
+        self.advanced: dict[str, Any] = {}
+        self.advanced_schema = {}
 
         @property
         def config_entry(self):
@@ -138,10 +147,44 @@ class ConfigOptionsFlowHandler(OptionsFlow):
             ): bool,
         }
 
+        self.advanced = {
+            ARCHIVE_ENABLED: self.config_entry.options.get(ARCHIVE_ENABLED, False),
+            ALLOWED_SOURCES: self.config_entry.options.get(ALLOWED_SOURCES, ""),
+            LISTENER_ENABLED: self.config_entry.options.get(LISTENER_ENABLED, False),
+            LISTENER_PORT: self.config_entry.options.get(
+                LISTENER_PORT, LISTENER_DEFAULT_PORT
+            ),
+            REALTIME_ENABLED: self.config_entry.options.get(REALTIME_ENABLED, False),
+            STATISTICS_ENABLED: self.config_entry.options.get(
+                STATISTICS_ENABLED, False
+            ),
+        }
+
+        self.advanced_schema = {
+            vol.Optional(
+                ARCHIVE_ENABLED, default=self.advanced.get(ARCHIVE_ENABLED)
+            ): bool,
+            vol.Optional(
+                ALLOWED_SOURCES, default=self.advanced.get(ALLOWED_SOURCES)
+            ): str,
+            vol.Optional(
+                LISTENER_ENABLED, default=self.advanced.get(LISTENER_ENABLED)
+            ): bool,
+            vol.Optional(
+                LISTENER_PORT, default=self.advanced.get(LISTENER_PORT)
+            ): vol.All(int, vol.Range(min=1, max=65535)),
+            vol.Optional(
+                REALTIME_ENABLED, default=self.advanced.get(REALTIME_ENABLED)
+            ): bool,
+            vol.Optional(
+                STATISTICS_ENABLED, default=self.advanced.get(STATISTICS_ENABLED)
+            ): bool,
+        }
+
     async def async_step_init(self, user_input=None):
         """Manage the options - show menu first."""
         return self.async_show_menu(
-            step_id="init", menu_options=["basic", "windy", "pocasi"]
+            step_id="init", menu_options=["basic", "windy", "pocasi", "advanced"]
         )
 
     async def async_step_basic(self, user_input=None):
@@ -163,6 +206,8 @@ class ConfigOptionsFlowHandler(OptionsFlow):
             errors[API_KEY] = "valid_credentials_key"
         elif user_input[API_KEY] == user_input[API_ID]:
             errors["base"] = "valid_credentials_match"
+        elif user_input.get(WSLINK) and self.advanced.get(LISTENER_ENABLED):
+            errors[WSLINK] = "listener_wslink"
         else:
             # retain windy data
             user_input.update(self.windy_data)
@@ -173,6 +218,9 @@ class ConfigOptionsFlowHandler(OptionsFlow):
             # retain pocasi data
             user_input.update(self.pocasi_cz)
 
+            # retain advanced
+            user_input.update(self.advanced)
+
             return self.async_create_entry(title=DOMAIN, data=user_input)
 
         self.user_data = user_input
@@ -197,7 +245,9 @@ class ConfigOptionsFlowHandler(OptionsFlow):
                 errors=errors,
             )
 
-        if (user_input[WINDY_ENABLED] is True) and ((user_input[WINDY_STATION_ID] == "") or (user_input[WINDY_STATION_PW] == "")):
+        if (user_input[WINDY_ENABLED] is True) and (
+            (user_input[WINDY_STATION_ID] == "") or (user_input[WINDY_STATION_PW] == "")
+        ):
             errors[WINDY_STATION_ID] = "windy_key_required"
             return self.async_show_form(
                 step_id="windy",
@@ -215,6 +265,9 @@ class ConfigOptionsFlowHandler(OptionsFlow):
 
         user_input.update(self.pocasi_cz)
 
+        # retain advanced
+        user_input.update(self.advanced)
+
         return self.async_create_entry(title=DOMAIN, data=user_input)
 
     async def async_step_pocasi(self, user_input: Any = None) -> ConfigFlowResult:
@@ -255,13 +308,63 @@ class ConfigOptionsFlowHandler(OptionsFlow):
         # retain windy
         user_input.update(self.windy_data)
 
+        # retain advanced
+        user_input.update(self.advanced)
+
+        return self.async_create_entry(title=DOMAIN, data=user_input)
+
+    async def async_step_advanced(self, user_input: Any = None) -> ConfigFlowResult:
+        """Handle advanced options."""
+
+        errors = {}
+
+        await self._get_entry_data()
+
+        if user_input is None:
+            return self.async_show_form(
+                step_id="advanced",
+                data_schema=vol.Schema(self.advanced_schema),
+                errors=errors,
+            )
+
+        try:
+            parse_sources(user_input.get(ALLOWED_SOURCES))
+        except ValueError:
+            errors[ALLOWED_SOURCES] = "invalid_sources"
+            return self.async_show_form(
+                step_id="advanced",
+                data_schema=vol.Schema(self.advanced_schema),
+                errors=errors,
+            )
+
+        # the listener serves plain HTTP, WSLink stations upload over SSL only
+        if user_input.get(LISTENER_ENABLED) and self.user_data.get(WSLINK):
+            errors[LISTENER_ENABLED] = "listener_wslink"
+            return self.async_show_form(
+                step_id="advanced",
+                data_schema=vol.Schema(self.advanced_schema),
+                errors=errors,
+            )
+
+        # retain user data
+        user_input.update(self.user_data)
+
+        # retain senors
+        user_input.update(self.sensors)
+
+        # retain windy
+        user_input.update(self.windy_data)
+
+        # retain pocasi cz
+        user_input.update(self.pocasi_cz)
+
         return self.async_create_entry(title=DOMAIN, data=user_input)
 
 
 class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Sencor SWS 12500 Weather Station."""
 
-    data_schema = {
+    data_schema: ClassVar[dict[vol.Marker, type]] = {
         vol.Required(API_ID): str,
         vol.Required(API_KEY): str,
         vol.Optional(WSLINK): bool,
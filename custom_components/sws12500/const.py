@@ -6,6 +6,10 @@ from typing import Final
 DOMAIN = "sws12500"
 DEFAULT_URL = "/weatherstation/updateweatherstation.php"
 WSLINK_URL = "/data/upload.php"
+BULK_URL = "/api/sws12500/bulk"
+EXPORT_URL = "/api/sws12500/export"
+WS_SUBSCRIBE = "sws12500/subscribe"
+WS_HISTORY = "sws12500/history"
 WINDY_URL = "https://stations.windy.com/api/v2/observation/update"
 DATABASE_PATH = "/config/home-assistant_v2.db"
 
@@ -17,12 +21,61 @@ ICON = "mdi:weather"
 API_KEY = "API_KEY"
 API_ID = "API_ID"
 
+HISTORY_CAPACITY: Final = 1440  # samples kept in memory per field
+HISTORY_WINDOW: Final = 3600  # default window of history queries
+
+SIGNIFICANT_HEARTBEAT: Final = 900  # write unchanged sensor state at least every 15 min
+
 SENSORS_TO_LOAD: Final = "sensors_to_load"
 SENSOR_TO_MIGRATE: Final = "sensor_to_migrate"
 
 DEV_DBG: Final = "dev_debug_checkbox"
+TRACE_PAYLOAD_EVERY: Final = 10  # attach payload to every n-th upload trace
 WSLINK: Final = "wslink"
 
+ARCHIVE_ENABLED: Final = "archive_enabled_checkbox"
+ARCHIVE_DIR: Final = "sws12500_archive"
+ARCHIVE_SEGMENT_SIZE: Final = 4 * 1024 * 1024  # rotate segment files at 4 MiB
+ARCHIVE_MAX_SEGMENTS: Final = 16
+
+STATISTICS_ENABLED: Final = "statistics_enabled_checkbox"
+STATISTICS_DELAY: Final = 10  # seconds after full hour to close the hour
+
+REALTIME_ENABLED: Final = "realtime_enabled_checkbox"
+REALTIME_INTERVAL: Final = 60  # seconds aggregated into one entity update
+
+LISTENER_ENABLED: Final = "listener_enabled_checkbox"
+LISTENER_PORT: Final = "listener_port"
+LISTENER_DEFAULT_PORT: Final = 80
+LISTENER_SHUTDOWN_TIMEOUT: Final = 5
+
+ALLOWED_SOURCES: Final = "allowed_sources"
+ADMISSION_RATE: Final = 1.0  # uploads per second refilled to each source
+ADMISSION_BURST: Final = 10.0
+ADMISSION_MAX_SOURCES: Final = 1024  # tracked sources before pruning
+
+AUTH_MAX_FAILURES: Final = 5  # failed uploads before the source is locked out
+AUTH_FAILURE_WINDOW: Final = 600  # failures older than this are forgotten
+AUTH_LOCKOUT: Final = 900  # seconds
+AUTH_LOG_INTERVAL: Final = 60  # log rejected uploads at most once a minute
+AUTH_MAX_SOURCES: Final = 1024  # tracked failing sources before pruning
+
+BULK_MAX_UPLOADS: Final = 5000  # uploads accepted in one batch
+BULK_MAX_BYTES: Final = 16 * 1024 * 1024  # decompressed batch size limit
+BULK_MAX_SKEW: Final = 300  # seconds a batch timestamp may be ahead of HA clock
+
+SERVICE_REPLAY: Final = "replay"
+SERVICE_EXPORT: Final = "export"
+EXPORT_DIR: Final = "sws12500_export"
+EXPORT_CHUNK: Final = 5000  # database rows per chunk
+EXPORT_CSV: Final = "csv"
+EXPORT_JSONL: Final = "jsonl"
+SERVICE_IMPORT: Final = "import_statistics"
+IMPORT_BATCH_HOURS: Final = 1000  # hours of statistics inserted at once
+IMPORT_TIME_COLUMNS: Final = ("dateutc", "time", "timestamp")
+REPLAY_COORDINATOR: Final = "coordinator"
+REPLAY_WINDY: Final = "windy"
+
 POCASI_CZ_API_KEY = "POCASI_CZ_API_KEY"
 POCASI_CZ_API_ID = "POCASI_CZ_API_ID"
 POCASI_CZ_SEND_INTERVAL = "POCASI_SEND_INTERVAL"
@@ -36,6 +89,12 @@ POCASI_CZ_UNEXPECTED: Final = (
     "Pocasti Meteo responded unexpectedly 3 times in row. Resendig is now disabled!"
 )
 
+FORWARDER_CONNECTION_LIMIT: Final = 2
+FORWARDER_DNS_TTL: Final = 3600  # seconds to cache resolved forwarder hosts
+FORWARDER_REQUEST_TIMEOUT: Final = 30
+
+WINDY_INTERVAL: Final = 300  # Windy accepts observations every 5 minutes
+
 WINDY_STATION_ID = "WINDY_STATION_ID"
 WINDY_STATION_PW = "WINDY_STATION_PWD"
 WINDY_ENABLED: Final = "windy_enabled_checkbox"
@@ -118,6 +177,24 @@ CH4_CONNECTION: Final = "ch4_connection"
 HEAT_INDEX: Final = "heat_index"
 CHILL_INDEX: Final = "chill_index"
 WBGT_TEMP: Final = "wbgt_temp"
+SOURCE_STATION: Final = "station"
+SOURCE_COMPUTED: Final = "computed"
+
+WIND_SPEED_AVG: Final = "wind_speed_avg"
+WIND_GUST_MAX: Final = "wind_gust_max"
+PRESSURE_TENDENCY: Final = "pressure_tendency"
+RAIN_RATE: Final = "rain_rate"
+PRECIPITATION_TOTAL: Final = "precipitation_total"
+RAIN_INCREMENT: Final = "rain_increment"  # internal, rain since last upload
+ZAMBRETTI_FORECAST: Final = "zambretti_forecast"
+
+WIND_AVG_WINDOW: Final = 600  # 10 minutes average wind
+GUST_MAX_WINDOW: Final = 3600  # 1 hour max gust
+PRESSURE_TENDENCY_WINDOW: Final = 10800  # 3 hours pressure tendency
+RAIN_RATE_WINDOW: Final = 3600  # rain fallen in the last hour
+FORECAST_MIN_SPAN: Final = 3600  # pressure history needed for forecast
+FORECAST_STEADY: Final = 1.6  # hPa per 3 hours treated as steady pressure
+COUNTER_RESET_TOLERANCE: Final = 0.1  # mm of counter decrease treated as jitter
 
 
 REMAP_ITEMS: dict[str, str] = {
@@ -194,12 +271,76 @@ DISABLED_BY_DEFAULT: Final = [
     WBGT_TEMP,
 ]
 
+# Physical limits of decoded values in canonical units.
+VALID_RANGES: dict[str, tuple[float, float]] = {
+    OUTSIDE_TEMP: (-60, 70),
+    INDOOR_TEMP: (-20, 60),
+    DEW_POINT: (-70, 50),
+    CH2_TEMP: (-60, 70),
+    CH3_TEMP: (-60, 70),
+    CH4_TEMP: (-60, 70),
+    HEAT_INDEX: (-70, 80),
+    CHILL_INDEX: (-90, 70),
+    WBGT_TEMP: (-50, 60),
+    OUTSIDE_HUMIDITY: (0, 100),
+    INDOOR_HUMIDITY: (0, 100),
+    CH2_HUMIDITY: (0, 100),
+    CH3_HUMIDITY: (0, 100),
+    CH4_HUMIDITY: (0, 100),
+    BARO_PRESSURE: (850, 1090),
+    WIND_SPEED: (0, 90),
+    WIND_GUST: (0, 120),
+    WIND_DIR: (0, 360),
+    RAIN: (0, 500),
+    HOURLY_RAIN: (0, 500),
+    DAILY_RAIN: (0, 2000),
+    WEEKLY_RAIN: (0, 5000),
+    MONTHLY_RAIN: (0, 10000),
+    YEARLY_RAIN: (0, 30000),
+    SOLAR_RADIATION: (0, 2000),
+    UV: (0, 20),
+}
+
+# Fields checked for spikes and the smallest deviation considered normal.
+SPIKE_SCALES: dict[str, float] = {
+    OUTSIDE_TEMP: 1.0,
+    INDOOR_TEMP: 1.0,
+    DEW_POINT: 1.0,
+    OUTSIDE_HUMIDITY: 5.0,
+    INDOOR_HUMIDITY: 5.0,
+    BARO_PRESSURE: 1.0,
+}
+SPIKE_WINDOW: Final = 15  # samples in rolling median
+SPIKE_MIN_SAMPLES: Final = 5
+SPIKE_THRESHOLD: Final = 5.0  # deviations from median to reject a sample
+
+# Derived sensors and the decoded field they are computed from.
+DERIVED_SENSORS: dict[str, str] = {
+    WIND_SPEED_AVG: WIND_SPEED,
+    WIND_GUST_MAX: WIND_GUST,
+    PRESSURE_TENDENCY: BARO_PRESSURE,
+    RAIN_RATE: DAILY_RAIN,
+    PRECIPITATION_TOTAL: DAILY_RAIN,
+    ZAMBRETTI_FORECAST: BARO_PRESSURE,
+}
+
 BATTERY_LIST = [
     OUTSIDE_BATTERY,
     INDOOR_BATTERY,
     CH2_BATTERY,
 ]
 
+# Fields without a unit, their states are passed on exactly as sent.
+RAW_FIELDS: Final = frozenset(
+    (
+        *BATTERY_LIST,
+        OUTSIDE_CONNECTION,
+        CH2_CONNECTION,
+        CH3_CONNECTION,
+        CH4_CONNECTION,
+    )
+)
+
 
 class UnitOfDir(StrEnum):
     """Wind direrction azimut."""
@@ -255,3 +396,54 @@ BATTERY_LEVEL: list[UnitOfBat] = [
     UnitOfBat.NORMAL,
     UnitOfBat.UNKNOWN,
 ]
+
+
+class AggregateKind(StrEnum):
+    """How a field is aggregated over a forwarding interval."""
+
+    MEAN = "mean"
+    MAX = "max"
+    VECTOR = "vector"
+    LAST = "last"
+
+
+# Raw query keys aggregated before resending to Windy / Pocasi Meteo.
+# Rain fields are already accumulated by the station, so they are sent as
+# the last received value. Keys not listed here are also sent as last value.
+AGGREGATE_ITEMS: dict[str, AggregateKind] = {
+    # WU protocol
+    "tempf": AggregateKind.MEAN,
+    "dewptf": AggregateKind.MEAN,
+    "humidity": AggregateKind.MEAN,
+    "baromin": AggregateKind.MEAN,
+    "windspeedmph": AggregateKind.MEAN,
+    "windgustmph": AggregateKind.MAX,
+    "winddir": AggregateKind.VECTOR,
+    "solarradiation": AggregateKind.MEAN,
+    "UV": AggregateKind.MAX,
+    # WSLink protocol
+    "t1tem": AggregateKind.MEAN,
+    "t1dew": AggregateKind.MEAN,
+    "t1hum": AggregateKind.MEAN,
+    "rbar": AggregateKind.MEAN,
+    "t1ws": AggregateKind.MEAN,
+    "t1wgust": AggregateKind.MAX,
+    "t1wdir": AggregateKind.VECTOR,
+    "t1solrad": AggregateKind.MEAN,
+    "t1uvi": AggregateKind.MAX,
+}
+
+# Decoded fields aggregated for entities in realtime mode.
+REALTIME_AGGREGATE_ITEMS: dict[str, AggregateKind] = {
+    OUTSIDE_TEMP: AggregateKind.MEAN,
+    DEW_POINT: AggregateKind.MEAN,
+    OUTSIDE_HUMIDITY: AggregateKind.MEAN,
+    BARO_PRESSURE: AggregateKind.MEAN,
+    WIND_SPEED: AggregateKind.MEAN,
+    WIND_GUST: AggregateKind.MAX,
+    WIND_DIR: AggregateKind.VECTOR,
+    SOLAR_RADIATION: AggregateKind.MEAN,
+    UV: AggregateKind.MAX,
+    INDOOR_TEMP: AggregateKind.MEAN,
+    INDOOR_HUMIDITY: AggregateKind.MEAN,
+}
@@ -0,0 +1,106 @@
+"""Tracking of cumulative counters reported by station."""
+
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    COUNTER_RESET_TOLERANCE,
+    DAILY_RAIN,
+    MONTHLY_RAIN,
+    PRECIPITATION_TOTAL,
+    RAIN_INCREMENT,
+    WEEKLY_RAIN,
+    YEARLY_RAIN,
+)
+
+
+class CounterTracker:
+    """Turn a resetting counter into increments and a monotonic total."""
+
+    __slots__ = ("increment", "last", "resets", "total")
+
+    def __init__(self) -> None:
+        """Init."""
+        self.last: float | None = None
+        self.total = 0.0
+        self.increment = 0.0
+        self.resets = 0
+
+    def update(self, value: float) -> float:
+        """Add counter reading, return increment since previous one."""
+
+        last, self.last = self.last, value
+
+        if last is None:
+            self.increment = 0.0
+        elif value >= last:
+            self.increment = value - last
+        elif value > 0 and last - value <= COUNTER_RESET_TOLERANCE:
+            # jitter, do not count it as reset and keep previous reading
+            self.last = last
+            self.increment = 0.0
+        else:
+            # station reset the counter (midnight, rollover, battery swap),
+            # everything counted since then is new. A drop to zero is
+            # always a reset, even from below the jitter tolerance.
+            self.resets += 1
+            self.increment = value
+
+        self.total += self.increment
+        return self.increment
+
+
+class RainCounters:
+    """Track station rain counters.
+
+    Daily, weekly, monthly and yearly rain are reset by the station, so
+    their values jump back to zero. Every counter keeps constant state and
+    the finest one reported in the first upload feeds a monotonic total
+    precipitation series and per-upload increments. The source stays fixed,
+    as counters of different periods can not continue each other's total.
+    """
+
+    COUNTERS: tuple[str, ...] = (DAILY_RAIN, WEEKLY_RAIN, MONTHLY_RAIN, YEARLY_RAIN)
+
+    def __init__(self) -> None:
+        """Init."""
+        self.trackers: dict[str, CounterTracker] = {
+            key: CounterTracker() for key in self.COUNTERS
+        }
+        self.source: str | None = None
+
+    def update(self, data: Mapping[str, Any]) -> dict[str, float]:
+        """Add upload, return total precipitation and increment."""
+
+        result: dict[str, float] = {}
+
+        for key in self.COUNTERS:
+            try:
+                value = float(data[key])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            tracker = self.trackers[key]
+            increment = tracker.update(value)
+
+            if self.source is None:
+                self.source = key
+            if key == self.source:
+                result[RAIN_INCREMENT] = round(increment, 3)
+                result[PRECIPITATION_TOTAL] = round(tracker.total, 3)
+
+        return result
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return counter state."""
+
+        return {
+            key: {
+                "last": tracker.last,
+                "total": round(tracker.total, 3),
+                "resets": tracker.resets,
+                "source": key == self.source,
+            }
+            for key, tracker in self.trackers.items()
+            if tracker.last is not None
+        }
@@ -0,0 +1,60 @@
+"""Derived metrics computed from decoded uploads."""
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from .const import (
+    CHILL_INDEX,
+    HEAT_INDEX,
+    OUTSIDE_HUMIDITY,
+    OUTSIDE_TEMP,
+    SOURCE_COMPUTED,
+    SOURCE_STATION,
+    WIND_SPEED,
+)
+from .utils import chill_index, heat_index
+
+# derived key: (function, inputs)
+DERIVED_METRICS: dict[str, tuple[Callable[[Any], float | None], tuple[str, ...]]] = {
+    HEAT_INDEX: (heat_index, (OUTSIDE_TEMP, OUTSIDE_HUMIDITY)),
+    CHILL_INDEX: (chill_index, (OUTSIDE_TEMP, WIND_SPEED)),
+}
+
+
+class DerivedMetrics:
+    """Heat index and wind chill, taken from station or computed locally.
+
+    Station values are preferred. When station does not send them (WU
+    protocol, some WSLink firmwares), they are computed once per upload
+    from canonical temperature, humidity and wind speed. Results are
+    cached by their inputs, so unchanged inputs are not recomputed.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+        self.sources: dict[str, str] = {}
+        self._cache: dict[str, tuple[tuple[Any, ...], float | None]] = {}
+
+    def update(self, data: Mapping[str, Any]) -> dict[str, float]:
+        """Return computed metrics missing in upload."""
+
+        computed: dict[str, float] = {}
+
+        for key, (func, inputs) in DERIVED_METRICS.items():
+            if data.get(key) is not None:
+                self.sources[key] = SOURCE_STATION
+                continue
+
+            values = tuple(data.get(item) for item in inputs)
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == values:
+                value = cached[1]
+            else:
+                value = func(data)
+                self._cache[key] = (values, value)
+
+            if value is not None:
+                computed[key] = value
+                self.sources[key] = SOURCE_COMPUTED
+
+        return computed
@@ -0,0 +1,66 @@
+"""Diagnostics support for SWS12500."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import WeatherDataUpdateCoordinator
+from .const import (
+    API_ID,
+    API_KEY,
+    DOMAIN,
+    POCASI_CZ_API_ID,
+    POCASI_CZ_API_KEY,
+    WINDY_STATION_ID,
+    WINDY_STATION_PW,
+)
+
+TO_REDACT = {
+    API_ID,
+    API_KEY,
+    POCASI_CZ_API_ID,
+    POCASI_CZ_API_KEY,
+    WINDY_STATION_ID,
+    WINDY_STATION_PW,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    coordinator: WeatherDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "options": async_redact_data(dict(entry.options), TO_REDACT),
+        "forwarders": {
+            "windy": {
+                "connection": coordinator.windy.client.diagnostics(),
+                "aggregate": coordinator.windy.aggregator.diagnostics(),
+            },
+            "pocasi": {
+                "connection": coordinator.pocasi.client.diagnostics(),
+                "aggregate": coordinator.pocasi.aggregator.diagnostics(),
+            },
+        },
+        "admission": coordinator.admission.diagnostics(),
+        "auth": coordinator.guard.diagnostics(),
+        "validation": coordinator.validator.diagnostics(),
+        "history": coordinator.history.diagnostics(),
+        "live": coordinator.live.diagnostics(),
+        "statistics": (
+            coordinator.longterm.diagnostics()
+            if coordinator.longterm is not None
+            else None
+        ),
+        "realtime": (
+            coordinator.realtime.diagnostics()
+            if coordinator.realtime is not None
+            else None
+        ),
+        "rain_counters": coordinator.counters.diagnostics(),
+        "significance": coordinator.significance.diagnostics(),
+    }
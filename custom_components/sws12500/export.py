@@ -0,0 +1,208 @@
+"""Streaming export of station history from the recorder database."""
+
+import csv
+import io
+import json
+import logging
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+from homeassistant.components.recorder.db_schema import States, StatesMeta
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from sqlalchemy import and_, or_, select
+
+from .const import DOMAIN, EXPORT_CHUNK, EXPORT_CSV
+
+_LOGGER = logging.getLogger(__name__)
+
+SKIPPED_STATES = ("unknown", "unavailable", "", None)
+
+
+def resolve_fields(hass: HomeAssistant, fields: Iterable[str] | None) -> dict[str, str]:
+    """Return entity ids of station sensors mapped to their field names."""
+
+    registry = er.async_get(hass)
+    entities: dict[str, str] = {}
+
+    if fields:
+        for field in fields:
+            if entity_id := registry.async_get_entity_id("sensor", DOMAIN, field):
+                entities[entity_id] = field
+        return entities
+
+    for entry in registry.entities.values():
+        if entry.platform == DOMAIN and entry.domain == "sensor":
+            entities[entry.entity_id] = entry.unique_id
+
+    return entities
+
+
+def iter_states(
+    hass: HomeAssistant,
+    entities: dict[str, str],
+    start: float,
+    end: float,
+    chunk: int = EXPORT_CHUNK,
+) -> Iterator[list[tuple[float, str, str]]]:
+    """Yield chunks of (timestamp, field, state) ordered by time.
+
+    Rows are read through the recorder, so any database it is configured
+    with works. Every chunk is one keyset query in its own short session,
+    memory is bounded by the chunk size and the generator may be resumed
+    from different recorder executor threads, but never concurrently.
+    """
+
+    if not entities:
+        return
+
+    with session_scope(hass=hass, read_only=True) as session:
+        fields = {
+            metadata_id: entities[entity_id]
+            for metadata_id, entity_id in session.execute(
+                select(StatesMeta.metadata_id, StatesMeta.entity_id).where(
+                    StatesMeta.entity_id.in_(entities)
+                )
+            )
+        }
+    if not fields:
+        return
+
+    query = (
+        select(
+            States.last_updated_ts,
+            States.state_id,
+            States.metadata_id,
+            States.state,
+        )
+        .where(
+            States.metadata_id.in_(fields),
+            States.last_updated_ts >= start,
+            States.last_updated_ts < end,
+        )
+        .order_by(States.last_updated_ts, States.state_id)
+        .limit(chunk)
+    )
+    after: tuple[float, int] | None = None
+
+    while True:
+        page = query
+        if after is not None:
+            page = query.where(
+                or_(
+                    States.last_updated_ts > after[0],
+                    and_(
+                        States.last_updated_ts == after[0],
+                        States.state_id > after[1],
+                    ),
+                )
+            )
+        with session_scope(hass=hass, read_only=True) as session:
+            rows = session.execute(page).all()
+        if not rows:
+            return
+
+        after = (rows[-1].last_updated_ts, rows[-1].state_id)
+        yield [
+            (timestamp, fields[metadata_id], state)
+            for timestamp, _, metadata_id, state in rows
+            if state not in SKIPPED_STATES
+        ]
+        if len(rows) < chunk:
+            return
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, UTC).isoformat()
+
+
+def _value(state: str) -> float | str:
+    try:
+        return float(state)
+    except ValueError:
+        return state
+
+
+def iter_csv(chunks: Iterable[list[tuple[float, str, str]]]) -> Iterator[bytes]:
+    """Encode chunks as CSV."""
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(("time", "field", "value"))
+
+    for rows in chunks:
+        writer.writerows(
+            (_iso(timestamp), field, state) for timestamp, field, state in rows
+        )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        # no rows in range, send header only
+        yield buffer.getvalue().encode()
+
+
+def iter_jsonl(chunks: Iterable[list[tuple[float, str, str]]]) -> Iterator[bytes]:
+    """Encode chunks as JSON Lines."""
+
+    for rows in chunks:
+        yield "".join(
+            json.dumps(
+                {"time": _iso(timestamp), "field": field, "value": _value(state)}
+            )
+            + "\n"
+            for timestamp, field, state in rows
+        ).encode()
+
+
+def iter_gzip(blocks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress blocks into one gzip stream."""
+
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for block in blocks:
+        if data := compressor.compress(block):
+            yield data
+    yield compressor.flush()
+
+
+def export_name(start: datetime, end: datetime, fmt: str, compress: bool) -> str:
+    """Return file name of export."""
+
+    name = f"sws12500-{start:%Y%m%d%H%M}-{end:%Y%m%d%H%M}.{fmt}"
+    return f"{name}.gz" if compress else name
+
+
+def export_stream(
+    hass: HomeAssistant,
+    entities: dict[str, str],
+    start: float,
+    end: float,
+    fmt: str,
+    compress: bool,
+) -> Iterator[bytes]:
+    """Return generator pipeline producing the encoded export.
+
+    The pipeline reads the database, advance it in the recorder executor.
+    """
+
+    chunks = iter_states(hass, entities, start, end)
+    blocks = iter_csv(chunks) if fmt == EXPORT_CSV else iter_jsonl(chunks)
+    return iter_gzip(blocks) if compress else blocks
+
+
+def write_export(stream: Iterator[bytes], path: Path) -> int:
+    """Write export to file, return size in bytes. Runs in recorder executor."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    size = 0
+    with path.open("wb") as file:
+        for block in stream:
+            file.write(block)
+            size += len(block)
+
+    _LOGGER.info("Exported %s bytes of station history to %s", size, path)
+    return size
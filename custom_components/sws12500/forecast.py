@@ -0,0 +1,113 @@
+"""Zambretti forecast from pressure, its tendency and wind direction."""
+
+import math
+import time
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    BARO_PRESSURE,
+    FORECAST_MIN_SPAN,
+    FORECAST_STEADY,
+    PRESSURE_TENDENCY_WINDOW,
+    WIND_DIR,
+    WIND_SPEED,
+    ZAMBRETTI_FORECAST,
+)
+from .rolling import RollingDelta
+
+# Forecasts A (settled fine) to Z (stormy, much rain), used as state keys.
+FORECASTS: tuple[str, ...] = tuple("abcdefghijklmnopqrstuvwxyz")
+
+BARO_TOP = 1050.0
+BARO_BOTTOM = 950.0
+BARO_RANGE = BARO_TOP - BARO_BOTTOM
+
+# Forecast index per pressure band (low to high), one table per trend.
+RISING = (
+    25, 25, 25, 24, 24, 19, 16, 12, 11, 9, 8, 6, 5, 2, 1, 1, 0, 0, 0, 0, 0, 0,
+)  # fmt: skip
+STEADY = (
+    25, 25, 25, 25, 25, 25, 23, 23, 22, 18, 15, 13, 10, 4, 1, 1, 0, 0, 0, 0, 0, 0,
+)  # fmt: skip
+FALLING = (
+    25, 25, 25, 25, 25, 25, 25, 25, 23, 23, 21, 20, 17, 14, 7, 3, 1, 1, 1, 0, 0, 0,
+)  # fmt: skip
+
+# Pressure correction in percent of range for 16 wind directions from north,
+# northern hemisphere.
+WIND_CORRECTION = (
+    6, 5, 5, 2, -0.5, -2, -5, -8.5, -12, -10, -6, -4.5, -3, -0.5, 1.5, 3,
+)  # fmt: skip
+
+
+def zambretti(
+    pressure: float,
+    tendency: float,
+    wind_dir: float | None,
+    month: int,
+    southern: bool = False,
+) -> str:
+    """Return forecast key for sea level pressure and its 3 hour tendency."""
+
+    if tendency > FORECAST_STEADY:
+        table = RISING
+    elif tendency < -FORECAST_STEADY:
+        table = FALLING
+    else:
+        table = STEADY
+
+    if wind_dir is not None:
+        if southern:
+            wind_dir += 180
+        pressure += WIND_CORRECTION[round(wind_dir / 22.5) % 16] / 100 * BARO_RANGE
+
+    summer = 4 <= month <= 9
+    if summer != southern:
+        if table is RISING:
+            pressure += 7 / 100 * BARO_RANGE
+        elif table is FALLING:
+            pressure -= 7 / 100 * BARO_RANGE
+
+    band = math.floor((pressure - BARO_BOTTOM) / (BARO_RANGE / 22))
+    return FORECASTS[table[min(max(band, 0), 21)]]
+
+
+class PressureForecast:
+    """Forecast updated with every upload.
+
+    The 3 hour tendency comes from the pressure tendency window, so an
+    update is O(1) and needs no history from the database. Until the
+    window spans FORECAST_MIN_SPAN the forecast is not produced and the
+    sensor keeps its restored state.
+    """
+
+    def __init__(self, window: RollingDelta, southern: bool) -> None:
+        """Init."""
+        self.window = window
+        self.southern = southern
+
+    def update(
+        self, data: Mapping[str, Any], timestamp: float | None = None
+    ) -> dict[str, str]:
+        """Return forecast, if pressure history is long enough."""
+
+        pressure = data.get(BARO_PRESSURE)
+        span = self.window.span()
+        if not isinstance(pressure, float) or span < FORECAST_MIN_SPAN:
+            return {}
+
+        delta = self.window.value() or 0.0
+        tendency = delta * PRESSURE_TENDENCY_WINDOW / span
+
+        wind_dir = data.get(WIND_DIR)
+        if not isinstance(wind_dir, float) or not data.get(WIND_SPEED):
+            # calm or no wind vane, no correction
+            wind_dir = None
+
+        month = time.gmtime(timestamp).tm_mon
+        return {
+            ZAMBRETTI_FORECAST: zambretti(
+                pressure, tendency, wind_dir, month, self.southern
+            )
+        }
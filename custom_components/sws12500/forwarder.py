@@ -0,0 +1,227 @@
+"""Shared helpers for forwarding data to external services."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable, Coroutine
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    FORWARDER_CONNECTION_LIMIT,
+    FORWARDER_DNS_TTL,
+    FORWARDER_REQUEST_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ForwarderSession:
+    """Long-lived HTTP session owned by a single forwarder.
+
+    Each forwarder keeps its own connector, so DNS results are cached and
+    connections are kept alive between pushes instead of being shared with
+    (and evicted by) the rest of Home Assistant.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, name: str, keepalive_timeout: float
+    ) -> None:
+        """Init."""
+        self.hass = hass
+        self.name = name
+        self._keepalive_timeout = keepalive_timeout
+        self._session: aiohttp.ClientSession | None = None
+        self._closed = False
+
+        self.started = time.monotonic()
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.tls_handshakes = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+
+    @property
+    def closed(self) -> bool:
+        """Return True once the forwarder was closed."""
+        return self._closed
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return session, create it on first use.
+
+        Raises RuntimeError once the forwarder was closed, so a late send
+        cannot open a session that nobody closes.
+        """
+
+        if self._closed:
+            raise RuntimeError(f"Forwarder session {self.name} is closed")
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create session with tuned connector and connection tracing."""
+
+        connector = aiohttp.TCPConnector(
+            limit=FORWARDER_CONNECTION_LIMIT,
+            limit_per_host=FORWARDER_CONNECTION_LIMIT,
+            use_dns_cache=True,
+            ttl_dns_cache=FORWARDER_DNS_TTL,
+            keepalive_timeout=self._keepalive_timeout,
+            ssl=False,
+        )
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_request_start)
+        trace.on_connection_create_end.append(self._on_connection_create_end)
+        trace.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace.on_dns_cache_miss.append(self._on_dns_cache_miss)
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=FORWARDER_REQUEST_TIMEOUT),
+            trace_configs=[trace],
+        )
+
+    async def _on_request_start(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.requests += 1
+        ctx.secure = params.url.scheme == "https"
+
+    async def _on_connection_create_end(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.connections_created += 1
+        if getattr(ctx, "secure", False):
+            self.tls_handshakes += 1
+
+    async def _on_connection_reuseconn(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.connections_reused += 1
+
+    async def _on_dns_cache_hit(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.dns_cache_misses += 1
+
+    async def async_close(self) -> None:
+        """Close session and release pooled connections."""
+
+        self._closed = True
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return connection statistics."""
+
+        hours = max((time.monotonic() - self.started) / 3600, 1 / 3600)
+
+        return {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "tls_handshakes": self.tls_handshakes,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+            "connections_reused_per_hour": round(self.connections_reused / hours, 2),
+            "tls_handshakes_per_hour": round(self.tls_handshakes / hours, 2),
+        }
+
+
+class ForwarderScheduler:
+    """Decide when a forwarder may send, based on monotonic loop time.
+
+    Deadlines are plain floats from `loop.time()`, so wall-clock jumps (NTP,
+    DST) neither stall nor burst forwarding. When an upload arrives before
+    the deadline it is kept as pending and a timer sends it once the
+    deadline passes, so sends follow the interval rather than the station.
+    Once cancelled, nothing is scheduled or sent any more.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        interval: float,
+        initial_delay: float,
+        send: Callable[[], Coroutine[Any, Any, Any]],
+    ) -> None:
+        """Init."""
+        self.hass = hass
+        self.interval = interval
+        self._loop = hass.loop
+        self._send = send
+        self._timer: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task | None = None
+
+        self.deadline = self._loop.time() + initial_delay
+        self.pending = False
+        self.cancelled = False
+
+    def due(self) -> bool:
+        """Return True if we are allowed to send now."""
+        return not self.cancelled and self._loop.time() >= self.deadline
+
+    def remaining(self) -> float:
+        """Return seconds left until next send is allowed."""
+        return max(self.deadline - self._loop.time(), 0.0)
+
+    def defer(self) -> None:
+        """Keep data as pending and send it when deadline passes."""
+
+        if self.cancelled:
+            return
+        self.pending = True
+        if self._timer is None:
+            self._timer = self._loop.call_at(self.deadline, self._fire)
+
+    def sent(self) -> None:
+        """Move deadline by one interval after a send attempt."""
+
+        self.pending = False
+        self.deadline = self._loop.time() + self.interval
+
+    @callback
+    def _fire(self) -> None:
+        """Send pending data on timer."""
+
+        self._timer = None
+        if self.pending and not self.cancelled:
+            self._task = self.hass.async_create_background_task(
+                self._send(), "sws12500 forwarder scheduled send"
+            )
+            self._task.add_done_callback(self._task_done)
+
+    @callback
+    def _task_done(self, task: asyncio.Task) -> None:
+        if self._task is task:
+            self._task = None
+
+    async def async_cancel(self) -> None:
+        """Cancel scheduled send and wait for a running one to stop."""
+
+        self.cancelled = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self.pending = False
+
+        if (task := self._task) is not None:
+            self._task = None
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
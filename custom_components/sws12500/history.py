@@ -0,0 +1,181 @@
+"""In-memory history of recent observations."""
+
+import time
+from array import array
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class WindowStats:
+    """Statistics over a time window."""
+
+    count: int
+    mean: float
+    min: float
+    max: float
+
+
+class SeriesBuffer:
+    """Fixed capacity ring buffer of (timestamp, value) samples.
+
+    Samples are stored in two preallocated `array('d')`, so appending does
+    not allocate and memory use is `16 * capacity` bytes.
+    """
+
+    __slots__ = ("_capacity", "_head", "_size", "_times", "_values")
+
+    def __init__(self, capacity: int) -> None:
+        """Init."""
+        self._capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return number of stored samples."""
+        return self._size
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add sample, overwrite the oldest one when full."""
+
+        self._times[self._head] = timestamp
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+
+    def _newest_first(self) -> Iterator[tuple[float, float]]:
+        """Iterate samples from the newest one."""
+
+        idx = self._head
+        for _ in range(self._size):
+            idx = (idx - 1) % self._capacity
+            yield self._times[idx], self._values[idx]
+
+    def latest(self) -> tuple[float, float] | None:
+        """Return newest sample."""
+
+        if not self._size:
+            return None
+        idx = (self._head - 1) % self._capacity
+        return self._times[idx], self._values[idx]
+
+    def last(self, n: int) -> list[tuple[float, float]]:
+        """Return last `n` samples, oldest first."""
+
+        samples = []
+        for sample in self._newest_first():
+            if len(samples) >= n:
+                break
+            samples.append(sample)
+        samples.reverse()
+        return samples
+
+    def window(self, seconds: float, now: float | None = None) -> list[float]:
+        """Return values not older than `seconds`, oldest first."""
+
+        since = (now if now is not None else time.time()) - seconds
+        values = []
+        for timestamp, value in self._newest_first():
+            if timestamp < since:
+                break
+            values.append(value)
+        values.reverse()
+        return values
+
+    def stats(self, seconds: float, now: float | None = None) -> WindowStats | None:
+        """Return statistics of values not older than `seconds`."""
+
+        since = (now if now is not None else time.time()) - seconds
+        count = 0
+        total = 0.0
+        low = high = 0.0
+        for timestamp, value in self._newest_first():
+            if timestamp < since:
+                break
+            if not count:
+                low = high = value
+            else:
+                low = min(low, value)
+                high = max(high, value)
+            count += 1
+            total += value
+
+        if not count:
+            return None
+        return WindowStats(count, total / count, low, high)
+
+    def rate(self, seconds: float, now: float | None = None) -> float | None:
+        """Return rate of change per hour over the window."""
+
+        since = (now if now is not None else time.time()) - seconds
+        newest = oldest = None
+        for sample in self._newest_first():
+            if sample[0] < since:
+                break
+            if newest is None:
+                newest = sample
+            oldest = sample
+
+        if newest is None or oldest is None or newest[0] == oldest[0]:
+            return None
+        return (newest[1] - oldest[1]) / (newest[0] - oldest[0]) * 3600
+
+
+class ObservationHistory:
+    """Ring buffers of recent values for every decoded numeric field."""
+
+    def __init__(self, capacity: int) -> None:
+        """Init."""
+        self.capacity = capacity
+        self.series: dict[str, SeriesBuffer] = {}
+
+    def add(self, data: Mapping[str, Any], timestamp: float | None = None) -> None:
+        """Add decoded upload."""
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        for key, value in data.items():
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                continue
+
+            if (series := self.series.get(key)) is None:
+                series = self.series[key] = SeriesBuffer(self.capacity)
+            series.append(timestamp, number)
+
+    def get(self, key: str) -> SeriesBuffer | None:
+        """Return buffer for field."""
+        return self.series.get(key)
+
+    def last(self, key: str, n: int) -> list[tuple[float, float]]:
+        """Return last `n` samples of field."""
+
+        series = self.series.get(key)
+        return series.last(n) if series else []
+
+    def stats(self, key: str, seconds: float) -> WindowStats | None:
+        """Return window statistics of field."""
+
+        series = self.series.get(key)
+        return series.stats(seconds) if series else None
+
+    def rate(self, key: str, seconds: float) -> float | None:
+        """Return rate of change per hour of field."""
+
+        series = self.series.get(key)
+        return series.rate(seconds) if series else None
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return buffer fill levels."""
+
+        return {
+            "capacity": self.capacity,
+            "memory_bytes": 16 * self.capacity * len(self.series),
+            "fields": {key: len(series) for key, series in self.series.items()},
+        }
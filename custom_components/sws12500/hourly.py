@@ -0,0 +1,128 @@
+"""Hourly statistics of decoded fields."""
+
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.components.sensor import SensorStateClass
+
+from .aggregate import FieldAggregate
+from .counters import CounterTracker
+from .sensors_common import WeatherSensorEntityDescription
+
+HOUR = 3600
+
+# TOTAL fields of the station (PWS `rain`) are rolling amounts that go up
+# and down, only TOTAL_INCREASING fields are counters worth a sum.
+MEAN_CLASSES = (
+    SensorStateClass.MEASUREMENT,
+    SensorStateClass.MEASUREMENT_ANGLE,
+    SensorStateClass.TOTAL,
+)
+SUM_CLASSES = (SensorStateClass.TOTAL_INCREASING,)
+
+
+class HourlyStatistics:
+    """Aggregate decoded uploads into hourly mean/min/max or state/sum.
+
+    Samples must come in time order. Every field keeps one running
+    aggregate for the open hour, so each sample costs O(1) per field.
+    Sums are growth of the field since the first sample, counter resets
+    are detected like for rain counters.
+    """
+
+    def __init__(
+        self, descriptions: Mapping[str, WeatherSensorEntityDescription]
+    ) -> None:
+        """Init."""
+        self.angles: set[str] = set()
+        self.means: set[str] = set()
+        self.sums: dict[str, CounterTracker] = {}
+
+        for key, description in descriptions.items():
+            if description.state_class in MEAN_CLASSES:
+                self.means.add(key)
+                if description.state_class is SensorStateClass.MEASUREMENT_ANGLE:
+                    self.angles.add(key)
+            elif description.state_class in SUM_CLASSES:
+                self.sums[key] = CounterTracker()
+
+        self.hour: float | None = None
+        self.fields: dict[str, FieldAggregate] = {}
+        self.samples = 0
+        self.late = 0
+
+    def add(
+        self, timestamp: float, data: Mapping[str, Any]
+    ) -> tuple[float, dict[str, dict[str, float]]] | None:
+        """Add sample, return statistics of previous hour once it is complete."""
+
+        hour = timestamp - timestamp % HOUR
+        completed = None
+
+        if self.hour is None:
+            self.hour = hour
+        elif hour > self.hour:
+            completed = self.close()
+            self.hour = hour
+        elif hour < self.hour:
+            # the hour is already closed
+            self.late += 1
+            return None
+
+        self.samples += 1
+        for key, value in data.items():
+            if key not in self.means and key not in self.sums:
+                continue
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                continue
+
+            if (field := self.fields.get(key)) is None:
+                field = self.fields[key] = FieldAggregate()
+
+            if key in self.angles:
+                field.add_direction(number)
+            else:
+                field.add(number)
+                if (tracker := self.sums.get(key)) is not None:
+                    tracker.update(number)
+
+        return completed
+
+    def close(self) -> tuple[float, dict[str, dict[str, float]]] | None:
+        """Return statistics of the open hour and start a new one."""
+
+        if self.hour is None or not self.fields:
+            return None
+
+        statistics: dict[str, dict[str, float]] = {}
+        for key, field in self.fields.items():
+            if (tracker := self.sums.get(key)) is not None:
+                statistics[key] = {
+                    "state": field.last,
+                    "sum": round(tracker.total, 3),
+                }
+            elif key in self.angles:
+                # min and max of an angle have no meaning
+                statistics[key] = {"mean": round(field.direction(), 2) % 360}
+            else:
+                statistics[key] = {
+                    "mean": round(field.mean, 2),
+                    "min": field.min,
+                    "max": field.max,
+                }
+
+        hour = self.hour
+        self.fields = {}
+        return hour, statistics
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return state of the open hour."""
+
+        return {
+            "hour": self.hour,
+            "samples": self.samples,
+            "late": self.late,
+            "fields": len(self.fields),
+        }
@@ -0,0 +1,282 @@
+"""Import of historical station data into long-term statistics."""
+
+import csv
+import gzip
+import json
+import logging
+from collections.abc import Callable, Iterator, Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    get_last_statistics,
+    statistics_during_period,
+)
+from homeassistant.components.sensor import UNIT_CONVERTERS, SensorStateClass
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, IMPORT_BATCH_HOURS, IMPORT_TIME_COLUMNS
+from .counters import RainCounters
+from .hourly import HourlyStatistics
+from .longterm import statistic_metadata
+from .normalize import normalize
+from .sensors_common import WeatherSensorEntityDescription
+from .utils import remap_items
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_time(value: Any) -> float | None:
+    """Return timestamp of epoch seconds or ISO datetime, naive is UTC."""
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        moment = datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.timestamp()
+
+
+def iter_rows(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield rows of CSV or JSON Lines file, optionally gzip compressed."""
+
+    name = path.name.removesuffix(".gz")
+    opener = gzip.open if path.name.endswith(".gz") else open
+
+    with opener(path, "rt", encoding="utf-8", newline="") as file:
+        if name.endswith(".csv"):
+            yield from csv.DictReader(file)
+            return
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_hours(
+    path: Path, descriptions: Mapping[str, WeatherSensorEntityDescription]
+) -> Iterator[list[tuple[float, dict[str, dict[str, float]]]]]:
+    """Yield batches of hourly statistics computed from rows of file.
+
+    Rows are remapped and normalized like live PWS uploads, so WU query
+    keys in imperial units become canonical fields in metric units.
+    """
+
+    hourly = HourlyStatistics(descriptions)
+    counters = RainCounters()
+    batch: list[tuple[float, dict[str, dict[str, float]]]] = []
+    rows = skipped = 0
+
+    for row in iter_rows(path):
+        timestamp = next(
+            (
+                parsed
+                for column in IMPORT_TIME_COLUMNS
+                if column in row and (parsed := parse_time(row[column])) is not None
+            ),
+            None,
+        )
+        if timestamp is None:
+            skipped += 1
+            continue
+
+        items = normalize(remap_items(row), False)
+        items.update(counters.update(items))
+        rows += 1
+
+        if completed := hourly.add(timestamp, items):
+            batch.append(completed)
+            if len(batch) >= IMPORT_BATCH_HOURS:
+                yield batch
+                batch = []
+
+    if completed := hourly.close():
+        batch.append(completed)
+    if batch:
+        yield batch
+
+    _LOGGER.info(
+        "Read %s rows from %s, skipped %s rows without time, %s rows out of order",
+        rows,
+        path.name,
+        skipped,
+        hourly.late,
+    )
+
+
+def last_sum(
+    hass: HomeAssistant, statistic_id: str, after: float | None, before: float
+) -> float | None:
+    """Return sum of last hourly statistic starting in [after, before)."""
+
+    if after is None:
+        # mostly the newest statistic, otherwise look through all before
+        newest = get_last_statistics(hass, 1, statistic_id, False, {"sum"})
+        if (rows := newest.get(statistic_id)) and rows[0]["start"] < before:
+            return rows[0].get("sum")
+        after = 0.0
+
+    rows = statistics_during_period(
+        hass,
+        datetime.fromtimestamp(after, UTC),
+        datetime.fromtimestamp(before, UTC),
+        {statistic_id},
+        "hour",
+        None,
+        {"sum"},
+    ).get(statistic_id)
+    return rows[-1].get("sum") if rows else None
+
+
+def entity_unit(hass: HomeAssistant, entry: er.RegistryEntry) -> str | None:
+    """Return unit the recorder compiles statistics of entity in."""
+
+    if (state := hass.states.get(entry.entity_id)) is not None and (
+        unit := state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    ):
+        return unit
+    if unit := entry.options.get("sensor", {}).get("unit_of_measurement"):
+        return unit
+    return entry.unit_of_measurement
+
+
+def unit_conversion(
+    description: WeatherSensorEntityDescription, unit: str | None
+) -> Callable[[float], float] | None:
+    """Return conversion from native unit of description to unit.
+
+    Raises ValueError if the units are not convertible.
+    """
+
+    native = description.native_unit_of_measurement
+    if unit == native:
+        return None
+
+    converter = UNIT_CONVERTERS.get(description.device_class)  # type: ignore[arg-type]
+    if (
+        converter is None
+        or native not in converter.VALID_UNITS
+        or unit not in converter.VALID_UNITS
+    ):
+        raise ValueError(f"Can not convert {native} to {unit}")
+    return converter.converter_factory(native, unit)
+
+
+async def async_import_file(
+    hass: HomeAssistant,
+    path: Path,
+    descriptions: Mapping[str, WeatherSensorEntityDescription],
+) -> dict[str, Any]:
+    """Import file into statistics of station sensors.
+
+    Values are converted to the unit the entity reports, which is the unit
+    of its recorder statistics. Imported sums continue from the last
+    statistic before the file, and statistics after the file are shifted
+    by the rain it adds, so the sum series stays continuous around the
+    imported range.
+    """
+
+    registry = er.async_get(hass)
+    metadata: dict[str, StatisticMetaData] = {}
+    conversions: dict[str, Callable[[float], float]] = {}
+    for key, description in descriptions.items():
+        # the recorder sums TOTAL sensors, but rolling rain amounts have no sum
+        if description.state_class in (None, SensorStateClass.TOTAL):
+            continue
+        if not (entity_id := registry.async_get_entity_id("sensor", DOMAIN, key)):
+            continue
+
+        unit = entity_unit(hass, registry.entities[entity_id])
+        unit = unit or description.native_unit_of_measurement
+        try:
+            if convert := unit_conversion(description, unit):
+                conversions[key] = convert
+        except ValueError as ex:
+            _LOGGER.warning("Not importing %s: %s", entity_id, ex)
+            continue
+        metadata[key] = statistic_metadata(description, entity_id, "recorder", unit)
+
+    batches = iter_hours(path, {key: descriptions[key] for key in metadata})
+    recorder = get_instance(hass)
+    hours = 0
+    # per sum statistic: offset of imported sums, last sum of the import,
+    # replaced sum at its end, and end of the imported range
+    offset: dict[str, float] = {}
+    imported: dict[str, float] = {}
+    replaced: dict[str, float] = {}
+    until: dict[str, float] = {}
+
+    async def _async_continue_sums(key: str, data: list[StatisticData]) -> None:
+        """Offset sums of key, remember sum of the statistics they replace."""
+
+        statistic_id = metadata[key]["statistic_id"]
+        first = data[0]["start"].timestamp()
+        if key not in offset:
+            base = await recorder.async_add_executor_job(
+                last_sum, hass, statistic_id, None, first
+            )
+            offset[key] = replaced[key] = base or 0.0
+            until[key] = first
+
+        end = data[-1]["start"].timestamp() + 3600
+        # rows before until[key] were replaced by earlier batches already
+        existing = await recorder.async_add_executor_job(
+            last_sum, hass, statistic_id, until[key], end
+        )
+        if existing is not None:
+            replaced[key] = existing
+        until[key] = end
+
+        for values in data:
+            values["sum"] = round(values["sum"] + offset[key], 3)
+        imported[key] = data[-1]["sum"]
+
+    try:
+        while (
+            batch := await hass.async_add_executor_job(next, batches, None)
+        ) is not None:
+            series: dict[str, list[StatisticData]] = {}
+            for hour, statistics in batch:
+                start = datetime.fromtimestamp(hour, UTC)
+                for key, values in statistics.items():
+                    if (convert := conversions.get(key)) is not None:
+                        values = {
+                            name: round(convert(value), 3)
+                            for name, value in values.items()
+                        }
+                    series.setdefault(key, []).append(
+                        StatisticData(start=start, **values)  # type: ignore[typeddict-item]
+                    )
+
+            for key, data in series.items():
+                if "sum" in data[0]:
+                    await _async_continue_sums(key, data)
+                async_import_statistics(hass, metadata[key], data)
+            hours += len(batch)
+    finally:
+        await hass.async_add_executor_job(batches.close)
+
+    for key, end in until.items():
+        if shift := round(imported[key] - replaced[key], 3):
+            recorder.async_adjust_statistics(
+                metadata[key]["statistic_id"],
+                datetime.fromtimestamp(end, UTC),
+                shift,
+                metadata[key]["unit_of_measurement"] or "",
+            )
+
+    return {
+        "hours": hours,
+        "statistics": sorted(meta["statistic_id"] for meta in metadata.values()),
+    }
@@ -0,0 +1,69 @@
+"""Dedicated HTTP listener for station uploads."""
+
+import logging
+from collections.abc import Awaitable, Callable
+
+from aiohttp import web
+from homeassistant.core import HomeAssistant
+
+from .const import DEFAULT_URL, LISTENER_SHUTDOWN_TIMEOUT, WSLINK_URL
+from .routes import unregistred
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StationListener:
+    """Minimal aiohttp site serving only the upload endpoints.
+
+    The station firmware can not send to a custom port, so uploads arrive
+    on port 80. Listening there directly replaces the iptables redirect,
+    and uploads skip Home Assistant's HTTP middlewares (auth, ban,
+    forwarded headers), which the endpoints do not use anyway.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        port: int,
+        handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+        wslink: bool,
+    ) -> None:
+        """Init."""
+        self.hass = hass
+        self.port = port
+        self._runner: web.AppRunner | None = None
+
+        app = web.Application()
+        app.router.add_get(DEFAULT_URL, unregistred if wslink else handler)
+        app.router.add_post(WSLINK_URL, handler if wslink else unregistred)
+        self._app = app
+
+    async def async_start(self) -> bool:
+        """Start listening, return False if port can not be bound."""
+
+        runner = web.AppRunner(
+            self._app,
+            access_log=None,
+            shutdown_timeout=LISTENER_SHUTDOWN_TIMEOUT,
+        )
+        await runner.setup()
+
+        try:
+            await web.TCPSite(runner, port=self.port, reuse_address=True).start()
+        except OSError as ex:
+            _LOGGER.error(
+                "Unable to listen for station data on port %s: %s", self.port, ex
+            )
+            await runner.cleanup()
+            return False
+
+        self._runner = runner
+        _LOGGER.info("Listening for station data on port %s", self.port)
+        return True
+
+    async def async_stop(self) -> None:
+        """Stop listening."""
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
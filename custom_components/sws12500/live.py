@@ -0,0 +1,91 @@
+"""Live stream of decoded observations."""
+
+import logging
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.json import json_dumps
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LiveStream:
+    """Keep latest values of all fields and push changes to subscribers.
+
+    Subscribers receive a JSON fragment of the event, serialized once per
+    update and shared by all of them. Closing the stream ends all
+    subscriptions.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+        self.state: dict[str, Any] = {}
+        # send callback of each subscriber and its callback on close
+        self._subscribers: dict[Callable[[str], None], CALLBACK_TYPE | None] = {}
+        self.updates = 0
+        self.serialized = 0
+
+    def snapshot(self) -> str:
+        """Return event with latest values of all fields."""
+        return json_dumps({"snapshot": self.state})
+
+    @callback
+    def subscribe(
+        self, send: Callable[[str], None], closed: CALLBACK_TYPE | None = None
+    ) -> CALLBACK_TYPE:
+        """Send deltas to `send`, call `closed` when the stream is closed.
+
+        Returns unsubscribe callback.
+        """
+
+        self._subscribers[send] = closed
+
+        @callback
+        def unsubscribe() -> None:
+            self._subscribers.pop(send, None)
+
+        return unsubscribe
+
+    @callback
+    def close(self) -> None:
+        """End all subscriptions."""
+
+        subscribers, self._subscribers = self._subscribers, {}
+        for closed in subscribers.values():
+            if closed is not None:
+                closed()
+
+    @callback
+    def publish(self, items: Mapping[str, Any]) -> None:
+        """Store decoded upload and send changed fields."""
+
+        state = self.state
+        changed = {
+            key: value
+            for key, value in items.items()
+            if state.get(key, _MISSING) != value
+        }
+        self.updates += 1
+        if not changed:
+            return
+
+        state.update(changed)
+
+        if self._subscribers:
+            event = json_dumps({"delta": changed})
+            self.serialized += 1
+            for send in self._subscribers:
+                send(event)
+
+    def diagnostics(self) -> dict[str, int]:
+        """Return counters."""
+
+        return {
+            "subscribers": len(self._subscribers),
+            "fields": len(self.state),
+            "updates": self.updates,
+            "serialized": self.serialized,
+        }
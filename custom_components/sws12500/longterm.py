@@ -0,0 +1,168 @@
+"""Long-term statistics compiled from every upload."""
+
+import logging
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+
+from .const import DOMAIN, STATISTICS_DELAY
+from .hourly import HOUR, SUM_CLASSES, HourlyStatistics
+from .sensors_common import WeatherSensorEntityDescription
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def statistic_metadata(
+    description: WeatherSensorEntityDescription,
+    statistic_id: str,
+    source: str,
+    unit: str | None = None,
+    name: str | None = None,
+) -> StatisticMetaData:
+    """Return statistics metadata matching sensor description.
+
+    unit defaults to the native unit of the description.
+    """
+
+    if description.state_class is SensorStateClass.MEASUREMENT_ANGLE:
+        mean_type = StatisticMeanType.CIRCULAR
+    elif description.state_class in SUM_CLASSES:
+        mean_type = StatisticMeanType.NONE
+    else:
+        mean_type = StatisticMeanType.ARITHMETIC
+
+    return StatisticMetaData(
+        mean_type=mean_type,
+        has_sum=mean_type is StatisticMeanType.NONE,
+        name=name,
+        source=source,
+        statistic_id=statistic_id,
+        unit_of_measurement=unit or description.native_unit_of_measurement,
+    )
+
+
+class HourlyPublisher:
+    """Publish exact hourly statistics as external statistics.
+
+    Every upload updates running aggregates of the open hour, nothing is
+    read back from recorded states. An hour is published when the first
+    upload of the next hour arrives, or shortly after the hour ends.
+    Statistics are named `sws12500:<sensor key>`.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        descriptions: Mapping[str, WeatherSensorEntityDescription],
+    ) -> None:
+        """Init."""
+        self.hass = hass
+        self.descriptions = {
+            key: description
+            for key, description in descriptions.items()
+            if description.state_class is not None
+        }
+        self.hourly = HourlyStatistics(self.descriptions)
+        self.metadata: dict[str, StatisticMetaData] = {}
+        # last published sum of every total, continues across restarts
+        self._sum_offsets: dict[str, float] = {}
+        self.published = 0
+
+        self._unsub: CALLBACK_TYPE | None = async_track_utc_time_change(
+            hass, self._async_hour_ended, minute=0, second=STATISTICS_DELAY
+        )
+
+    @callback
+    def add(self, timestamp: float | None, data: Mapping[str, Any]) -> None:
+        """Add decoded upload."""
+
+        if completed := self.hourly.add(
+            time.time() if timestamp is None else timestamp, data
+        ):
+            self._schedule(completed)
+
+    @callback
+    def _async_hour_ended(self, now: datetime) -> None:
+        """Publish the open hour if no upload closed it."""
+
+        hour = self.hourly.hour
+        if (
+            hour is not None
+            and now.timestamp() - hour >= HOUR
+            and (completed := self.hourly.close())
+        ):
+            self._schedule(completed)
+
+    @callback
+    def _schedule(self, completed: tuple[float, dict[str, dict[str, float]]]) -> None:
+        self.hass.async_create_background_task(
+            self._async_publish(*completed), "sws12500 hourly statistics"
+        )
+
+    def _metadata(self, key: str) -> StatisticMetaData:
+        if (metadata := self.metadata.get(key)) is None:
+            metadata = self.metadata[key] = statistic_metadata(
+                self.descriptions[key], f"{DOMAIN}:{key}", DOMAIN, name=key
+            )
+        return metadata
+
+    async def _async_sum_offset(self, key: str) -> float:
+        """Return last published sum of statistic, loaded once."""
+
+        if (offset := self._sum_offsets.get(key)) is None:
+            statistic_id = f"{DOMAIN}:{key}"
+            last = await get_instance(self.hass).async_add_executor_job(
+                get_last_statistics, self.hass, 1, statistic_id, True, {"sum"}
+            )
+            rows = last.get(statistic_id)
+            offset = self._sum_offsets[key] = (
+                (rows[0].get("sum") or 0.0) if rows else 0.0
+            )
+        return offset
+
+    async def _async_publish(
+        self, hour: float, statistics: dict[str, dict[str, float]]
+    ) -> None:
+        """Add statistics of one hour."""
+
+        start = datetime.fromtimestamp(hour, UTC)
+        for key, values in statistics.items():
+            if "sum" in values:
+                values = {
+                    **values,
+                    "sum": round(values["sum"] + await self._async_sum_offset(key), 3),
+                }
+            async_add_external_statistics(
+                self.hass,
+                self._metadata(key),
+                [StatisticData(start=start, **values)],  # type: ignore[typeddict-item]
+            )
+        self.published += 1
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop hour timer, the open hour is not published."""
+
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return state."""
+
+        return {**self.hourly.diagnostics(), "published_hours": self.published}
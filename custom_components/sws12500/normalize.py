@@ -0,0 +1,66 @@
+"""Normalization of decoded uploads to canonical units."""
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from .const import (
+    BARO_PRESSURE,
+    CH2_TEMP,
+    CH3_TEMP,
+    CH4_TEMP,
+    DAILY_RAIN,
+    DEW_POINT,
+    INDOOR_TEMP,
+    OUTSIDE_TEMP,
+    RAIN,
+    RAW_FIELDS,
+    WIND_GUST,
+    WIND_SPEED,
+)
+from .utils import fahrenheit_to_celsius, inch_to_mm, inhg_to_hpa, mph_to_ms
+
+# Canonical units are °C, hPa, m/s, mm and mm/h. WSLink already sends them,
+# WU protocol sends imperial units.
+WU_CONVERSIONS: dict[str, Callable[[float], float]] = {
+    OUTSIDE_TEMP: fahrenheit_to_celsius,
+    DEW_POINT: fahrenheit_to_celsius,
+    INDOOR_TEMP: fahrenheit_to_celsius,
+    CH2_TEMP: fahrenheit_to_celsius,
+    CH3_TEMP: fahrenheit_to_celsius,
+    CH4_TEMP: fahrenheit_to_celsius,
+    BARO_PRESSURE: inhg_to_hpa,
+    WIND_SPEED: mph_to_ms,
+    WIND_GUST: mph_to_ms,
+    RAIN: inch_to_mm,
+    DAILY_RAIN: inch_to_mm,
+}
+
+
+def normalize(items: Mapping[str, Any], wslink: bool) -> dict[str, Any]:
+    """Convert decoded measurements to numbers in canonical units.
+
+    Empty values become None, values that are not numbers are kept.
+    Battery and connection states are not measurements and stay as sent.
+    """
+
+    conversions = {} if wslink else WU_CONVERSIONS
+    normalized: dict[str, Any] = {}
+
+    for key, value in items.items():
+        if key in RAW_FIELDS:
+            normalized[key] = value
+            continue
+        if value == "":
+            normalized[key] = None
+            continue
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            normalized[key] = value
+            continue
+
+        if (convert := conversions.get(key)) is not None:
+            number = round(convert(number), 2)
+        normalized[key] = number
+
+    return normalized
@@ -1,16 +1,16 @@
 """Pocasi CZ resend functions."""
 
-from datetime import datetime, timedelta
 import logging
 from typing import Any, Literal
 
 from aiohttp import ClientError
-
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from yarl import URL
 
+from .aggregate import IntervalAggregator
 from .const import (
+    AGGREGATE_ITEMS,
     DEFAULT_URL,
     POCASI_CZ_API_ID,
     POCASI_CZ_API_KEY,
@@ -23,6 +23,8 @@ from .const import (
     POCASI_INVALID_KEY,
     WSLINK_URL,
 )
+from .forwarder import ForwarderScheduler, ForwarderSession
+from .trace import Anonymized
 from .utils import update_options
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,12 +51,34 @@ class PocasiPush:
         self.config = config
         self._interval = int(self.config.options.get(POCASI_CZ_SEND_INTERVAL, 30))
 
-        self.last_update = datetime.now()
-        self.next_update = datetime.now() + timedelta(seconds=self._interval)
+        self.scheduler = ForwarderScheduler(
+            hass,
+            interval=self._interval,
+            initial_delay=self._interval,
+            send=self._send_pending,
+        )
+        self.aggregator = IntervalAggregator(AGGREGATE_ITEMS)
+        self._mode: Literal["WU", "WSLINK"] = "WU"
 
         self.log = self.config.options.get(POCASI_CZ_LOGGER_ENABLED)
         self.invalid_response_count = 0
 
+        # Request templates, credentials do not change without reload.
+        _api_id = self.config.options.get(POCASI_CZ_API_ID)
+        _api_key = self.config.options.get(POCASI_CZ_API_KEY)
+        self._urls: dict[str, URL] = {
+            "WSLINK": URL(f"{POCASI_CZ_URL}{WSLINK_URL}"),
+            "WU": URL(f"{POCASI_CZ_URL}{DEFAULT_URL}"),
+        }
+        self._credentials: dict[str, dict[str, Any]] = {
+            "WSLINK": {"wsid": _api_id, "wspw": _api_key},
+            "WU": {"ID": _api_id, "PASSWORD": _api_key},
+        }
+
+        self.client = ForwarderSession(
+            hass, "pocasi", keepalive_timeout=self._interval + 30
+        )
+
     def verify_response(
         self,
         response: str,
@@ -74,45 +98,41 @@ class PocasiPush:
     ):
         """Pushes weather data to server."""
 
-        _data = data.copy()
-        _api_id = self.config.options.get(POCASI_CZ_API_ID)
-        _api_key = self.config.options.get(POCASI_CZ_API_KEY)
-
-        if self.log:
-            _LOGGER.info(
-                "Pocasi CZ last update = %s, next update at: %s",
-                str(self.last_update),
-                str(self.next_update),
-            )
+        self.aggregator.add(data)
+        self._mode = mode
 
-        if self.next_update > datetime.now():
-            _LOGGER.debug(
-                "Triggered update interval limit of %s seconds. Next possilbe update is set to: %s",
-                self._interval,
-                self.next_update,
-            )
+        if not self.scheduler.due():
+            self.scheduler.defer()
             return False
 
-        request_url: str = ""
-        if mode == "WSLINK":
-            _data["wsid"] = _api_id
-            _data["wspw"] = _api_key
-            request_url = f"{POCASI_CZ_URL}{WSLINK_URL}"
+        return await self._send_pending()
+
+    async def _send_pending(self):
+        """Send data aggregated over the interval to server."""
+
+        if not self.aggregator.samples:
+            return
+        if self.client.closed:
+            # late upload of unloaded entry
+            _LOGGER.debug("Pocasi Meteo forwarder is closed, data not sent")
+            return
 
-        if mode == "WU":
-            _data["ID"] = _api_id
-            _data["PASSWORD"] = _api_key
-            request_url = f"{POCASI_CZ_URL}{DEFAULT_URL}"
+        _data = self.aggregator.result()
+        mode = self._mode
+        self.aggregator.reset()
+        self.scheduler.sent()
+
+        _data.update(self._credentials[mode])
+        request_url = self._urls[mode]
 
-        session = async_get_clientsession(self.hass, verify_ssl=False)
         _LOGGER.debug(
             "Payload for Pocasi Meteo server: [mode=%s] [request_url=%s] = %s",
             mode,
             request_url,
-            _data,
+            Anonymized(_data),
         )
         try:
-            async with session.get(request_url, params=_data) as resp:
+            async with self.client.session.get(request_url, params=_data) as resp:
                 status = await resp.text()
                 try:
                     self.verify_response(status)
@@ -134,10 +154,9 @@ class PocasiPush:
                 _LOGGER.critical(POCASI_CZ_UNEXPECTED)
                 await update_options(self.hass, self.config, POCASI_CZ_ENABLED, False)
 
-        self.last_update = datetime.now()
-        self.next_update = datetime.now() + timedelta(seconds=self._interval)
-
         if self.log:
-            _LOGGER.info("Next update: %s", str(self.next_update))
+            _LOGGER.info(
+                "Next Pocasi Meteo update in %.0f s", self.scheduler.remaining()
+            )
 
-        return None
+        return
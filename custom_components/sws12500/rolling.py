@@ -0,0 +1,176 @@
+"""Sliding window statistics computed from the decoded stream."""
+
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    BARO_PRESSURE,
+    GUST_MAX_WINDOW,
+    PRESSURE_TENDENCY,
+    PRESSURE_TENDENCY_WINDOW,
+    RAIN_INCREMENT,
+    RAIN_RATE,
+    RAIN_RATE_WINDOW,
+    WIND_AVG_WINDOW,
+    WIND_GUST,
+    WIND_GUST_MAX,
+    WIND_SPEED,
+    WIND_SPEED_AVG,
+)
+
+
+class RollingWindow(ABC):
+    """Base class of time based sliding windows."""
+
+    def __init__(self, seconds: float) -> None:
+        """Init."""
+        self.seconds = seconds
+        self._samples: deque[tuple[float, float]] = deque()
+
+    def _evict(self, now: float) -> None:
+        """Drop samples older than window."""
+
+        since = now - self.seconds
+        while self._samples and self._samples[0][0] < since:
+            self._on_evict(self._samples.popleft()[1])
+
+    def _on_evict(self, value: float) -> None:
+        """Handle dropped sample."""
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add sample."""
+
+        self._samples.append((timestamp, value))
+        self._evict(timestamp)
+
+    def span(self) -> float:
+        """Return seconds between oldest and newest sample."""
+
+        if not self._samples:
+            return 0.0
+        return self._samples[-1][0] - self._samples[0][0]
+
+    @abstractmethod
+    def value(self) -> float | None:
+        """Return current window value."""
+
+
+class RollingMean(RollingWindow):
+    """Mean over window, keeps running sum."""
+
+    def __init__(self, seconds: float) -> None:
+        """Init."""
+        super().__init__(seconds)
+        self._sum = 0.0
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add sample."""
+
+        self._sum += value
+        super().add(timestamp, value)
+
+    def _on_evict(self, value: float) -> None:
+        self._sum -= value
+
+    def value(self) -> float | None:
+        """Return mean."""
+
+        if not self._samples:
+            return None
+        return round(self._sum / len(self._samples), 2)
+
+
+class RollingSum(RollingMean):
+    """Sum over window."""
+
+    def value(self) -> float | None:
+        """Return sum."""
+
+        if not self._samples:
+            return None
+        return round(max(self._sum, 0.0), 2)
+
+
+class RollingMax(RollingWindow):
+    """Maximum over window, keeps monotonic queue of candidates."""
+
+    def __init__(self, seconds: float) -> None:
+        """Init."""
+        super().__init__(seconds)
+        self._candidates: deque[tuple[float, float]] = deque()
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add sample."""
+
+        while self._candidates and self._candidates[-1][1] <= value:
+            self._candidates.pop()
+        self._candidates.append((timestamp, value))
+        super().add(timestamp, value)
+
+    def _evict(self, now: float) -> None:
+        """Drop samples and candidates older than window."""
+
+        super()._evict(now)
+        since = now - self.seconds
+        while self._candidates[0][0] < since:
+            self._candidates.popleft()
+
+    def value(self) -> float | None:
+        """Return maximum."""
+
+        if not self._candidates:
+            return None
+        return self._candidates[0][1]
+
+
+class RollingDelta(RollingWindow):
+    """Difference between newest and oldest sample in window."""
+
+    def value(self) -> float | None:
+        """Return change over window."""
+
+        if len(self._samples) < 2:
+            return None
+        return round(self._samples[-1][1] - self._samples[0][1], 2)
+
+
+class RollingStatistics:
+    """Derived sensors computed incrementally from decoded uploads."""
+
+    def __init__(self) -> None:
+        """Init."""
+
+        # output key: (source key, window)
+        self.windows: dict[str, tuple[str, RollingWindow]] = {
+            WIND_SPEED_AVG: (WIND_SPEED, RollingMean(WIND_AVG_WINDOW)),
+            WIND_GUST_MAX: (WIND_GUST, RollingMax(GUST_MAX_WINDOW)),
+            PRESSURE_TENDENCY: (
+                BARO_PRESSURE,
+                RollingDelta(PRESSURE_TENDENCY_WINDOW),
+            ),
+            RAIN_RATE: (RAIN_INCREMENT, RollingSum(RAIN_RATE_WINDOW)),
+        }
+
+    def update(
+        self, data: Mapping[str, Any], timestamp: float | None = None
+    ) -> dict[str, float]:
+        """Add upload to windows and return derived values."""
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        derived: dict[str, float] = {}
+        for key, (source, window) in self.windows.items():
+            try:
+                value = float(data[source])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            window.add(timestamp, value)
+            if (result := window.value()) is not None:
+                derived[key] = result
+
+        return derived
@@ -38,11 +38,19 @@ class Routes:
                 _LOGGER.info("New coordinator to route: %s", route.url_path)
                 route.enabled = True
                 route.handler = coordinator
-                route.route._handler = coordinator  # noqa: SLF001
+                route.route._handler = coordinator
             else:
                 route.enabled = False
                 route.handler = unregistred
-                route.route._handler = unregistred  # noqa: SLF001
+                route.route._handler = unregistred
+
+    def disable(self) -> None:
+        """Route all paths to unregistred handler."""
+
+        for route in self.routes.values():
+            route.enabled = False
+            route.handler = unregistred
+            route.route._handler = unregistred
 
     def add_route(
         self,
@@ -2,7 +2,7 @@
 
 import logging
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import RestoreSensor, SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType
@@ -14,6 +14,7 @@ from . import WeatherDataUpdateCoordinator
 from .const import (
     BATTERY_LIST,
     CHILL_INDEX,
+    DERIVED_SENSORS,
     DOMAIN,
     HEAT_INDEX,
     OUTSIDE_HUMIDITY,
@@ -23,12 +24,13 @@ from .const import (
     WIND_DIR,
     WIND_SPEED,
     WSLINK,
+    ZAMBRETTI_FORECAST,
     UnitOfBat,
 )
 from .sensors_common import WeatherSensorEntityDescription
 from .sensors_weather import SENSOR_TYPES_WEATHER_API
 from .sensors_wslink import SENSOR_TYPES_WSLINK
-from .utils import battery_level_to_icon, battery_level_to_text, chill_index, heat_index
+from .utils import battery_level_to_icon, battery_level_to_text
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,10 +59,16 @@ async def async_setup_entry(
 
         if (WIND_SPEED in sensors_to_load) and (OUTSIDE_TEMP in sensors_to_load):
             sensors_to_load.append(CHILL_INDEX)
+
+        sensors_to_load.extend(
+            key for key, source in DERIVED_SENSORS.items() if source in sensors_to_load
+        )
         sensors = [
-            WeatherSensor(hass, description, coordinator)
-            for description in SENSOR_TYPES
-            if description.key in sensors_to_load
+            (ForecastSensor if key == ZAMBRETTI_FORECAST else WeatherSensor)(
+                hass, SENSOR_TYPES[key], coordinator
+            )
+            for key in dict.fromkeys(sensors_to_load)
+            if key in SENSOR_TYPES
         ]
         async_add_entities(sensors)
 
@@ -87,49 +95,45 @@ class WeatherSensor(  # pyright: ignore[reportIncompatibleVariableOverride]
         self._attr_unique_id = description.key
         self._data = None
 
-    async def async_added_to_hass(self) -> None:
-        """Handle listeners to reloaded sensors."""
-
-        await super().async_added_to_hass()
-
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
-
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._data = self.coordinator.data.get(self.entity_description.key)
-
-        super()._handle_coordinator_update()
-
+        """Handle updated data from the coordinator.
+
+        CoordinatorEntity already listens to coordinator, state is written
+        only once and only when the value changed significantly. A value
+        missing from the upload, or rejected by validation, keeps the last
+        good state.
+        """
+        data = self.coordinator.data or {}
+        key = self.entity_description.key
+        # wind azimut is rendered from wind direction
+        source = WIND_DIR if WIND_AZIMUT in key else key
+
+        if not self.coordinator.significance.is_significant(source, data):
+            return
+
+        self._data = data.get(key)
         self.async_write_ha_state()
 
     @property
     def native_value(self):  # pyright: ignore[reportIncompatibleVariableOverride]
         """Return value of entity."""
 
-        _wslink = self.coordinator.config.options.get(WSLINK)
-
         if self.coordinator.data and (WIND_AZIMUT in self.entity_description.key):
             return self.entity_description.value_fn(self.coordinator.data.get(WIND_DIR))  # pyright: ignore[ reportAttributeAccessIssue]
 
-        if (
-            self.coordinator.data
-            and (HEAT_INDEX in self.entity_description.key)
-            and not _wslink
-        ):
-            return self.entity_description.value_fn(heat_index(self.coordinator.data))  # pyright: ignore[ reportAttributeAccessIssue]
-
-        if (
-            self.coordinator.data
-            and (CHILL_INDEX in self.entity_description.key)
-            and not _wslink
-        ):
-            return self.entity_description.value_fn(chill_index(self.coordinator.data))  # pyright: ignore[ reportAttributeAccessIssue]
-
         return (
             None if self._data == "" else self.entity_description.value_fn(self._data)  # pyright: ignore[ reportAttributeAccessIssue]
         )
 
+    @property
+    def extra_state_attributes(self) -> dict[str, str] | None:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Return source of derived metrics."""
+
+        if source := self.coordinator.derived.sources.get(self.entity_description.key):
+            return {"source": source}
+        return None
+
     @property
     def suggested_entity_id(self) -> str:
         """Return name."""
@@ -159,3 +163,18 @@ class WeatherSensor(  # pyright: ignore[reportIncompatibleVariableOverride]
             manufacturer="Schizza",
             model="Weather Station SWS 12500",
         )
+
+
+class ForecastSensor(WeatherSensor, RestoreSensor):  # pyright: ignore[reportIncompatibleVariableOverride]
+    """Zambretti forecast, kept across restarts.
+
+    The forecast needs an hour of pressure history, until then the last
+    forecast is restored and uploads without it leave the state alone.
+    """
+
+    async def async_added_to_hass(self) -> None:
+        """Restore last forecast."""
+        await super().async_added_to_hass()
+
+        if (last := await self.async_get_last_sensor_data()) is not None:
+            self._data = last.native_value
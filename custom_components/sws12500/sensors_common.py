@@ -1,14 +1,82 @@
 """Common classes for sensors."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass
-from typing import Any
+from functools import partial
+from typing import Any, cast
 
 from homeassistant.components.sensor import SensorEntityDescription
 
+from .const import SIGNIFICANT_HEARTBEAT
+from .utils import wind_dir_to_text
+
 
 @dataclass(frozen=True, kw_only=True)
 class WeatherSensorEntityDescription(SensorEntityDescription):
-    """Describe Weather Sensor entities."""
+    """Describe Weather Sensor entities.
+
+    significant_abs / significant_rel: minimal absolute / relative change
+    of value to be written to Home Assistant. Without thresholds every
+    change is written.
+    heartbeat: seconds after which the value is written even if unchanged.
+    """
 
     value_fn: Callable[[Any], int | float | str | None]
+    significant_abs: float | None = None
+    significant_rel: float | None = None
+    heartbeat: int = SIGNIFICANT_HEARTBEAT
+
+
+# value_fn shared by all descriptions of the same data type
+def value_float(data: Any) -> float:
+    """Return float value."""
+    return cast("float", data)
+
+
+def value_int(data: Any) -> int:
+    """Return int value."""
+    return cast("int", data)
+
+
+def value_raw(data: Any) -> Any:
+    """Return value as received."""
+    return data
+
+
+def value_azimut(data: Any) -> str:
+    """Return wind direction as text."""
+    return cast("str", wind_dir_to_text(data))
+
+
+class SensorCatalog(Mapping[str, WeatherSensorEntityDescription]):
+    """Sensor descriptions keyed by sensor key.
+
+    Descriptions are declared as partials and built on first access,
+    so importing the module does not construct the whole sensor set.
+    """
+
+    def __init__(self, *factories: "partial[WeatherSensorEntityDescription]") -> None:
+        """Init."""
+        self._factories: dict[str, partial[WeatherSensorEntityDescription]] = {
+            factory.keywords["key"]: factory for factory in factories
+        }
+        self._built: dict[str, WeatherSensorEntityDescription] = {}
+
+    def __getitem__(self, key: str) -> WeatherSensorEntityDescription:
+        """Return description, build it on first use."""
+
+        if (description := self._built.get(key)) is None:
+            description = self._built[key] = self._factories[key]()
+        return description
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if sensor key is known."""
+        return key in self._factories
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate sensor keys."""
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        """Return number of sensors."""
+        return len(self._factories)
@@ -1,6 +1,6 @@
 """Sensor entities for the SWS12500 integration for old endpoint."""
 
-from typing import cast
+from functools import partial
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import (
@@ -31,95 +31,125 @@ from .const import (
     INDOOR_TEMP,
     OUTSIDE_HUMIDITY,
     OUTSIDE_TEMP,
+    PRECIPITATION_TOTAL,
+    PRESSURE_TENDENCY,
     RAIN,
+    RAIN_RATE,
     SOLAR_RADIATION,
     UV,
     WIND_AZIMUT,
     WIND_DIR,
     WIND_GUST,
+    WIND_GUST_MAX,
     WIND_SPEED,
+    WIND_SPEED_AVG,
+    ZAMBRETTI_FORECAST,
     UnitOfDir,
 )
-from .sensors_common import WeatherSensorEntityDescription
-from .utils import wind_dir_to_text
+from .forecast import FORECASTS
+from .sensors_common import (
+    SensorCatalog,
+    WeatherSensorEntityDescription,
+    value_azimut,
+    value_float,
+    value_int,
+    value_raw,
+)
 
-SENSOR_TYPES_WEATHER_API: tuple[WeatherSensorEntityDescription, ...] = (
-    WeatherSensorEntityDescription(
+SENSOR_TYPES_WEATHER_API = SensorCatalog(
+    partial(
+        WeatherSensorEntityDescription,
         key=INDOOR_TEMP,
-        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer",
         device_class=SensorDeviceClass.TEMPERATURE,
         translation_key=INDOOR_TEMP,
-        value_fn=lambda data: cast("float", data),
+        significant_abs=0.2,
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=INDOOR_HUMIDITY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer",
         device_class=SensorDeviceClass.HUMIDITY,
         translation_key=INDOOR_HUMIDITY,
-        value_fn=lambda data: cast("int", data),
+        significant_abs=1,
+        value_fn=value_int,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=OUTSIDE_TEMP,
-        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer",
         device_class=SensorDeviceClass.TEMPERATURE,
         translation_key=OUTSIDE_TEMP,
-        value_fn=lambda data: cast("float", data),
+        significant_abs=0.2,
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=OUTSIDE_HUMIDITY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer",
         device_class=SensorDeviceClass.HUMIDITY,
         translation_key=OUTSIDE_HUMIDITY,
-        value_fn=lambda data: cast("int", data),
+        significant_abs=1,
+        value_fn=value_int,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=DEW_POINT,
-        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer-lines",
         device_class=SensorDeviceClass.TEMPERATURE,
         translation_key=DEW_POINT,
-        value_fn=lambda data: cast("float", data),
+        significant_abs=0.2,
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=BARO_PRESSURE,
-        native_unit_of_measurement=UnitOfPressure.INHG,
+        native_unit_of_measurement=UnitOfPressure.HPA,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer-lines",
         device_class=SensorDeviceClass.ATMOSPHERIC_PRESSURE,
         suggested_unit_of_measurement=UnitOfPressure.HPA,
         translation_key=BARO_PRESSURE,
-        value_fn=lambda data: cast("float", data),
+        significant_abs=0.2,
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=WIND_SPEED,
-        native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
+        native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.WIND_SPEED,
         suggested_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
         icon="mdi:weather-windy",
         translation_key=WIND_SPEED,
-        value_fn=lambda data: cast("int", data),
+        significant_abs=0.3,
+        value_fn=value_int,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=WIND_GUST,
-        native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
+        native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.WIND_SPEED,
         suggested_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
         icon="mdi:windsock",
         translation_key=WIND_GUST,
-        value_fn=lambda data: cast("float", data),
+        significant_abs=0.3,
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=WIND_DIR,
         native_unit_of_measurement=DEGREE,
         state_class=SensorStateClass.MEASUREMENT_ANGLE,
@@ -127,133 +157,227 @@ SENSOR_TYPES_WEATHER_API: tuple[WeatherSensorEntityDescription, ...] = (
         suggested_display_precision=None,
         icon="mdi:sign-direction",
         translation_key=WIND_DIR,
-        value_fn=lambda data: cast("int", data),
+        significant_abs=10,
+        value_fn=value_int,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=WIND_AZIMUT,
         icon="mdi:sign-direction",
-        value_fn=lambda data: cast("str", wind_dir_to_text(data)),
+        value_fn=value_azimut,
         device_class=SensorDeviceClass.ENUM,
         options=list(UnitOfDir),
         translation_key=WIND_AZIMUT,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=RAIN,
-        native_unit_of_measurement=UnitOfPrecipitationDepth.INCHES,
+        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.TOTAL,
         suggested_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
         suggested_display_precision=2,
         icon="mdi:weather-pouring",
         translation_key=RAIN,
-        value_fn=lambda data: cast("float", data),
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=DAILY_RAIN,
-        native_unit_of_measurement=UnitOfVolumetricFlux.INCHES_PER_DAY,
+        native_unit_of_measurement=UnitOfVolumetricFlux.MILLIMETERS_PER_DAY,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.PRECIPITATION_INTENSITY,
         suggested_unit_of_measurement=UnitOfVolumetricFlux.MILLIMETERS_PER_DAY,
         suggested_display_precision=2,
         icon="mdi:weather-pouring",
         translation_key=DAILY_RAIN,
-        value_fn=lambda data: cast("float", data),
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=SOLAR_RADIATION,
         native_unit_of_measurement=UnitOfIrradiance.WATTS_PER_SQUARE_METER,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.IRRADIANCE,
         icon="mdi:weather-sunny",
         translation_key=SOLAR_RADIATION,
-        value_fn=lambda data: cast("float", data),
+        significant_abs=5,
+        significant_rel=0.05,
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=UV,
         name=UV,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UV_INDEX,
         icon="mdi:sunglasses",
         translation_key=UV,
-        value_fn=lambda data: cast("float", data),
+        significant_abs=0.5,
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=CH2_TEMP,
-        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
         icon="mdi:weather-sunny",
         translation_key=CH2_TEMP,
-        value_fn=lambda data: cast("float", data),
+        significant_abs=0.2,
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=CH2_HUMIDITY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.HUMIDITY,
         icon="mdi:weather-sunny",
         translation_key=CH2_HUMIDITY,
-        value_fn=lambda data: cast("int", data),
+        significant_abs=1,
+        value_fn=value_int,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=CH3_TEMP,
-        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
         icon="mdi:weather-sunny",
         translation_key=CH3_TEMP,
-        value_fn=lambda data: cast("float", data),
+        significant_abs=0.2,
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=CH3_HUMIDITY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.HUMIDITY,
         icon="mdi:weather-sunny",
         translation_key=CH3_HUMIDITY,
-        value_fn=lambda data: cast("int", data),
+        significant_abs=1,
+        value_fn=value_int,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=CH4_TEMP,
-        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
         icon="mdi:weather-sunny",
         translation_key=CH4_TEMP,
-        value_fn=lambda data: cast("float", data),
+        significant_abs=0.2,
+        value_fn=value_float,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=CH4_HUMIDITY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.HUMIDITY,
         icon="mdi:weather-sunny",
         translation_key=CH4_HUMIDITY,
-        value_fn=lambda data: cast("int", data),
+        significant_abs=1,
+        value_fn=value_int,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=HEAT_INDEX,
-        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_display_precision=2,
         icon="mdi:weather-sunny",
         translation_key=HEAT_INDEX,
-        value_fn=lambda data: cast("int", data),
+        significant_abs=0.2,
+        value_fn=value_int,
     ),
-    WeatherSensorEntityDescription(
+    partial(
+        WeatherSensorEntityDescription,
         key=CHILL_INDEX,
-        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_display_precision=2,
         icon="mdi:weather-sunny",
         translation_key=CHILL_INDEX,
-        value_fn=lambda data: cast("int", data),
+        significant_abs=0.2,
+        value_fn=value_int,
+    ),
+    partial(
+        WeatherSensorEntityDescription,
+        key=WIND_SPEED_AVG,
+        native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.WIND_SPEED,
+        suggested_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        icon="mdi:weather-windy",
+        translation_key=WIND_SPEED_AVG,
+        significant_abs=0.2,
+        value_fn=value_float,
+    ),
+    partial(
+        WeatherSensorEntityDescription,
+        key=WIND_GUST_MAX,
+        native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.WIND_SPEED,
+        suggested_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        icon="mdi:windsock",
+        translation_key=WIND_GUST_MAX,
+        value_fn=value_float,
+    ),
+    partial(
+        WeatherSensorEntityDescription,
+        key=PRESSURE_TENDENCY,
+        native_unit_of_measurement=UnitOfPressure.HPA,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.ATMOSPHERIC_PRESSURE,
+        suggested_unit_of_measurement=UnitOfPressure.HPA,
+        suggested_display_precision=1,
+        icon="mdi:trending-up",
+        translation_key=PRESSURE_TENDENCY,
+        significant_abs=0.1,
+        value_fn=value_float,
+    ),
+    partial(
+        WeatherSensorEntityDescription,
+        key=RAIN_RATE,
+        native_unit_of_measurement=UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.PRECIPITATION_INTENSITY,
+        suggested_unit_of_measurement=UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR,
+        suggested_display_precision=2,
+        icon="mdi:weather-pouring",
+        translation_key=RAIN_RATE,
+        value_fn=value_float,
+    ),
+    partial(
+        WeatherSensorEntityDescription,
+        key=PRECIPITATION_TOTAL,
+        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
+        device_class=SensorDeviceClass.PRECIPITATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
+        suggested_display_precision=2,
+        icon="mdi:weather-pouring",
+        translation_key=PRECIPITATION_TOTAL,
+        value_fn=value_float,
+    ),
+    partial(
+        WeatherSensorEntityDescription,
+        key=ZAMBRETTI_FORECAST,
+        icon="mdi:weather-partly-cloudy",
+        device_class=SensorDeviceClass.ENUM,
+        options=list(FORECASTS),
+        translation_key=ZAMBRETTI_FORECAST,
+        value_fn=value_raw,
     ),
 )
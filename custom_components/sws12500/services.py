@@ -0,0 +1,157 @@
+"""Services for SWS12500."""
+
+import logging
+from pathlib import Path
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.components.recorder import get_instance
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+
+from .archive import SUFFIX
+from .const import (
+    ARCHIVE_DIR,
+    DOMAIN,
+    EXPORT_CSV,
+    EXPORT_DIR,
+    EXPORT_JSONL,
+    REPLAY_COORDINATOR,
+    REPLAY_WINDY,
+    SERVICE_EXPORT,
+    SERVICE_IMPORT,
+    SERVICE_REPLAY,
+    WSLINK,
+)
+from .export import export_name, export_stream, resolve_fields, write_export
+from .importer import async_import_file
+from .sensors_weather import SENSOR_TYPES_WEATHER_API
+from .sensors_wslink import SENSOR_TYPES_WSLINK
+
+_LOGGER = logging.getLogger(__name__)
+
+REPLAY_SCHEMA = vol.Schema(
+    {
+        vol.Required("segment"): cv.string,
+        vol.Optional("speed", default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("target", default=REPLAY_COORDINATOR): vol.In(
+            [REPLAY_COORDINATOR, REPLAY_WINDY]
+        ),
+    }
+)
+
+EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Optional("fields", default=[]): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("format", default=EXPORT_CSV): vol.In([EXPORT_CSV, EXPORT_JSONL]),
+        vol.Optional("gzip", default=False): cv.boolean,
+    }
+)
+
+IMPORT_SCHEMA = vol.Schema({vol.Required("file"): cv.string})
+
+
+def _coordinator(hass: HomeAssistant):
+    """Return coordinator of the configured station."""
+
+    for value in hass.data.get(DOMAIN, {}).values():
+        if hasattr(value, "async_ingest"):
+            return value
+    raise ServiceValidationError("Weather station is not configured")
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+
+    if hass.services.has_service(DOMAIN, SERVICE_REPLAY):
+        return
+
+    async def async_replay(call: ServiceCall) -> None:
+        """Replay archived uploads."""
+
+        archive = Path(hass.config.path(ARCHIVE_DIR))
+        segment = archive / Path(call.data["segment"]).name
+        if segment.suffix != SUFFIX:
+            segment = segment.with_name(segment.name + SUFFIX)
+
+        if not await hass.async_add_executor_job(segment.is_file):
+            raise ServiceValidationError(f"Archive segment {segment.name} not found")
+
+        coordinator = _coordinator(hass)
+        if call.data["target"] == REPLAY_WINDY and not coordinator.windy.configured:
+            raise ServiceValidationError(
+                "Windy is not enabled or its station ID and password are not set"
+            )
+
+        await coordinator.async_replay(segment, call.data["speed"], call.data["target"])
+
+    async def async_export(call: ServiceCall) -> ServiceResponse:
+        """Export station history to file."""
+
+        start = dt_util.as_utc(call.data["start"])
+        end = dt_util.as_utc(call.data.get("end") or dt_util.utcnow())
+        if end <= start:
+            raise ServiceValidationError("End of export must be after its start")
+
+        if "recorder" not in hass.config.components:
+            raise ServiceValidationError("Recorder is not running")
+
+        if not (entities := resolve_fields(hass, call.data["fields"])):
+            raise ServiceValidationError("No station sensors to export")
+
+        fmt = call.data["format"]
+        compress = call.data["gzip"]
+        path = Path(hass.config.path(EXPORT_DIR)) / export_name(
+            start, end, fmt, compress
+        )
+        size = await get_instance(hass).async_add_executor_job(
+            write_export,
+            export_stream(
+                hass, entities, start.timestamp(), end.timestamp(), fmt, compress
+            ),
+            path,
+        )
+        return {"path": str(path), "size": size}
+
+    async def async_import(call: ServiceCall) -> ServiceResponse:
+        """Import historical data into long-term statistics."""
+
+        config = Path(hass.config.path()).resolve()
+        path = (config / call.data["file"]).resolve()
+        if not path.is_relative_to(config) or not await hass.async_add_executor_job(
+            path.is_file
+        ):
+            raise ServiceValidationError(f"File {call.data['file']} not found")
+
+        wslink = _coordinator(hass).config.options.get(WSLINK)
+        return await async_import_file(
+            hass, path, SENSOR_TYPES_WSLINK if wslink else SENSOR_TYPES_WEATHER_API
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REPLAY, async_replay, schema=REPLAY_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT,
+        async_import,
+        schema=IMPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT,
+        async_export,
+        schema=EXPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,93 @@
+"""Suppression of insignificant sensor updates."""
+
+import time
+from collections.abc import Mapping
+from typing import Any
+
+from .sensors_common import WeatherSensorEntityDescription
+
+
+class SignificanceFilter:
+    """Decide which decoded values are worth a state write."""
+
+    def __init__(
+        self, descriptions: Mapping[str, WeatherSensorEntityDescription]
+    ) -> None:
+        """Init."""
+        self.descriptions = descriptions
+        self.thresholds: dict[str, tuple[float | None, float | None, int]] = {}
+        self._last: dict[str, tuple[Any, float]] = {}
+        self.changed: set[str] = set()
+        self.published = 0
+        self.suppressed = 0
+
+    def _significant(self, key: str, value: Any, now: float) -> bool:
+        """Return True if value differs enough from the last published one."""
+
+        if (last := self._last.get(key)) is None:
+            return True
+
+        last_value, last_time = last
+        significant_abs, significant_rel, heartbeat = self.thresholds[key]
+
+        if now - last_time >= heartbeat:
+            return True
+
+        try:
+            delta = abs(float(value) - float(last_value))
+        except (TypeError, ValueError):
+            return value != last_value
+
+        if significant_abs is None and significant_rel is None:
+            return delta > 0
+        if significant_abs is not None and delta >= significant_abs:
+            return True
+        return significant_rel is not None and delta >= significant_rel * abs(
+            float(last_value)
+        )
+
+    def update(self, data: Mapping[str, Any]) -> set[str]:
+        """Return keys of sensors that should be written."""
+
+        now = time.monotonic()
+        changed: set[str] = set()
+
+        for key, value in data.items():
+            if key not in self.thresholds:
+                if key not in self.descriptions:
+                    continue
+                description = self.descriptions[key]
+                self.thresholds[key] = (
+                    description.significant_abs,
+                    description.significant_rel,
+                    description.heartbeat,
+                )
+
+            if self._significant(key, value, now):
+                self._last[key] = (value, now)
+                changed.add(key)
+                self.published += 1
+            else:
+                self.suppressed += 1
+
+        self.changed = changed
+        return changed
+
+    def is_significant(self, key: str, data: Mapping[str, Any]) -> bool:
+        """Return True if entity should write its state.
+
+        Keys missing from data, not uploaded or rejected by validation,
+        are never written, so the entity keeps its last good value.
+        """
+
+        return key in data and key in self.changed
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return suppression statistics."""
+
+        total = self.published + self.suppressed
+        return {
+            "published": self.published,
+            "suppressed": self.suppressed,
+            "suppression_ratio": round(self.suppressed / total, 3) if total else 0,
+        }
@@ -0,0 +1,92 @@
+"""Debug trace of upload processing."""
+
+import logging
+import time
+from collections.abc import Mapping
+from typing import Any
+
+from .const import TRACE_PAYLOAD_EVERY
+from .utils import anonymize
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Anonymized:
+    """Anonymize mapping only when the log record is formatted."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        """Init."""
+        self._data = data
+
+    def __str__(self) -> str:
+        """Return anonymized data."""
+        return str(anonymize(self._data))
+
+
+class UploadTrace:
+    """Stage timings of one upload."""
+
+    __slots__ = ("_last", "fields", "notes", "payload", "stages", "started")
+
+    def __init__(self, payload: Mapping[str, Any] | None) -> None:
+        """Init."""
+        self.started = self._last = time.perf_counter()
+        self.payload = payload
+        self.stages: list[tuple[str, float]] = []
+        self.notes: dict[str, Any] = {}
+        self.fields = 0
+
+    def mark(self, stage: str) -> None:
+        """Record time spent since previous mark."""
+
+        now = time.perf_counter()
+        self.stages.append((stage, now - self._last))
+        self._last = now
+
+    def note(self, key: str, value: Any) -> None:
+        """Attach value to record."""
+        self.notes[key] = value
+
+    def __str__(self) -> str:
+        """Format record, called by logging only when emitted."""
+
+        total = (self._last - self.started) * 1000
+        stages = " ".join(f"{name}={spent * 1000:.3f}" for name, spent in self.stages)
+        record = f"upload fields={self.fields} total={total:.3f}ms [{stages}]"
+        for key, value in self.notes.items():
+            record += f" {key}={value}"
+        if self.payload is not None:
+            record += f" payload={anonymize(self.payload)}"
+        return record
+
+
+class UploadTracer:
+    """Create one trace record per upload when debugging is enabled.
+
+    With developer log off and debug level off, `start` returns None and
+    callers skip all tracing, so the disabled path is one level check.
+    """
+
+    def __init__(self, dev_log: bool) -> None:
+        """Init."""
+        self._level = logging.INFO if dev_log else logging.DEBUG
+        self._uploads = 0
+
+    def start(self, data: Mapping[str, Any]) -> UploadTrace | None:
+        """Start trace of upload, or return None if disabled."""
+
+        if not _LOGGER.isEnabledFor(self._level):
+            return None
+
+        self._uploads += 1
+        payload = data if self._uploads % TRACE_PAYLOAD_EVERY == 1 else None
+        trace = UploadTrace(payload)
+        trace.fields = len(data)
+        return trace
+
+    def finish(self, trace: UploadTrace) -> None:
+        """Log trace record."""
+
+        _LOGGER.log(self._level, "%s", trace)
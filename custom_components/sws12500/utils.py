@@ -2,12 +2,11 @@
 
 import logging
 import math
-from pathlib import Path
 import sqlite3
+from pathlib import Path
 from typing import Any
 
 import numpy as np
-
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -16,7 +15,6 @@ from homeassistant.helpers.translation import async_get_translations
 from .const import (
     AZIMUT,
     DATABASE_PATH,
-    DEV_DBG,
     OUTSIDE_HUMIDITY,
     OUTSIDE_TEMP,
     REMAP_ITEMS,
@@ -147,20 +145,14 @@ def check_disabled(
     Returns list of found sensors or None
     """
 
-    log: bool = config_entry.options.get(DEV_DBG, False)
     entityFound: bool = False
     _loaded_sensors = loaded_sensors(config_entry)
     missing_sensors: list = []
 
     for item in items:
-        if log:
-            _LOGGER.info("Checking %s", item)
-
         if item not in _loaded_sensors:
             missing_sensors.append(item)
             entityFound = True
-            if log:
-                _LOGGER.info("Add sensor (%s) to loading queue", item)
 
     return missing_sensors if entityFound else None
 
@@ -218,27 +210,44 @@ def celsius_to_fahrenheit(celsius: float) -> float:
     return celsius * 9.0 / 5.0 + 32
 
 
-def heat_index(data: Any, convert: bool = False) -> float | None:
+def inhg_to_hpa(inhg: float) -> float:
+    """Convert inches of mercury to hPa."""
+    return inhg * 33.8639
+
+
+def mph_to_ms(mph: float) -> float:
+    """Convert miles per hour to meters per second."""
+    return mph * 0.44704
+
+
+def ms_to_mph(ms: float) -> float:
+    """Convert meters per second to miles per hour."""
+    return ms / 0.44704
+
+
+def inch_to_mm(inch: float) -> float:
+    """Convert inches to millimeters."""
+    return inch * 25.4
+
+
+def heat_index(data: Any) -> float | None:
     """Calculate heat index from temperature.
 
-    data: dict with temperature and humidity
-    convert: bool, convert recieved data from Celsius to Fahrenheit
+    data: dict with temperature (°C) and humidity
+    Returns heat index in °C
     """
 
     temp = data.get(OUTSIDE_TEMP, None)
     rh = data.get(OUTSIDE_HUMIDITY, None)
 
-    if not temp or not rh:
+    if temp is None or rh is None:
         return None
 
-    temp = float(temp)
+    temp = celsius_to_fahrenheit(float(temp))
     rh = float(rh)
 
     adjustment = None
 
-    if convert:
-        temp = celsius_to_fahrenheit(temp)
-
     simple = 0.5 * (temp + 61.0 + ((temp - 68.0) * 1.2) + (rh * 0.094))
     if ((simple + temp) / 2) > 80:
         full_index = (
@@ -258,41 +267,43 @@ def heat_index(data: Any, convert: bool = False) -> float | None:
         if rh > 80 and (temp in np.arange(80, 87, 0.1)):
             adjustment = ((rh - 85) / 10) * ((87 - temp) / 5)
 
-        return round((full_index + adjustment if adjustment else full_index), 2)
+        return round(
+            fahrenheit_to_celsius(
+                full_index + adjustment if adjustment else full_index
+            ),
+            2,
+        )
 
-    return simple
+    return round(fahrenheit_to_celsius(simple), 2)
 
 
-def chill_index(data: Any, convert: bool = False) -> float | None:
+def chill_index(data: Any) -> float | None:
     """Calculate wind chill index from temperature and wind speed.
 
-    data: dict with temperature and wind speed
-    convert: bool, convert recieved data from Celsius to Fahrenheit
+    data: dict with temperature (°C) and wind speed (m/s)
+    Returns wind chill in °C
     """
 
     temp = data.get(OUTSIDE_TEMP, None)
     wind = data.get(WIND_SPEED, None)
 
-    if not temp or not wind:
+    if temp is None or wind is None:
         return None
 
-    temp = float(temp)
-    wind = float(wind)
+    temp = celsius_to_fahrenheit(float(temp))
+    wind = ms_to_mph(float(wind))
 
-    if convert:
-        temp = celsius_to_fahrenheit(temp)
-
-    return (
-        round(
+    return round(
+        fahrenheit_to_celsius(
             (
                 (35.7 + (0.6215 * temp))
                 - (35.75 * (wind**0.16))
                 + (0.4275 * (temp * (wind**0.16)))
-            ),
-            2,
-        )
-        if temp < 50 and wind > 3
-        else temp
+            )
+            if temp < 50 and wind > 3
+            else temp
+        ),
+        2,
     )
 
 
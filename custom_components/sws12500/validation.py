@@ -0,0 +1,165 @@
+"""Validation of decoded uploads."""
+
+import logging
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    SPIKE_MIN_SAMPLES,
+    SPIKE_SCALES,
+    SPIKE_THRESHOLD,
+    SPIKE_WINDOW,
+    VALID_RANGES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RollingMedian:
+    """Median and MAD of the last `size` samples.
+
+    Samples are also kept sorted, so the median is read in O(1) and the
+    MAD is found by walking outwards from the median in O(size), without
+    sorting deviations. The window has a small fixed size, so the cost per
+    sample does not grow with the stream.
+    """
+
+    __slots__ = ("_order", "_sorted", "rejected_in_row")
+
+    def __init__(self, size: int) -> None:
+        """Init."""
+        self._order: deque[float] = deque(maxlen=size)
+        self._sorted: list[float] = []
+        self.rejected_in_row = 0
+
+    def __len__(self) -> int:
+        """Return number of samples."""
+        return len(self._order)
+
+    def add(self, value: float) -> None:
+        """Add sample, drop the oldest one when full."""
+
+        if len(self._order) == self._order.maxlen:
+            del self._sorted[bisect_left(self._sorted, self._order[0])]
+        self._order.append(value)
+        insort(self._sorted, value)
+
+    def clear(self) -> None:
+        """Drop all samples."""
+
+        self._order.clear()
+        self._sorted.clear()
+
+    def median(self) -> float:
+        """Return median."""
+
+        values = self._sorted
+        mid = len(values) // 2
+        if len(values) % 2:
+            return values[mid]
+        return (values[mid - 1] + values[mid]) / 2
+
+    def mad(self, median: float) -> float:
+        """Return median absolute deviation."""
+
+        values = self._sorted
+        count = len(values)
+        # deviations below and above the median are both sorted, merge them
+        # in ascending order up to the middle one
+        high = bisect_left(values, median)
+        low = high - 1
+        previous = deviation = 0.0
+        for _ in range(count // 2 + 1):
+            if high >= count or (
+                low >= 0 and median - values[low] <= values[high] - median
+            ):
+                previous, deviation = deviation, median - values[low]
+                low -= 1
+            else:
+                previous, deviation = deviation, values[high] - median
+                high += 1
+
+        if count % 2:
+            return deviation
+        return (previous + deviation) / 2
+
+
+class UploadValidator:
+    """Reject values outside physical range and spikes against history."""
+
+    def __init__(self) -> None:
+        """Init."""
+        self.windows: dict[str, RollingMedian] = {
+            key: RollingMedian(SPIKE_WINDOW) for key in SPIKE_SCALES
+        }
+        self.rejected: dict[str, int] = {}
+        self.checked = 0
+
+    def _reject(self, key: str, value: float, reason: str) -> None:
+        self.rejected[key] = self.rejected.get(key, 0) + 1
+        _LOGGER.debug("Rejected %s = %s (%s)", key, value, reason)
+
+    def _is_spike(self, key: str, value: float, learn: bool) -> bool:
+        """Check value against rolling median of field."""
+
+        window = self.windows[key]
+        if len(window) >= SPIKE_MIN_SAMPLES:
+            median = window.median()
+            # 1.4826 * MAD estimates standard deviation of normal distribution
+            scale = max(1.4826 * window.mad(median), SPIKE_SCALES[key])
+            if abs(value - median) > SPIKE_THRESHOLD * scale:
+                if not learn:
+                    return True
+                window.rejected_in_row += 1
+                if window.rejected_in_row < SPIKE_MIN_SAMPLES:
+                    return True
+                # level really changed, start over from new value
+                window.clear()
+
+        if learn:
+            window.rejected_in_row = 0
+            window.add(value)
+        return False
+
+    def validate(self, data: dict[str, Any], learn: bool = True) -> set[str]:
+        """Remove invalid values from data, return rejected keys.
+
+        With learn=False values are checked against the windows without
+        being added to them, used for replayed and late uploads.
+        """
+
+        rejected: set[str] = set()
+
+        for key, value in data.items():
+            if not isinstance(value, float):
+                continue
+            self.checked += 1
+
+            if (limits := VALID_RANGES.get(key)) is not None and not (
+                limits[0] <= value <= limits[1]
+            ):
+                self._reject(key, value, "out of range")
+                rejected.add(key)
+            elif key in self.windows and self._is_spike(key, value, learn):
+                self._reject(key, value, "spike")
+                rejected.add(key)
+
+        for key in rejected:
+            del data[key]
+
+        return rejected
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return rejected counts."""
+
+        return {"checked": self.checked, "rejected": dict(self.rejected)}
+
+
+def purge_rejected(
+    data: Mapping[str, Any], remap: Mapping[str, str], rejected: set[str]
+) -> dict[str, Any]:
+    """Return raw upload without fields rejected by validation."""
+
+    return {key: value for key, value in data.items() if remap.get(key) not in rejected}
@@ -0,0 +1,186 @@
+"""HTTP views of SWS12500."""
+
+import json
+import logging
+import math
+import time
+import zlib
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.components.recorder import get_instance
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    BULK_MAX_BYTES,
+    BULK_MAX_SKEW,
+    BULK_MAX_UPLOADS,
+    BULK_URL,
+    DOMAIN,
+    EXPORT_CSV,
+    EXPORT_JSONL,
+    EXPORT_URL,
+    WSLINK,
+)
+from .export import export_name, export_stream, resolve_fields
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def decode_batch(body: bytes, gzipped: bool) -> tuple[bool, list[tuple[float, dict]]]:
+    """Decode batch of uploads sent by gateway.
+
+    Batch is JSON object {"wslink": bool, "uploads": [[timestamp, {...}], ...]}.
+    Raises ValueError or TypeError on malformed batch, including timestamps
+    that are not finite or lie in the future. Runs in executor.
+    """
+
+    if gzipped:
+        decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        body = decompressor.decompress(body, BULK_MAX_BYTES)
+        if decompressor.unconsumed_tail:
+            raise ValueError("Batch is too large")
+
+    batch = json.loads(body)
+    if not isinstance(batch, dict):
+        raise TypeError("Invalid batch")
+
+    uploads = batch.get("uploads")
+    if not isinstance(uploads, list) or len(uploads) > BULK_MAX_UPLOADS:
+        raise ValueError("Invalid list of uploads")
+
+    latest = time.time() + BULK_MAX_SKEW
+    decoded: list[tuple[float, dict]] = []
+    for upload in uploads:
+        timestamp, data = upload
+        if not isinstance(data, dict):
+            raise TypeError("Invalid upload")
+        timestamp = float(timestamp)
+        if not math.isfinite(timestamp) or timestamp > latest:
+            raise ValueError(f"Invalid upload timestamp {timestamp}")
+        decoded.append(
+            (timestamp, {str(key): str(value) for key, value in data.items()})
+        )
+
+    decoded.sort(key=lambda upload: upload[0])
+    return bool(batch.get("wslink")), decoded
+
+
+def _coordinator(hass: HomeAssistant) -> Any | None:
+    """Return coordinator of the configured station."""
+
+    for value in hass.data.get(DOMAIN, {}).values():
+        if hasattr(value, "async_ingest_batch"):
+            return value
+    return None
+
+
+class BulkIngestView(HomeAssistantView):
+    """Accept batches of buffered uploads from the gateway."""
+
+    url = BULK_URL
+    name = "api:sws12500:bulk"
+    requires_auth = True
+
+    async def post(self, request: web.Request) -> web.Response:
+        """Apply batch in one coordinator update."""
+
+        hass: HomeAssistant = request.app[KEY_HASS]
+
+        if (coordinator := _coordinator(hass)) is None:
+            return self.json_message(
+                "Weather station is not configured", HTTPStatus.SERVICE_UNAVAILABLE
+            )
+
+        body = await request.read()
+        try:
+            wslink, uploads = await hass.async_add_executor_job(
+                decode_batch, body, request.headers.get("Content-Encoding") == "gzip"
+            )
+        except (ValueError, TypeError, zlib.error) as ex:
+            _LOGGER.error("Invalid batch from gateway: %s", ex)
+            return self.json_message("Invalid batch", HTTPStatus.BAD_REQUEST)
+
+        if wslink != bool(coordinator.config.options.get(WSLINK)):
+            return self.json_message(
+                "Batch protocol does not match configuration", HTTPStatus.CONFLICT
+            )
+
+        accepted = await coordinator.async_ingest_batch(uploads, wslink)
+        return self.json({"accepted": accepted})
+
+
+class ExportView(HomeAssistantView):
+    """Download station history as CSV or JSON Lines."""
+
+    url = EXPORT_URL
+    name = "api:sws12500:export"
+    requires_auth = True
+
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Stream export, one database chunk at a time."""
+
+        hass: HomeAssistant = request.app[KEY_HASS]
+        query = request.query
+
+        if "recorder" not in hass.config.components:
+            return self.json_message(
+                "Recorder is not running", HTTPStatus.SERVICE_UNAVAILABLE
+            )
+
+        start = dt_util.parse_datetime(query.get("start", ""))
+        end = (
+            dt_util.parse_datetime(query["end"]) if "end" in query else dt_util.utcnow()
+        )
+        fmt = query.get("format", EXPORT_CSV)
+        compress = query.get("gzip", "") in ("1", "true")
+
+        if start is None or end is None or fmt not in (EXPORT_CSV, EXPORT_JSONL):
+            return self.json_message(
+                "Provide start, end as ISO datetime and format csv or jsonl",
+                HTTPStatus.BAD_REQUEST,
+            )
+
+        start = dt_util.as_utc(start)
+        end = dt_util.as_utc(end)
+        fields = [field for field in query.get("fields", "").split(",") if field]
+        stream = export_stream(
+            hass,
+            resolve_fields(hass, fields),
+            start.timestamp(),
+            end.timestamp(),
+            fmt,
+            compress,
+        )
+
+        if compress:
+            content_type = "application/gzip"
+        elif fmt == EXPORT_CSV:
+            content_type = "text/csv"
+        else:
+            content_type = "application/jsonl"
+
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": content_type,
+                "Content-Disposition": (
+                    f'attachment; filename="{export_name(start, end, fmt, compress)}"'
+                ),
+            }
+        )
+        await response.prepare(request)
+
+        recorder = get_instance(hass)
+        try:
+            while (
+                block := await recorder.async_add_executor_job(next, stream, None)
+            ) is not None:
+                await response.write(block)
+        finally:
+            await recorder.async_add_executor_job(stream.close)
+
+        await response.write_eof()
+        return response
@@ -0,0 +1,273 @@
+"""Weather entity for SWS12500."""
+
+import math
+from typing import Any
+
+from homeassistant.components.weather import (
+    ATTR_CONDITION_CLEAR_NIGHT,
+    ATTR_CONDITION_CLOUDY,
+    ATTR_CONDITION_LIGHTNING_RAINY,
+    ATTR_CONDITION_PARTLYCLOUDY,
+    ATTR_CONDITION_POURING,
+    ATTR_CONDITION_RAINY,
+    ATTR_CONDITION_SUNNY,
+    ATTR_CONDITION_WINDY,
+    Forecast,
+    WeatherEntity,
+    WeatherEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfPressure, UnitOfSpeed, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.sun import get_astral_location, is_up
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from . import WeatherDataUpdateCoordinator
+from .const import (
+    BARO_PRESSURE,
+    CHILL_INDEX,
+    DEW_POINT,
+    DOMAIN,
+    HEAT_INDEX,
+    OUTSIDE_HUMIDITY,
+    OUTSIDE_TEMP,
+    RAIN,
+    RAIN_RATE,
+    SOLAR_RADIATION,
+    UV,
+    WIND_DIR,
+    WIND_GUST,
+    WIND_SPEED,
+    ZAMBRETTI_FORECAST,
+)
+
+# below this temperature wind chill is felt, above it heat index (°C)
+APPARENT_CHILL_BELOW = 10.0
+# heavy rain (mm/h) and strong breeze, Beaufort 6 (m/s)
+POURING_RATE = 7.6
+WINDY_SPEED = 10.8
+# Sky of dry and calm weather is the share of clear sky sunlight measured,
+# clear sky irradiance (W/m²) and UV index with the sun at zenith. With the
+# sun low diffuse light dominates and the forecast is used instead.
+CLEAR_SKY_IRRADIANCE = 1000.0
+CLEAR_SKY_UV = 12.5
+MIN_SUN_ELEVATION = 15.0
+SUNNY_CLEARNESS = 0.75
+PARTLYCLOUDY_CLEARNESS = 0.4
+
+# Condition of every Zambretti forecast, A (settled fine) to Z (stormy).
+FORECAST_CONDITIONS: dict[str, str] = {
+    **dict.fromkeys("abc", ATTR_CONDITION_SUNNY),
+    **dict.fromkeys("defghk", ATTR_CONDITION_PARTLYCLOUDY),
+    **dict.fromkeys("jlmq", ATTR_CONDITION_CLOUDY),
+    **dict.fromkeys("inoprstuvw", ATTR_CONDITION_RAINY),
+    "x": ATTR_CONDITION_POURING,
+    **dict.fromkeys("yz", ATTR_CONDITION_LIGHTNING_RAINY),
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Weather Station weather entity."""
+
+    coordinator: WeatherDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities([StationWeather(coordinator)])
+
+
+def _number(data: dict[str, Any], key: str) -> float | None:
+    value = data.get(key)
+    return value if isinstance(value, float) else None
+
+
+def sun_elevation(hass: HomeAssistant) -> float:
+    """Return current elevation of the sun at home in degrees."""
+
+    location, elevation = get_astral_location(hass)
+    return location.solar_elevation(dt_util.utcnow(), elevation)
+
+
+def clearness(data: dict[str, Any], elevation: float) -> float | None:
+    """Return measured share of clear sky sunlight, None if not measured."""
+
+    height = math.sin(math.radians(elevation))
+    if (radiation := _number(data, SOLAR_RADIATION)) is not None:
+        return radiation / (CLEAR_SKY_IRRADIANCE * height)
+    if (uv := _number(data, UV)) is not None:
+        # UV index falls steeper than irradiance with the sun lower
+        return uv / (CLEAR_SKY_UV * height**2.42)
+    return None
+
+
+class StationWeather(  # pyright: ignore[reportIncompatibleVariableOverride]
+    CoordinatorEntity[WeatherDataUpdateCoordinator], WeatherEntity
+):  # pyright: ignore[reportIncompatibleVariableOverride]
+    """Current conditions read directly from decoded uploads.
+
+    Values come from the coordinator's record in canonical units, so
+    nothing is converted or rendered here and every upload makes exactly
+    one state write. The condition is what the station observes, the
+    local Zambretti forecast is offered as twice daily forecast and fills
+    in the sky the station can not see.
+    """
+
+    _attr_has_entity_name = True
+    _attr_name = None
+    _attr_should_poll = False
+    _attr_unique_id = "weather"
+    _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_native_pressure_unit = UnitOfPressure.HPA
+    _attr_native_wind_speed_unit = UnitOfSpeed.METERS_PER_SECOND
+    _attr_supported_features = WeatherEntityFeature.FORECAST_TWICE_DAILY
+
+    def __init__(self, coordinator: WeatherDataUpdateCoordinator) -> None:
+        """Initialize weather entity."""
+        super().__init__(coordinator)
+        self._data: dict[str, Any] = {}
+        self._forecast: str | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Take values of upload and write state once."""
+
+        self._data = self.coordinator.data or {}
+        # forecast is missing until there is enough pressure history
+        forecast = self._data.get(ZAMBRETTI_FORECAST)
+        if forecast and forecast != self._forecast:
+            self._forecast = forecast
+            self.hass.async_create_task(
+                self.async_update_listeners(("twice_daily",)), eager_start=True
+            )
+        self.async_write_ha_state()
+
+    @property
+    def condition(self) -> str | None:
+        """Return condition observed by the station.
+
+        Rain and wind are measured. When dry and calm, the sky is estimated
+        from solar radiation or UV, and from the Zambretti forecast when the
+        sun is low or neither is measured.
+        """
+
+        rate = _number(self._data, RAIN_RATE)
+        if rate is None:
+            rate = _number(self._data, RAIN)
+        if rate and rate >= POURING_RATE:
+            return ATTR_CONDITION_POURING
+        if rate:
+            return ATTR_CONDITION_RAINY
+
+        if (speed := _number(self._data, WIND_SPEED)) and speed >= WINDY_SPEED:
+            return ATTR_CONDITION_WINDY
+        return self._sky()
+
+    def _sky(self) -> str | None:
+        """Return sky condition of dry and calm weather."""
+
+        elevation = sun_elevation(self.hass)
+        if (
+            elevation >= MIN_SUN_ELEVATION
+            and (ratio := clearness(self._data, elevation)) is not None
+        ):
+            if ratio >= SUNNY_CLEARNESS:
+                return ATTR_CONDITION_SUNNY
+            if ratio >= PARTLYCLOUDY_CLEARNESS:
+                return ATTR_CONDITION_PARTLYCLOUDY
+            return ATTR_CONDITION_CLOUDY
+
+        if (condition := FORECAST_CONDITIONS.get(self._forecast or "")) is None:
+            return None
+        if condition == ATTR_CONDITION_SUNNY:
+            return (
+                ATTR_CONDITION_SUNNY if is_up(self.hass) else ATTR_CONDITION_CLEAR_NIGHT
+            )
+        # rain is forecast, but it is dry yet
+        return (
+            condition
+            if condition == ATTR_CONDITION_PARTLYCLOUDY
+            else ATTR_CONDITION_CLOUDY
+        )
+
+    async def async_forecast_twice_daily(self) -> list[Forecast] | None:
+        """Return local Zambretti forecast for the next twelve hours."""
+
+        if (condition := FORECAST_CONDITIONS.get(self._forecast or "")) is None:
+            return None
+
+        daytime = is_up(self.hass)
+        if condition == ATTR_CONDITION_SUNNY and not daytime:
+            condition = ATTR_CONDITION_CLEAR_NIGHT
+        return [
+            Forecast(
+                condition=condition,
+                datetime=dt_util.utcnow().isoformat(),
+                is_daytime=daytime,
+            )
+        ]
+
+    @property
+    def native_temperature(self) -> float | None:
+        """Return outside temperature."""
+        return _number(self._data, OUTSIDE_TEMP)
+
+    @property
+    def native_apparent_temperature(self) -> float | None:
+        """Return wind chill in cold weather, heat index otherwise."""
+
+        if (temperature := self.native_temperature) is None:
+            return None
+        key = CHILL_INDEX if temperature < APPARENT_CHILL_BELOW else HEAT_INDEX
+        return _number(self._data, key)
+
+    @property
+    def humidity(self) -> float | None:
+        """Return outside humidity."""
+        return _number(self._data, OUTSIDE_HUMIDITY)
+
+    @property
+    def native_dew_point(self) -> float | None:
+        """Return dew point."""
+        return _number(self._data, DEW_POINT)
+
+    @property
+    def native_pressure(self) -> float | None:
+        """Return sea level pressure."""
+        return _number(self._data, BARO_PRESSURE)
+
+    @property
+    def native_wind_speed(self) -> float | None:
+        """Return wind speed."""
+        return _number(self._data, WIND_SPEED)
+
+    @property
+    def native_wind_gust_speed(self) -> float | None:
+        """Return wind gust."""
+        return _number(self._data, WIND_GUST)
+
+    @property
+    def wind_bearing(self) -> float | None:
+        """Return wind direction."""
+        return _number(self._data, WIND_DIR)
+
+    @property
+    def uv_index(self) -> float | None:
+        """Return UV index."""
+        return _number(self._data, UV)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Device info."""
+        return DeviceInfo(
+            connections=set(),
+            name="Weather Station SWS 12500",
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN,)},  # type: ignore[arg-type]
+            manufacturer="Schizza",
+            model="Weather Station SWS 12500",
+        )
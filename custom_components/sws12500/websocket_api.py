@@ -0,0 +1,111 @@
+"""Websocket API of SWS12500."""
+
+from dataclasses import asdict
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, HISTORY_WINDOW, WS_HISTORY, WS_SUBSCRIBE
+
+
+@callback
+def async_register_websocket_api(hass: HomeAssistant) -> None:
+    """Register websocket commands."""
+
+    websocket_api.async_register_command(hass, websocket_subscribe)
+    websocket_api.async_register_command(hass, websocket_history)
+
+
+def _coordinator(hass: HomeAssistant, msg: dict[str, Any]) -> Any | None:
+    """Return coordinator of entry in msg, or the first loaded one."""
+
+    coordinators = hass.data.get(DOMAIN, {})
+    if "entry_id" in msg:
+        coordinator = coordinators.get(msg["entry_id"])
+    else:
+        coordinator = next(
+            (value for value in coordinators.values() if hasattr(value, "live")),
+            None,
+        )
+
+    if coordinator is None or not hasattr(coordinator, "live"):
+        return None
+    return coordinator
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): WS_SUBSCRIBE, vol.Optional("entry_id"): str}
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream decoded observations, snapshot first, then changed fields."""
+
+    if (coordinator := _coordinator(hass, msg)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Weather station not found"
+        )
+        return
+
+    # event is already serialized, only the envelope is built per subscriber
+    prefix = f'{{"id":{msg["id"]},"type":"event","event":'
+
+    @callback
+    def send(event: str) -> None:
+        connection.send_message(f"{prefix}{event}}}")
+
+    @callback
+    def closed() -> None:
+        # station was unloaded, nothing more will be sent
+        connection.subscriptions.pop(msg["id"], None)
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Weather station was unloaded"
+        )
+
+    # acknowledge the subscription before its first event
+    connection.send_result(msg["id"])
+    connection.subscriptions[msg["id"]] = coordinator.live.subscribe(send, closed)
+    send(coordinator.live.snapshot())
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_HISTORY,
+        vol.Required("field"): str,
+        vol.Optional("entry_id"): str,
+        vol.Optional("last", default=10): vol.All(int, vol.Range(min=1)),
+        vol.Optional("window", default=HISTORY_WINDOW): vol.All(
+            vol.Coerce(float), vol.Range(min=1)
+        ),
+    }
+)
+@callback
+def websocket_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return recent samples, window statistics and rate of change of field."""
+
+    if (coordinator := _coordinator(hass, msg)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Weather station not found"
+        )
+        return
+
+    history = coordinator.history
+    field = msg["field"]
+    stats = history.stats(field, msg["window"])
+    connection.send_result(
+        msg["id"],
+        {
+            "last": history.last(field, msg["last"]),
+            "stats": asdict(stats) if stats is not None else None,
+            "rate": history.rate(field, msg["window"]),
+        },
+    )
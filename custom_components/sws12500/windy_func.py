@@ -1,17 +1,19 @@
 """Windy functions."""
 
-from datetime import datetime, timedelta
 import logging
+from datetime import UTC, datetime
 
 from aiohttp.client_exceptions import ClientError
-
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from yarl import URL
 
+from .aggregate import IntervalAggregator
 from .const import (
+    AGGREGATE_ITEMS,
     PURGE_DATA,
     WINDY_ENABLED,
+    WINDY_INTERVAL,
     WINDY_INVALID_KEY,
     WINDY_LOGGER_ENABLED,
     WINDY_NOT_INSERTED,
@@ -21,6 +23,8 @@ from .const import (
     WINDY_UNEXPECTED,
     WINDY_URL,
 )
+from .forwarder import ForwarderScheduler, ForwarderSession
+from .trace import Anonymized
 from .utils import update_options
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,14 +44,6 @@ class WindyApiKeyError(Exception):
     """Windy API Key error."""
 
 
-def timed(minutes: int):
-    """Simulate timedelta.
-
-    So we can mock td in tests.
-    """
-    return timedelta(minutes=minutes)
-
-
 class WindyPush:
     """Push data to Windy."""
 
@@ -59,12 +55,35 @@ class WindyPush:
         """ lets wait for 1 minute to get initial data from station
             and then try to push first data to Windy
         """
-        self.last_update = datetime.now()
-        self.next_update = datetime.now() + timed(minutes=1)
+        self.scheduler = ForwarderScheduler(
+            hass, interval=WINDY_INTERVAL, initial_delay=60, send=self._send_pending
+        )
+        self.aggregator = IntervalAggregator(AGGREGATE_ITEMS)
+        self._wslink = False
 
         self.log = self.config.options.get(WINDY_LOGGER_ENABLED)
         self.invalid_response_count = 0
 
+        # Request templates, credentials do not change without reload.
+        self._url = URL(WINDY_URL)
+        self._station_id = self.config.options.get(WINDY_STATION_ID)
+        self._headers = {
+            "Authorization": f"Bearer {self.config.options.get(WINDY_STATION_PW)}"
+        }
+
+        # Windy accepts data every 5 minutes, keep connection open a bit longer.
+        self.client = ForwarderSession(hass, "windy", keepalive_timeout=330)
+
+    @property
+    def configured(self) -> bool:
+        """Return True if pushing to Windy is enabled and has credentials."""
+
+        return bool(
+            self.config.options.get(WINDY_ENABLED)
+            and self._station_id
+            and self.config.options.get(WINDY_STATION_PW)
+        )
+
     def verify_windy_response(  # pylint: disable=useless-return
         self,
         response: str,
@@ -94,22 +113,51 @@ class WindyPush:
         Interval is 5 minutes, otherwise Windy would not accepts data.
 
         we are sending almost the same data as we received
-        from station. But we need to do some clean up.
+        from station, averaged over the interval. But we need to do
+        some clean up.
         """
 
-        text_for_test = None
+        self.aggregator.add(data)
+        self._wslink = wslink
+
+        if not self.scheduler.due():
+            self.scheduler.defer()
+            return False
+
+        return await self._send_pending()
+
+    async def _send_pending(self):
+        """Send data aggregated over the interval to Windy."""
+
+        if not self.aggregator.samples:
+            return None
+
+        data = self.aggregator.result()
+        self.aggregator.reset()
+        self.scheduler.sent()
+
+        response = await self._send(data, self._wslink)
 
         if self.log:
-            _LOGGER.info(
-                "Windy last update = %s, next update at: %s",
-                str(self.last_update),
-                str(self.next_update),
-            )
+            _LOGGER.info("Next Windy update in %.0f s", self.scheduler.remaining())
 
-        if self.next_update > datetime.now():
-            return False
+        return response
+
+    async def push_archived(self, data, wslink: bool, timestamp: float):
+        """Push archived observation to Windy with its original time."""
+
+        observed = datetime.fromtimestamp(timestamp, UTC)
+        return await self._send(data, wslink, observed.strftime("%Y-%m-%dT%H:%M:%SZ"))
+
+    async def _send(self, purged_data, wslink: bool, observed: str = "now"):
+        """Clean up data and send them to Windy."""
+
+        text_for_test = None
 
-        purged_data = data.copy()
+        if self.client.closed:
+            # late upload of unloaded entry
+            _LOGGER.debug("Windy forwarder is closed, data not sent")
+            return None
 
         for purge in PURGE_DATA:
             if purge in purged_data:
@@ -138,22 +186,14 @@ class WindyPush:
             if "t1solrad" in purged_data:
                 purged_data["solarradiation"] = purged_data.pop("t1solrad")
 
-        windy_station_id = self.config.options.get(WINDY_STATION_ID)
-        windy_station_pw = self.config.options.get(WINDY_STATION_PW)
-
-        request_url = f"{WINDY_URL}"
-
-        purged_data["id"] = windy_station_id
-        purged_data["time"] = "now"
-
-        headers = {"Authorization": f"Bearer {windy_station_pw}"}
+        purged_data["id"] = self._station_id
+        purged_data["time"] = observed
 
         if self.log:
-            _LOGGER.info("Dataset for windy: %s", purged_data)
-        session = async_get_clientsession(self.hass, verify_ssl=False)
+            _LOGGER.info("Dataset for windy: %s", Anonymized(purged_data))
         try:
-            async with session.get(
-                request_url, params=purged_data, headers=headers
+            async with self.client.session.get(
+                self._url, params=purged_data, headers=self._headers
             ) as resp:
                 status = await resp.text()
                 try:
@@ -184,12 +224,6 @@ class WindyPush:
                 text_for_test = WINDY_UNEXPECTED
                 await update_options(self.hass, self.config, WINDY_ENABLED, False)
 
-        self.last_update = datetime.now()
-        self.next_update = self.last_update + timed(minutes=5)
-
-        if self.log:
-            _LOGGER.info("Next update: %s", str(self.next_update))
-
         if RESPONSE_FOR_TEST and text_for_test:
             return text_for_test
         return None
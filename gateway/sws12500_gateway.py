@@ -0,0 +1,347 @@
+"""Standalone ingest gateway for SWS12500 stations.
+
+Receives station uploads on a remote site, stores them in a local spool
+file and forwards them to Home Assistant in gzip compressed batches. When
+the link to Home Assistant is down, uploads stay in the spool and are sent
+once it is back.
+
+    python sws12500_gateway.py --station-id ID --station-key KEY \
+        --ha-url http://homeassistant.local:8123 --token LONG_LIVED_TOKEN
+
+Only aiohttp is required. Field tables are loaded from the integration's
+const.py, so the gateway stores exactly the fields the integration decodes.
+"""
+
+import argparse
+import asyncio
+import gzip
+import hmac
+import importlib.util
+import json
+import logging
+import os
+import ssl
+import time
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+_LOGGER = logging.getLogger("sws12500_gateway")
+
+CONST_PATH = (
+    Path(__file__).resolve().parents[1] / "custom_components" / "sws12500" / "const.py"
+)
+SPOOL = "spool.jsonl"
+OFFSET = "spool.offset"
+# statuses for which a batch is dropped, any other non-200 status is retried
+DROPPED_STATUSES = (400, 413)
+
+
+def load_const(path: Path):
+    """Load integration constants without importing Home Assistant."""
+
+    spec = importlib.util.spec_from_file_location("sws12500_const", path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Unable to load {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def ssl_context(args: argparse.Namespace) -> ssl.SSLContext | None:
+    """Return server context of --certfile/--keyfile, None for plain HTTP."""
+
+    if not args.certfile:
+        return None
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(args.certfile, args.keyfile)
+    return context
+
+
+class Spool:
+    """Append-only file of uploads with offset of the first unsent one.
+
+    Records are JSON lines [timestamp, fields]. Every append is fsynced
+    before the station gets its answer, and the offset is replaced
+    atomically after Home Assistant accepted a batch.
+    """
+
+    def __init__(self, path: Path, compact_size: int) -> None:
+        """Init."""
+        path.mkdir(parents=True, exist_ok=True)
+        self._spool = path / SPOOL
+        self._offset_file = path / OFFSET
+        self._compact_size = compact_size
+        self._lock = asyncio.Lock()
+
+        self.offset = (
+            int(self._offset_file.read_text() or 0) if self._offset_file.exists() else 0
+        )
+        self._spool.touch()
+
+    async def append(self, timestamp: float, data: dict[str, str]) -> None:
+        """Append upload and wait until it is on disk."""
+
+        line = (json.dumps([timestamp, data], separators=(",", ":")) + "\n").encode()
+        async with self._lock:
+            await asyncio.to_thread(self._append, line)
+
+    def _append(self, line: bytes) -> None:
+        with self._spool.open("ab") as file:
+            file.write(line)
+            file.flush()
+            os.fsync(file.fileno())
+
+    async def read(self, limit: int) -> tuple[list[list], int]:
+        """Return up to `limit` unsent uploads and offset after them."""
+
+        async with self._lock:
+            return await asyncio.to_thread(self._read, limit)
+
+    def _read(self, limit: int) -> tuple[list[list], int]:
+        uploads: list[list] = []
+        with self._spool.open("rb") as file:
+            file.seek(self.offset)
+            end = self.offset
+            for line in file:
+                if not line.endswith(b"\n"):
+                    # partial write, will be completed or overwritten later
+                    break
+                end += len(line)
+                try:
+                    uploads.append(json.loads(line))
+                except ValueError:
+                    _LOGGER.warning("Skipping damaged spool record")
+                if len(uploads) >= limit:
+                    break
+        return uploads, end
+
+    async def commit(self, offset: int) -> None:
+        """Mark uploads up to offset as sent, compact spool when drained."""
+
+        async with self._lock:
+            await asyncio.to_thread(self._commit, offset)
+
+    def _commit(self, offset: int) -> None:
+        if offset >= self._compact_size and offset == self._spool.stat().st_size:
+            self._spool.write_bytes(b"")
+            offset = 0
+
+        tmp = self._offset_file.with_suffix(".tmp")
+        tmp.write_text(str(offset))
+        os.replace(tmp, self._offset_file)
+        self.offset = offset
+
+    def pending_bytes(self) -> int:
+        """Return size of unsent part of spool."""
+        return self._spool.stat().st_size - self.offset
+
+
+class Gateway:
+    """Receive station uploads and forward them to Home Assistant."""
+
+    def __init__(self, args: argparse.Namespace, const) -> None:
+        """Init."""
+        self.args = args
+        self.const = const
+        self.spool = Spool(Path(args.spool), args.compact_size)
+
+        if args.wslink:
+            self._fields = frozenset(const.REMAP_WSLINK_ITEMS)
+            self._credentials = ("wsid", "wspw")
+        else:
+            self._fields = frozenset(const.REMAP_ITEMS)
+            self._credentials = ("ID", "PASSWORD")
+
+        self._id = args.station_id.encode()
+        self._key = args.station_key.encode()
+        self._wakeup = asyncio.Event()
+
+    async def handle_upload(self, request: web.Request) -> web.Response:
+        """Store authorized upload."""
+
+        query = request.query
+        api_id = query.get(self._credentials[0], "").encode()
+        api_key = query.get(self._credentials[1], "").encode()
+        id_ok = hmac.compare_digest(api_id, self._id)
+        key_ok = hmac.compare_digest(api_key, self._key)
+        if not (id_ok and key_ok):
+            raise web.HTTPUnauthorized
+
+        data = {key: value for key, value in query.items() if key in self._fields}
+        await self.spool.append(time.time(), data)
+
+        if self.spool.pending_bytes() >= self.args.batch_bytes:
+            self._wakeup.set()
+
+        return web.Response(text="OK")
+
+    async def forward(self) -> None:
+        """Send spooled uploads in batches, back off while HA is unreachable."""
+
+        url = self.args.ha_url.rstrip("/") + self.const.BULK_URL
+        headers = {
+            "Authorization": f"Bearer {self.args.token}",
+            "Content-Encoding": "gzip",
+            "Content-Type": "application/json",
+        }
+        delay = self.args.interval
+
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as session:
+            while True:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+                try:
+                    while await self._send_batch(session, url, headers):
+                        pass
+                except (aiohttp.ClientError, TimeoutError) as ex:
+                    delay = min(delay * 2, self.args.max_backoff)
+                    _LOGGER.warning(
+                        "Home Assistant refused or unreachable (%s), "
+                        "%s bytes pending, retry in %s s",
+                        ex,
+                        self.spool.pending_bytes(),
+                        delay,
+                    )
+                else:
+                    delay = self.args.interval
+
+    async def _send_batch(
+        self, session: aiohttp.ClientSession, url: str, headers: dict[str, str]
+    ) -> bool:
+        """Send one batch, return True if more uploads are pending."""
+
+        uploads, offset = await self.spool.read(self.args.batch_size)
+        if not uploads:
+            # skip damaged records, if any
+            if offset != self.spool.offset:
+                await self.spool.commit(offset)
+            return False
+
+        body = gzip.compress(
+            json.dumps(
+                {"wslink": self.args.wslink, "uploads": uploads},
+                separators=(",", ":"),
+            ).encode()
+        )
+
+        async with session.post(url, data=body, headers=headers) as resp:
+            if resp.status in DROPPED_STATUSES:
+                # malformed batch, resending would not help
+                _LOGGER.error(
+                    "Batch of %s uploads rejected as malformed: %s %s",
+                    len(uploads),
+                    resp.status,
+                    await resp.text(),
+                )
+            elif resp.status != 200:
+                # HA down, integration not loaded, token expired, ...
+                # keep the batch spooled and retry after backoff
+                raise aiohttp.ClientResponseError(
+                    resp.request_info,
+                    resp.history,
+                    status=resp.status,
+                    message=await resp.text(),
+                )
+            else:
+                _LOGGER.info("Sent batch of %s uploads", len(uploads))
+
+        await self.spool.commit(offset)
+        return len(uploads) >= self.args.batch_size
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run listener and forwarder."""
+
+    const = load_const(Path(args.const))
+    gateway = Gateway(args, const)
+
+    app = web.Application()
+    app.router.add_get(const.DEFAULT_URL, gateway.handle_upload)
+    app.router.add_post(const.WSLINK_URL, gateway.handle_upload)
+
+    context = ssl_context(args)
+    if args.wslink and context is None:
+        _LOGGER.warning(
+            "WSLink stations upload over HTTPS, use --certfile and --keyfile "
+            "or put the gateway behind a TLS proxy"
+        )
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, port=args.port, ssl_context=context).start()
+    _LOGGER.info(
+        "Listening for station uploads on port %s (%s)",
+        args.port,
+        "HTTPS" if context else "HTTP",
+    )
+
+    try:
+        await gateway.forward()
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    """Parse arguments and run gateway."""
+
+    parser = argparse.ArgumentParser(description="SWS12500 ingest gateway")
+    parser.add_argument("--station-id", required=True)
+    parser.add_argument("--station-key", required=True)
+    parser.add_argument("--ha-url", required=True, help="Home Assistant base URL")
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("SWS12500_TOKEN"),
+        help="long-lived access token, defaults to $SWS12500_TOKEN",
+    )
+    parser.add_argument("--wslink", action="store_true", help="station uses WSLink")
+    parser.add_argument("--port", type=int, default=80)
+    parser.add_argument("--certfile", help="TLS certificate (chain) in PEM")
+    parser.add_argument("--keyfile", help="TLS private key in PEM")
+    parser.add_argument("--spool", default="spool", help="spool directory")
+    parser.add_argument(
+        "--interval", type=float, default=60, help="seconds between batches"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--batch-bytes",
+        type=int,
+        default=256 * 1024,
+        help="send before the interval ends when this much is pending",
+    )
+    parser.add_argument("--max-backoff", type=float, default=900)
+    parser.add_argument(
+        "--compact-size",
+        type=int,
+        default=16 * 1024 * 1024,
+        help="truncate drained spool above this size",
+    )
+    parser.add_argument("--const", default=str(CONST_PATH), help="path to const.py")
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+
+    if not args.token:
+        parser.error("--token or $SWS12500_TOKEN is required")
+    if args.keyfile and not args.certfile:
+        parser.error("--keyfile requires --certfile")
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Tests of the SWS12500 integration."""
@@ -0,0 +1,42 @@
+"""Fixtures of SWS12500 tests."""
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.sws12500 import WeatherDataUpdateCoordinator
+from custom_components.sws12500.const import DOMAIN, SENSORS_TO_LOAD, WSLINK
+
+pytest_plugins = ["pytest_homeassistant_custom_component"]
+
+
+@pytest.fixture
+def config_entry(hass) -> MockConfigEntry:
+    """Return WSLink entry with the main outdoor sensors loaded."""
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={
+            WSLINK: True,
+            SENSORS_TO_LOAD: [
+                "outside_temp",
+                "outside_humidity",
+                "baro_pressure",
+                "wind_speed",
+                "wind_gust",
+                "wind_dir",
+                "daily_rain",
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def coordinator(hass, config_entry) -> WeatherDataUpdateCoordinator:
+    """Return coordinator of the entry, shut down after the test."""
+
+    coordinator = WeatherDataUpdateCoordinator(hass, config_entry)
+    coordinator.config_entry = config_entry
+    yield coordinator
+    await coordinator.async_shutdown()
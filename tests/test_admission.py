@@ -0,0 +1,55 @@
+"""Tests of admission control of uploads."""
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.sws12500.admission import AdmissionControl, parse_sources
+
+MONOTONIC = "custom_components.sws12500.admission.time.monotonic"
+
+
+def test_parse_sources() -> None:
+    """Addresses and networks are separated by commas or semicolons."""
+
+    assert [str(network) for network in parse_sources("10.0.0.7; 192.168.1.0/24,")] == [
+        "10.0.0.7/32",
+        "192.168.1.0/24",
+    ]
+    assert parse_sources(None) == []
+    with pytest.raises(ValueError):
+        parse_sources("station.local")
+
+
+def test_allowlist() -> None:
+    """Only listed sources pass, an empty allowlist passes everybody."""
+
+    control = AdmissionControl(parse_sources("192.168.1.0/24"))
+
+    assert control.allowed("192.168.1.20")
+    assert not control.allowed("10.0.0.1")
+    assert not control.allowed("not an address")
+    assert control.diagnostics()["dropped_not_allowed"] == 2
+    assert AdmissionControl().allowed("10.0.0.1")
+
+
+def test_rate_limit_refills() -> None:
+    """A burst is admitted, then one upload per refilled token."""
+
+    control = AdmissionControl(rate=1.0, burst=3.0)
+
+    with patch(MONOTONIC, return_value=100.0):
+        assert [control.admit("10.0.0.1") for _ in range(4)] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+        # other sources have their own bucket
+        assert control.admit("10.0.0.2")
+
+    with patch(MONOTONIC, return_value=101.0):
+        assert control.admit("10.0.0.1")
+        assert not control.admit("10.0.0.1")
+
+    assert control.diagnostics()["dropped_rate_limited"] == 2
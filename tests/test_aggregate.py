@@ -0,0 +1,69 @@
+"""Tests of interval aggregation of uploads."""
+
+import pytest
+
+from custom_components.sws12500.aggregate import FieldAggregate, IntervalAggregator
+from custom_components.sws12500.const import AGGREGATE_ITEMS
+
+
+def test_field_running_statistics() -> None:
+    """Mean, min, max and last are kept without storing samples."""
+
+    field = FieldAggregate()
+    for value in (2.0, 8.0, 5.0):
+        field.add(value)
+
+    assert field.count == 3
+    assert field.mean == pytest.approx(5.0)
+    assert (field.min, field.max, field.last) == (2.0, 8.0, 5.0)
+
+
+@pytest.mark.parametrize(
+    ("directions", "expected"),
+    [
+        ((350.0, 10.0), 0.0),  # across north, not 180
+        ((80.0, 100.0), 90.0),
+        ((90.0, 270.0), 270.0),  # opposite directions cancel, last one wins
+    ],
+)
+def test_vector_averaged_direction(
+    directions: tuple[float, ...], expected: float
+) -> None:
+    """Directions are averaged as unit vectors."""
+
+    field = FieldAggregate()
+    for degrees in directions:
+        field.add_direction(degrees)
+
+    # angular difference, 359.999... equals 0
+    assert abs((field.direction() - expected + 180) % 360 - 180) < 1e-6
+
+
+def test_interval_result_by_kind() -> None:
+    """Fields are averaged, maximized or vector averaged, others keep last."""
+
+    aggregator = IntervalAggregator(AGGREGATE_ITEMS)
+    aggregator.add({"tempf": "50", "windgustmph": "10", "winddir": "350", "ID": "a"})
+    aggregator.add({"tempf": "51", "windgustmph": "7", "winddir": "10", "ID": "b"})
+    aggregator.add({"tempf": "invalid", "dailyrainin": "0.2"})
+
+    result = aggregator.result()
+
+    assert aggregator.samples == 3
+    assert result["tempf"] == 50.5
+    assert result["windgustmph"] == 10.0
+    assert result["winddir"] % 360 == 0
+    assert result["ID"] == "b"
+    assert result["dailyrainin"] == "0.2"
+
+
+def test_reset_starts_new_interval() -> None:
+    """Reset forgets samples and values of the previous interval."""
+
+    aggregator = IntervalAggregator(AGGREGATE_ITEMS)
+    aggregator.add({"tempf": "50", "ID": "a"})
+    aggregator.reset()
+    aggregator.add({"tempf": "60"})
+
+    assert aggregator.result() == {"tempf": 60.0}
+    assert aggregator.diagnostics()["samples"] == 1
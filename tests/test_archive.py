@@ -0,0 +1,104 @@
+"""Tests of the upload archive and its replay."""
+
+from pathlib import Path
+
+import pytest
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.sws12500.archive import (
+    SUFFIX,
+    encode_record,
+    read_segment,
+    segment_header,
+)
+from custom_components.sws12500.const import (
+    ARCHIVE_DIR,
+    DOMAIN,
+    REPLAY_WINDY,
+    SERVICE_REPLAY,
+    WINDY_ENABLED,
+    WINDY_STATION_ID,
+    WINDY_STATION_PW,
+)
+from custom_components.sws12500.services import async_setup_services
+
+
+def _segment(path: Path, records: list[tuple[float, bool, dict]]) -> Path:
+    """Write segment with records."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(
+        segment_header() + b"".join(encode_record(*record) for record in records)
+    )
+    return path
+
+
+def test_records_round_trip_anonymized(tmp_path: Path) -> None:
+    """Records read back in order, credentials removed, unknown fields kept."""
+
+    path = _segment(
+        tmp_path / f"segment{SUFFIX}",
+        [
+            (1.5, False, {"ID": "STATION1", "tempf": "50.5", "custom": "x"}),
+            (2.5, True, {"wspw": "secret", "t1tem": "10.2"}),
+        ],
+    )
+
+    records, offset = read_segment(path)
+
+    assert offset == 0
+    assert [(timestamp, wslink) for timestamp, wslink, _ in records] == [
+        (1.5, False),
+        (2.5, True),
+    ]
+    assert records[0][2]["tempf"] == "50.5"
+    assert records[0][2]["custom"] == "x"
+    assert records[0][2].get("ID") != "STATION1"
+    assert records[1][2].get("wspw") != "secret"
+
+
+def test_read_segment_in_chunks(tmp_path: Path) -> None:
+    """Reading continues from the returned offset until it is 0."""
+
+    path = _segment(
+        tmp_path / f"segment{SUFFIX}",
+        [(float(second), False, {"tempf": str(second)}) for second in range(5)],
+    )
+
+    first, offset = read_segment(path, limit=3)
+    rest, end = read_segment(path, offset, limit=3)
+
+    assert [record[0] for record in first + rest] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert offset and not end
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {WINDY_ENABLED: False, WINDY_STATION_ID: "id", WINDY_STATION_PW: "pw"},
+        {WINDY_ENABLED: True, WINDY_STATION_ID: "", WINDY_STATION_PW: "pw"},
+    ],
+)
+async def test_replay_to_windy_requires_windy(
+    hass, config_entry, coordinator, options: dict
+) -> None:
+    """Replay to Windy is refused while Windy is not set up."""
+
+    hass.config_entries.async_update_entry(
+        config_entry, options=config_entry.options | options
+    )
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = coordinator
+    async_setup_services(hass)
+    await hass.async_add_executor_job(
+        _segment,
+        Path(hass.config.path(ARCHIVE_DIR)) / f"segment{SUFFIX}",
+        [(1.0, True, {"t1tem": "10"})],
+    )
+
+    with pytest.raises(ServiceValidationError, match="Windy"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_REPLAY,
+            {"segment": "segment", "target": REPLAY_WINDY},
+            blocking=True,
+        )
@@ -0,0 +1,66 @@
+"""Tests of upload credential checks."""
+
+from unittest.mock import patch
+
+from custom_components.sws12500.auth import CredentialGuard
+from custom_components.sws12500.const import (
+    AUTH_LOCKOUT,
+    AUTH_MAX_FAILURES,
+    AUTH_MAX_SOURCES,
+)
+
+MONOTONIC = "custom_components.sws12500.auth.time.monotonic"
+
+
+def test_credentials_checked() -> None:
+    """Only matching id and key pass, unconfigured guard passes nobody."""
+
+    guard = CredentialGuard("station", "secret")
+
+    assert guard.check("10.0.0.1", "station", "secret")
+    assert not guard.check("10.0.0.1", "station", "wrong")
+    assert not CredentialGuard(None, None).check("10.0.0.1", "", "")
+    assert guard.diagnostics()["rejected"] == 1
+
+
+def test_lockout_after_failures() -> None:
+    """Repeated failures lock the source out until the lockout expires."""
+
+    guard = CredentialGuard("station", "secret")
+
+    with patch(MONOTONIC, return_value=1000.0):
+        for _ in range(AUTH_MAX_FAILURES - 1):
+            guard.check("10.0.0.1", "station", "wrong")
+        assert not guard.is_locked("10.0.0.1")
+
+        guard.missing("10.0.0.1")
+        assert guard.is_locked("10.0.0.1")
+        assert not guard.is_locked("10.0.0.2")
+        assert guard.diagnostics()["locked_sources"] == 1
+
+    with patch(MONOTONIC, return_value=1000.0 + AUTH_LOCKOUT + 1):
+        assert not guard.is_locked("10.0.0.1")
+        assert guard.check("10.0.0.1", "station", "secret")
+
+
+def test_success_forgets_failures() -> None:
+    """A correct upload clears failures counted so far."""
+
+    guard = CredentialGuard("station", "secret")
+    for _ in range(AUTH_MAX_FAILURES - 1):
+        guard.check("10.0.0.1", "station", "wrong")
+    guard.check("10.0.0.1", "station", "secret")
+    guard.check("10.0.0.1", "station", "wrong")
+
+    assert not guard.is_locked("10.0.0.1")
+
+
+def test_tracked_sources_bounded() -> None:
+    """A flood of failing addresses does not grow state without limit."""
+
+    guard = CredentialGuard("station", "secret")
+    with patch(MONOTONIC, return_value=1000.0):
+        for number in range(AUTH_MAX_SOURCES * 2):
+            guard.missing(f"10.0.{number // 256}.{number % 256}")
+
+    assert len(guard._failures) <= AUTH_MAX_SOURCES
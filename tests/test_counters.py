@@ -0,0 +1,129 @@
+"""Tests of cumulative counter tracking."""
+
+import pytest
+
+from custom_components.sws12500.const import (
+    COUNTER_RESET_TOLERANCE,
+    DAILY_RAIN,
+    PRECIPITATION_TOTAL,
+    RAIN_INCREMENT,
+    WEEKLY_RAIN,
+)
+from custom_components.sws12500.counters import CounterTracker, RainCounters
+
+
+def test_first_reading_counts_nothing() -> None:
+    """The first reading only sets the reference."""
+
+    tracker = CounterTracker()
+
+    assert tracker.update(12.5) == 0.0
+    assert tracker.total == 0.0
+    assert tracker.last == 12.5
+
+
+def test_increments_accumulate() -> None:
+    """Growing readings add their differences to the total."""
+
+    tracker = CounterTracker()
+    for value in (1.0, 1.5, 1.5, 3.0):
+        tracker.update(value)
+
+    assert tracker.increment == pytest.approx(1.5)
+    assert tracker.total == pytest.approx(2.0)
+    assert tracker.resets == 0
+
+
+def test_reset_detected() -> None:
+    """A drop back towards zero counts the new reading as rain."""
+
+    tracker = CounterTracker()
+    for value in (5.0, 8.0, 0.4):
+        tracker.update(value)
+
+    assert tracker.resets == 1
+    assert tracker.increment == pytest.approx(0.4)
+    assert tracker.total == pytest.approx(3.4)
+
+    tracker.update(1.0)
+    assert tracker.total == pytest.approx(4.0)
+
+
+def test_jitter_is_not_reset() -> None:
+    """A small decrease is jitter, the previous reading stays reference."""
+
+    tracker = CounterTracker()
+    tracker.update(10.0)
+
+    assert tracker.update(10.0 - COUNTER_RESET_TOLERANCE / 2) == 0.0
+    assert tracker.resets == 0
+    assert tracker.last == 10.0
+
+    tracker.update(10.3)
+    assert tracker.total == pytest.approx(0.3)
+
+
+def test_drop_to_zero_is_reset() -> None:
+    """Reset to zero is counted even from below the jitter tolerance."""
+
+    tracker = CounterTracker()
+    tracker.update(COUNTER_RESET_TOLERANCE / 2)
+
+    assert tracker.update(0.0) == 0.0
+    assert tracker.resets == 1
+    assert tracker.last == 0.0
+
+    tracker.update(COUNTER_RESET_TOLERANCE / 4)
+    assert tracker.total == pytest.approx(COUNTER_RESET_TOLERANCE / 4)
+
+
+def test_rain_counters_use_finest_counter() -> None:
+    """Total and increment follow daily rain when it is reported."""
+
+    counters = RainCounters()
+    counters.update({DAILY_RAIN: "2.0", WEEKLY_RAIN: "10.0"})
+    result = counters.update({DAILY_RAIN: "2.6", WEEKLY_RAIN: "10.0"})
+
+    assert result == {RAIN_INCREMENT: 0.6, PRECIPITATION_TOTAL: 0.6}
+
+
+def test_rain_counters_fall_back_to_coarser_counter() -> None:
+    """Without daily rain the next reported counter is used."""
+
+    counters = RainCounters()
+    counters.update({WEEKLY_RAIN: 10.0})
+    result = counters.update({WEEKLY_RAIN: 11.0, DAILY_RAIN: None})
+
+    assert result == {RAIN_INCREMENT: 1.0, PRECIPITATION_TOTAL: 1.0}
+
+
+def test_rain_counters_keep_source() -> None:
+    """Total does not switch counters when the finer one shows up later."""
+
+    counters = RainCounters()
+    counters.update({WEEKLY_RAIN: 10.0})
+    counters.update({WEEKLY_RAIN: 11.0, DAILY_RAIN: 1.0})
+    result = counters.update({WEEKLY_RAIN: 12.5, DAILY_RAIN: 2.5})
+
+    assert result == {RAIN_INCREMENT: 1.5, PRECIPITATION_TOTAL: 2.5}
+    assert counters.update({DAILY_RAIN: 3.0}) == {}
+    assert counters.diagnostics()[WEEKLY_RAIN]["source"]
+
+
+def test_rain_counters_midnight_reset() -> None:
+    """Daily reset at midnight keeps the total monotonic."""
+
+    counters = RainCounters()
+    totals = [
+        counters.update({DAILY_RAIN: value})[PRECIPITATION_TOTAL]
+        for value in (0.0, 4.0, 7.5, 0.0, 1.2)
+    ]
+
+    assert totals == [0.0, 4.0, 7.5, 7.5, 8.7]
+    assert counters.diagnostics()[DAILY_RAIN]["resets"] == 1
+
+
+def test_rain_counters_without_counters() -> None:
+    """Uploads without rain counters return nothing."""
+
+    assert RainCounters().update({"outside_temp": 20.0}) == {}
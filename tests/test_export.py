@@ -0,0 +1,79 @@
+"""Tests of the streaming export of station history."""
+
+import gzip
+import json
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.sws12500.const import EXPORT_JSONL, OUTSIDE_TEMP
+from custom_components.sws12500.export import (
+    export_stream,
+    iter_csv,
+    iter_jsonl,
+    iter_states,
+    resolve_fields,
+)
+
+ROWS = [(0.0, OUTSIDE_TEMP, "20.5"), (60.0, "wind_dir_text", "NNE")]
+
+
+def test_csv_and_jsonl_encoding() -> None:
+    """Rows are encoded with ISO time, JSON keeps numbers as numbers."""
+
+    csv = b"".join(iter_csv([ROWS, []])).decode().splitlines()
+    lines = [json.loads(line) for line in b"".join(iter_jsonl([ROWS])).splitlines()]
+
+    assert csv == [
+        "time,field,value",
+        "1970-01-01T00:00:00+00:00,outside_temp,20.5",
+        "1970-01-01T00:01:00+00:00,wind_dir_text,NNE",
+    ]
+    assert [line["value"] for line in lines] == [20.5, "NNE"]
+
+
+def test_csv_header_without_rows() -> None:
+    """An empty range still exports the header."""
+
+    assert b"".join(iter_csv([])) == b"time,field,value\r\n"
+
+
+async def test_export_pages_through_states(recorder_mock, hass) -> None:
+    """States are read in chunks, unknown states are skipped."""
+
+    entity_id = (
+        er.async_get(hass)
+        .async_get_or_create("sensor", "sws12500", OUTSIDE_TEMP)
+        .entity_id
+    )
+    start = dt_util.utcnow().timestamp() - 1
+    for state in ("20.0", "unknown", "20.5", "21.0", "21.5"):
+        hass.states.async_set(entity_id, state)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    entities = resolve_fields(hass, None)
+    end = dt_util.utcnow().timestamp() + 1
+    recorder = get_instance(hass)
+    chunks = await recorder.async_add_executor_job(
+        lambda: list(iter_states(hass, entities, start, end, chunk=2))
+    )
+    exported = await recorder.async_add_executor_job(
+        lambda: b"".join(export_stream(hass, entities, start, end, EXPORT_JSONL, True))
+    )
+
+    assert entities == {entity_id: OUTSIDE_TEMP}
+    assert [state for rows in chunks for _, _, state in rows] == [
+        "20.0",
+        "20.5",
+        "21.0",
+        "21.5",
+    ]
+    assert len(chunks) == 3
+    assert [
+        json.loads(line)["value"] for line in gzip.decompress(exported).splitlines()
+    ] == [20.0, 20.5, 21.0, 21.5]
@@ -0,0 +1,116 @@
+"""Tests of the Zambretti forecast."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from custom_components.sws12500.const import (
+    BARO_PRESSURE,
+    FORECAST_MIN_SPAN,
+    PRESSURE_TENDENCY_WINDOW,
+    WIND_DIR,
+    WIND_SPEED,
+    ZAMBRETTI_FORECAST,
+)
+from custom_components.sws12500.forecast import (
+    FORECASTS,
+    PressureForecast,
+    zambretti,
+)
+from custom_components.sws12500.rolling import RollingDelta
+
+JANUARY = 1
+JULY = 7
+START = datetime(2025, 1, 15, tzinfo=UTC).timestamp()
+
+
+@pytest.mark.parametrize(
+    ("pressure", "tendency", "expected"),
+    [
+        (1040.0, 0.0, "a"),  # high and steady: settled fine
+        (1001.0, 0.0, "n"),
+        (1002.0, 2.0, "g"),  # rising
+        (1002.0, -2.0, "u"),  # falling
+        (960.0, -2.0, "z"),  # deep low, falling: stormy
+        (1100.0, 0.0, "a"),  # clamped to the top band
+        (900.0, 0.0, "z"),  # clamped to the bottom band
+    ],
+)
+def test_table_lookup(pressure: float, tendency: float, expected: str) -> None:
+    """Pressure band and trend select the forecast."""
+
+    assert zambretti(pressure, tendency, None, JANUARY) == expected
+
+
+def test_summer_shifts_trend() -> None:
+    """Rising pressure in summer reads higher, southern seasons are reversed."""
+
+    assert zambretti(1002.0, 2.0, None, JULY) == "f"
+    assert zambretti(1002.0, 2.0, None, JANUARY, southern=True) == "f"
+    assert zambretti(1002.0, 2.0, None, JULY, southern=True) == "g"
+
+
+def test_wind_correction() -> None:
+    """Northerly wind raises pressure, southern hemisphere is mirrored."""
+
+    assert zambretti(1001.0, 0.0, 0.0, JANUARY) == "k"
+    assert zambretti(1001.0, 0.0, 180.0, JANUARY, southern=True) == "k"
+    assert zambretti(1001.0, 0.0, 180.0, JANUARY) != "k"
+
+
+def test_every_result_is_a_forecast_key() -> None:
+    """All lookups return one of the forecast keys."""
+
+    results = {
+        zambretti(pressure, tendency, wind, month)
+        for pressure in range(940, 1060, 3)
+        for tendency in (-3.0, 0.0, 3.0)
+        for wind in (None, 0.0, 90.0, 200.0, 359.0)
+        for month in (JANUARY, JULY)
+    }
+
+    assert results <= set(FORECASTS)
+
+
+def _forecast(samples: list[tuple[float, float]], data: dict) -> dict[str, str]:
+    window = RollingDelta(PRESSURE_TENDENCY_WINDOW)
+    for offset, pressure in samples:
+        window.add(START + offset, pressure)
+    return PressureForecast(window, False).update(data, START + samples[-1][0])
+
+
+def test_no_forecast_without_history() -> None:
+    """Less than the minimum span of pressure history gives no forecast."""
+
+    half = FORECAST_MIN_SPAN / 2
+    assert _forecast([(0, 1010.0), (half, 1009.0)], {BARO_PRESSURE: 1009.0}) == {}
+
+
+def test_no_forecast_without_pressure() -> None:
+    """Uploads without pressure give no forecast."""
+
+    samples = [(0, 1010.0), (FORECAST_MIN_SPAN, 1009.0)]
+    assert _forecast(samples, {BARO_PRESSURE: None}) == {}
+
+
+def test_tendency_scaled_to_three_hours() -> None:
+    """The window change is scaled to a 3 hour tendency."""
+
+    # 1 hPa in one hour is 3 hPa per 3 hours, falling
+    samples = [(0, 1009.0), (FORECAST_MIN_SPAN, 1008.0)]
+    result = _forecast(samples, {BARO_PRESSURE: 1008.0})
+
+    assert result == {ZAMBRETTI_FORECAST: zambretti(1008.0, -3.0, None, JANUARY)}
+    # unscaled change would be steady
+    assert result != {ZAMBRETTI_FORECAST: zambretti(1008.0, -1.0, None, JANUARY)}
+
+
+def test_calm_wind_not_corrected() -> None:
+    """Wind direction is ignored when there is no wind."""
+
+    samples = [(0, 1001.0), (FORECAST_MIN_SPAN, 1001.0)]
+    calm = _forecast(samples, {BARO_PRESSURE: 1001.0, WIND_DIR: 0.0, WIND_SPEED: 0.0})
+    windy = _forecast(samples, {BARO_PRESSURE: 1001.0, WIND_DIR: 0.0, WIND_SPEED: 3.0})
+
+    assert calm == {ZAMBRETTI_FORECAST: "n"}
+    assert windy == {ZAMBRETTI_FORECAST: "k"}
@@ -0,0 +1,49 @@
+"""Tests of forwarding to external services after unload."""
+
+from unittest.mock import Mock
+
+import pytest
+from aiohttp import web
+
+from custom_components.sws12500.forwarder import ForwarderSession
+from custom_components.sws12500.pocasti_cz import PocasiPush
+from custom_components.sws12500.routes import Routes, unregistred
+from custom_components.sws12500.windy_func import WindyPush
+
+
+async def test_closed_session_refuses_new_session(hass) -> None:
+    """A closed forwarder does not open a session nobody would close."""
+
+    client = ForwarderSession(hass, "test", keepalive_timeout=10)
+    await client.async_close()
+
+    assert client.closed
+    with pytest.raises(RuntimeError):
+        client.session  # noqa: B018
+
+
+async def test_late_upload_after_close_is_dropped(hass, config_entry) -> None:
+    """Uploads reaching closed forwarders are dropped without errors."""
+
+    windy = WindyPush(hass, config_entry)
+    pocasi = PocasiPush(hass, config_entry)
+    await windy.client.async_close()
+    await pocasi.client.async_close()
+
+    assert await windy.push_archived({"tempf": "50"}, False, 0.0) is None
+    pocasi.aggregator.add({"tempf": "50"})
+    assert await pocasi._send_pending() is None
+
+
+def test_disable_routes_to_unregistred() -> None:
+    """Unloaded entry leaves no route calling its coordinator."""
+
+    handler = Mock()
+    route = Mock(spec=web.AbstractRoute)
+    routes = Routes()
+    routes.add_route("/weatherstation/updateweatherstation.php", route, handler, True)
+
+    routes.disable()
+
+    assert routes.get_enabled() == "None"
+    assert route._handler is unregistred
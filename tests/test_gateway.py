@@ -0,0 +1,77 @@
+"""Tests of the standalone ingest gateway."""
+
+import argparse
+import importlib.util
+import ssl
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+GATEWAY_PATH = Path(__file__).parents[1] / "gateway" / "sws12500_gateway.py"
+spec = importlib.util.spec_from_file_location("sws12500_gateway", GATEWAY_PATH)
+gateway = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(gateway)
+
+
+def _self_signed(path: Path) -> tuple[Path, Path]:
+    """Write self-signed certificate and key, return their paths."""
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "gateway")])
+    now = datetime.now(UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    certfile, keyfile = path / "cert.pem", path / "key.pem"
+    certfile.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    keyfile.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return certfile, keyfile
+
+
+def test_ssl_context(tmp_path: Path) -> None:
+    """Certificate and key make a server context, none means plain HTTP."""
+
+    certfile, keyfile = _self_signed(tmp_path)
+
+    context = gateway.ssl_context(
+        argparse.Namespace(certfile=str(certfile), keyfile=str(keyfile))
+    )
+
+    assert isinstance(context, ssl.SSLContext)
+    assert not context.check_hostname
+    assert gateway.ssl_context(argparse.Namespace(certfile=None, keyfile=None)) is None
+
+
+async def test_spool_keeps_uploads_until_committed(tmp_path: Path) -> None:
+    """Uploads are read again until committed, drained spool is compacted."""
+
+    spool = gateway.Spool(tmp_path, compact_size=1)
+    await spool.append(1.0, {"tempf": "50"})
+    await spool.append(2.0, {"tempf": "51"})
+
+    uploads, offset = await spool.read(10)
+    assert uploads == [[1.0, {"tempf": "50"}], [2.0, {"tempf": "51"}]]
+    assert (await spool.read(10))[0] == uploads
+
+    await spool.commit(offset)
+
+    assert spool.offset == 0
+    assert spool.pending_bytes() == 0
+    assert gateway.Spool(tmp_path, compact_size=1).offset == 0
@@ -0,0 +1,73 @@
+"""Tests of the in-memory observation history."""
+
+import pytest
+
+from custom_components.sws12500.history import (
+    ObservationHistory,
+    SeriesBuffer,
+    WindowStats,
+)
+
+NOW = 1_700_000_000.0
+
+
+def test_buffer_overwrites_oldest() -> None:
+    """A full buffer keeps only the newest samples."""
+
+    buffer = SeriesBuffer(3)
+    for i in range(5):
+        buffer.append(NOW + i, float(i))
+
+    assert len(buffer) == 3
+    assert buffer.latest() == (NOW + 4, 4.0)
+    assert buffer.last(10) == [(NOW + 2, 2.0), (NOW + 3, 3.0), (NOW + 4, 4.0)]
+    assert buffer.last(2) == [(NOW + 3, 3.0), (NOW + 4, 4.0)]
+
+
+def test_empty_buffer() -> None:
+    """Queries of an empty buffer return nothing."""
+
+    buffer = SeriesBuffer(3)
+
+    assert buffer.latest() is None
+    assert buffer.last(2) == []
+    assert buffer.stats(60, NOW) is None
+    assert buffer.rate(60, NOW) is None
+
+
+def test_window_stats() -> None:
+    """Only samples inside the window are counted."""
+
+    buffer = SeriesBuffer(10)
+    for offset, value in ((-120, 100.0), (-50, 10.0), (-20, 14.0), (0, 12.0)):
+        buffer.append(NOW + offset, value)
+
+    assert buffer.window(60, NOW) == [10.0, 14.0, 12.0]
+    assert buffer.stats(60, NOW) == WindowStats(3, 12.0, 10.0, 14.0)
+
+
+def test_rate_per_hour() -> None:
+    """Rate is the change between oldest and newest sample scaled to an hour."""
+
+    buffer = SeriesBuffer(10)
+    buffer.append(NOW - 1800, 1010.0)
+    buffer.append(NOW - 900, 1009.0)
+    buffer.append(NOW, 1008.5)
+
+    assert buffer.rate(3600, NOW) == pytest.approx(-3.0)
+    # one sample has no rate
+    assert buffer.rate(60, NOW) is None
+
+
+def test_history_adds_numeric_fields() -> None:
+    """Numeric values of uploads get a buffer per field, others are skipped."""
+
+    history = ObservationHistory(4)
+    history.add({"outside_temp": 20.5, "battery": "1", "name": "x"}, NOW)
+    history.add({"outside_temp": 21.5}, NOW + 60)
+
+    assert history.last("outside_temp", 5) == [(NOW, 20.5), (NOW + 60, 21.5)]
+    assert history.last("battery", 5) == [(NOW, 1.0)]
+    assert history.get("name") is None
+    assert history.last("missing", 5) == []
+    assert history.diagnostics()["memory_bytes"] == 2 * 16 * 4
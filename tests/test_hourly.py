@@ -0,0 +1,108 @@
+"""Tests of hourly statistics."""
+
+import pytest
+from homeassistant.components.sensor import SensorStateClass
+
+from custom_components.sws12500.hourly import HOUR, HourlyStatistics
+from custom_components.sws12500.sensors_common import WeatherSensorEntityDescription
+
+START = 1_700_000_000 - 1_700_000_000 % HOUR
+
+
+def _description(key: str, state_class: SensorStateClass | None):
+    return WeatherSensorEntityDescription(
+        key=key, state_class=state_class, value_fn=lambda data: data
+    )
+
+
+@pytest.fixture
+def hourly() -> HourlyStatistics:
+    """Return statistics of a temperature, wind direction and rain counter."""
+
+    return HourlyStatistics(
+        {
+            "temp": _description("temp", SensorStateClass.MEASUREMENT),
+            "dir": _description("dir", SensorStateClass.MEASUREMENT_ANGLE),
+            "rain": _description("rain", SensorStateClass.TOTAL_INCREASING),
+            "last_hour": _description("last_hour", SensorStateClass.TOTAL),
+            "battery": _description("battery", None),
+        }
+    )
+
+
+def test_mean_min_max(hourly: HourlyStatistics) -> None:
+    """Measurements get mean, min and max of the hour."""
+
+    for minute, value in ((0, 10.0), (20, 14.0), (40, "12")):
+        assert hourly.add(START + minute * 60, {"temp": value}) is None
+
+    hour, statistics = hourly.add(START + HOUR, {"temp": 20.0})
+
+    assert hour == START
+    assert statistics == {"temp": {"mean": 12.0, "min": 10.0, "max": 14.0}}
+
+
+def test_angle_mean_wraps(hourly: HourlyStatistics) -> None:
+    """Directions around north average to north, without min and max."""
+
+    hourly.add(START, {"dir": 350.0})
+    hourly.add(START + 60, {"dir": 10.0})
+
+    _, statistics = hourly.close()
+
+    assert statistics["dir"].keys() == {"mean"}
+    mean = statistics["dir"]["mean"]
+    assert min(mean, 360 - mean) == pytest.approx(0.0, abs=0.01)
+
+
+def test_sum_continues_across_hours_and_resets(hourly: HourlyStatistics) -> None:
+    """Sums grow from the first sample and survive counter resets."""
+
+    hourly.add(START, {"rain": 5.0})
+    hourly.add(START + 60, {"rain": 6.5})
+    _, first = hourly.add(START + HOUR, {"rain": 0.5})
+    _, second = hourly.close()
+
+    assert first == {"rain": {"state": 6.5, "sum": 1.5}}
+    assert second == {"rain": {"state": 0.5, "sum": 2.0}}
+
+
+def test_rolling_total_is_not_summed(hourly: HourlyStatistics) -> None:
+    """A TOTAL amount that goes up and down gets mean and max, not a sum."""
+
+    for minute, value in ((0, 0.0), (15, 3.0), (30, 2.0), (45, 1.0)):
+        hourly.add(START + minute * 60, {"last_hour": value})
+
+    _, statistics = hourly.close()
+
+    assert statistics == {"last_hour": {"mean": 1.5, "min": 0.0, "max": 3.0}}
+
+
+def test_unknown_and_invalid_fields_ignored(hourly: HourlyStatistics) -> None:
+    """Fields without statistics and non-numeric values are skipped."""
+
+    hourly.add(START, {"battery": 1.0, "other": 3.0, "temp": "n/a"})
+
+    assert hourly.close() is None
+    assert hourly.samples == 1
+
+
+def test_late_sample_dropped(hourly: HourlyStatistics) -> None:
+    """Samples of an already closed hour are counted and dropped."""
+
+    hourly.add(START + HOUR, {"temp": 10.0})
+
+    assert hourly.add(START + 10, {"temp": 50.0}) is None
+    assert hourly.late == 1
+
+    _, statistics = hourly.close()
+    assert statistics["temp"]["max"] == 10.0
+
+
+def test_close_starts_new_hour(hourly: HourlyStatistics) -> None:
+    """After close the open hour is empty."""
+
+    hourly.add(START, {"temp": 10.0})
+
+    assert hourly.close() is not None
+    assert hourly.close() is None
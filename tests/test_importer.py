@@ -0,0 +1,108 @@
+"""Tests of the import of historical data."""
+
+from datetime import UTC, datetime, timedelta
+from functools import partial
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    get_metadata,
+    statistics_during_period,
+)
+from homeassistant.const import UnitOfTemperature
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.sws12500.const import OUTSIDE_TEMP, PRECIPITATION_TOTAL
+from custom_components.sws12500.importer import async_import_file
+from custom_components.sws12500.longterm import statistic_metadata
+from custom_components.sws12500.sensors_weather import SENSOR_TYPES_WEATHER_API
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def register(hass, key: str) -> str:
+    """Register sensor entity of key, return its entity id."""
+
+    return (
+        er.async_get(hass)
+        .async_get_or_create("sensor", "sws12500", key, suggested_object_id=key)
+        .entity_id
+    )
+
+
+async def hourly(hass, statistic_id: str, types: set[str]) -> dict[int, dict]:
+    """Return imported hourly statistics by hour."""
+
+    await async_wait_recording_done(hass)
+    rows = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        START,
+        None,
+        {statistic_id},
+        "hour",
+        None,
+        types,
+    )
+    return {
+        datetime.fromtimestamp(row["start"], UTC).hour: row
+        for row in rows[statistic_id]
+    }
+
+
+async def test_sums_continue_and_later_statistics_shift(
+    recorder_mock, hass, tmp_path
+) -> None:
+    """Imported sums continue existing ones, later sums move by imported rain."""
+
+    description = SENSOR_TYPES_WEATHER_API[PRECIPITATION_TOTAL]
+    entity_id = register(hass, PRECIPITATION_TOTAL)
+    async_import_statistics(
+        hass,
+        statistic_metadata(description, entity_id, "recorder"),
+        [
+            {"start": START + timedelta(hours=hour), "state": total, "sum": total}
+            for hour, total in ((0, 1.0), (1, 2.0), (2, 3.0), (10, 10.0))
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    lines = ["dateutc,dailyrainin"]
+    for minute in range(0, 180, 30):
+        moment = START + timedelta(hours=5, minutes=minute)
+        lines.append(f"{moment.isoformat()},{minute / 100:.2f}")
+    path = tmp_path / "history.csv"
+    path.write_text("\n".join(lines) + "\n")
+
+    result = await async_import_file(hass, path, {PRECIPITATION_TOTAL: description})
+
+    assert result == {"hours": 3, "statistics": [entity_id]}
+    rows = await hourly(hass, entity_id, {"sum"})
+    imported = rows[7]["sum"] - 3.0
+    assert 3.0 < rows[5]["sum"] <= rows[7]["sum"]
+    assert rows[10]["sum"] == round(10.0 + imported, 3)
+
+
+async def test_values_converted_to_entity_unit(recorder_mock, hass, tmp_path) -> None:
+    """Statistics are imported in the unit the entity shows."""
+
+    description = SENSOR_TYPES_WEATHER_API[OUTSIDE_TEMP]
+    entity_id = register(hass, OUTSIDE_TEMP)
+    hass.states.async_set(
+        entity_id, "68", {"unit_of_measurement": UnitOfTemperature.FAHRENHEIT}
+    )
+
+    path = tmp_path / "history.csv"
+    path.write_text(f"dateutc,tempf\n{START.isoformat()},68\n")
+
+    await async_import_file(hass, path, {OUTSIDE_TEMP: description})
+
+    rows = await hourly(hass, entity_id, {"mean"})
+    assert rows[0]["mean"] == 68.0
+    metadata = await get_instance(hass).async_add_executor_job(
+        partial(get_metadata, hass, statistic_ids={entity_id})
+    )
+    assert metadata[entity_id][1]["unit_of_measurement"] == "°F"
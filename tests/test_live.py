@@ -0,0 +1,75 @@
+"""Tests of the live stream and its websocket subscription."""
+
+from homeassistant.setup import async_setup_component
+
+from custom_components.sws12500.const import DOMAIN, WS_SUBSCRIBE
+from custom_components.sws12500.live import LiveStream
+from custom_components.sws12500.websocket_api import async_register_websocket_api
+
+
+def test_publish_sends_changed_fields_once_serialized() -> None:
+    """Subscribers share one serialized delta of the changed fields."""
+
+    live = LiveStream()
+    first, second = [], []
+    live.subscribe(first.append)
+    live.subscribe(second.append)
+
+    live.publish({"outside_temp": 20.0, "outside_humidity": 50.0})
+    live.publish({"outside_temp": 20.0, "outside_humidity": 51.0})
+    live.publish({"outside_temp": 20.0})
+
+    assert (
+        first
+        == second
+        == [
+            '{"delta":{"outside_temp":20.0,"outside_humidity":50.0}}',
+            '{"delta":{"outside_humidity":51.0}}',
+        ]
+    )
+    assert live.snapshot() == (
+        '{"snapshot":{"outside_temp":20.0,"outside_humidity":51.0}}'
+    )
+    assert live.diagnostics()["serialized"] == 2
+
+
+def test_close_ends_subscriptions() -> None:
+    """Closing calls back every subscriber, later unsubscribe is harmless."""
+
+    live = LiveStream()
+    events, closed = [], []
+    unsubscribe = live.subscribe(events.append, lambda: closed.append(True))
+
+    live.close()
+    live.publish({"outside_temp": 20.0})
+    unsubscribe()
+
+    assert closed == [True]
+    assert events == []
+
+
+async def test_websocket_subscription_closed_on_shutdown(
+    hass, hass_ws_client, config_entry, coordinator
+) -> None:
+    """Subscribers get snapshot, deltas and an error once the station unloads."""
+
+    assert await async_setup_component(hass, "websocket_api", {})
+    async_register_websocket_api(hass)
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = coordinator
+    coordinator.live.publish({"outside_temp": 20.0})
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": WS_SUBSCRIBE})
+    assert (await client.receive_json())["success"]
+    event = await client.receive_json()
+    assert event["event"] == {"snapshot": {"outside_temp": 20.0}}
+
+    coordinator.live.publish({"outside_temp": 21.0})
+    event = await client.receive_json()
+    assert event["event"] == {"delta": {"outside_temp": 21.0}}
+
+    await coordinator.async_shutdown()
+    closed = await client.receive_json()
+    assert closed["id"] == event["id"]
+    assert not closed["success"]
+    assert closed["error"]["code"] == "not_found"
@@ -0,0 +1,35 @@
+"""Tests of long-term statistics metadata."""
+
+import pytest
+from homeassistant.components.recorder.models import StatisticMeanType
+
+from custom_components.sws12500.const import (
+    OUTSIDE_TEMP,
+    PRECIPITATION_TOTAL,
+    RAIN,
+    WIND_DIR,
+)
+from custom_components.sws12500.longterm import statistic_metadata
+from custom_components.sws12500.sensors_weather import SENSOR_TYPES_WEATHER_API
+
+
+@pytest.mark.parametrize(
+    ("key", "mean_type", "has_sum"),
+    [
+        (OUTSIDE_TEMP, StatisticMeanType.ARITHMETIC, False),
+        (WIND_DIR, StatisticMeanType.CIRCULAR, False),
+        (RAIN, StatisticMeanType.ARITHMETIC, False),
+        (PRECIPITATION_TOTAL, StatisticMeanType.NONE, True),
+    ],
+)
+def test_statistic_metadata(
+    key: str, mean_type: StatisticMeanType, has_sum: bool
+) -> None:
+    """Only counters get sums, rolling rain amounts get a mean."""
+
+    description = SENSOR_TYPES_WEATHER_API[key]
+    metadata = statistic_metadata(description, f"sws12500:{key}", "sws12500", name=key)
+
+    assert metadata["mean_type"] is mean_type
+    assert metadata["has_sum"] is has_sum
+    assert metadata["unit_of_measurement"] == description.native_unit_of_measurement
@@ -0,0 +1,60 @@
+"""Tests of normalization to canonical units."""
+
+import pytest
+
+from custom_components.sws12500.const import (
+    BARO_PRESSURE,
+    DAILY_RAIN,
+    OUTSIDE_BATTERY,
+    OUTSIDE_TEMP,
+    UV,
+    WIND_SPEED,
+)
+from custom_components.sws12500.normalize import normalize
+
+
+def test_wu_imperial_converted() -> None:
+    """WU uploads are converted from imperial units."""
+
+    result = normalize(
+        {
+            OUTSIDE_TEMP: "50",
+            BARO_PRESSURE: "29.92",
+            WIND_SPEED: "10",
+            DAILY_RAIN: "1",
+            UV: "3",
+        },
+        False,
+    )
+
+    assert result == {
+        OUTSIDE_TEMP: 10.0,
+        BARO_PRESSURE: pytest.approx(1013.21, abs=0.01),
+        WIND_SPEED: pytest.approx(4.47, abs=0.01),
+        DAILY_RAIN: 25.4,
+        UV: 3.0,
+    }
+
+
+def test_wslink_metric_kept() -> None:
+    """WSLink uploads are already metric, only parsed."""
+
+    assert normalize({OUTSIDE_TEMP: "10.5", WIND_SPEED: "4"}, True) == {
+        OUTSIDE_TEMP: 10.5,
+        WIND_SPEED: 4.0,
+    }
+
+
+def test_empty_raw_and_text_values() -> None:
+    """Empty values are None, raw fields and text stay as sent."""
+
+    result = normalize(
+        {OUTSIDE_TEMP: "", OUTSIDE_BATTERY: "1", "softwaretype": "EasyWeather"},
+        False,
+    )
+
+    assert result == {
+        OUTSIDE_TEMP: None,
+        OUTSIDE_BATTERY: "1",
+        "softwaretype": "EasyWeather",
+    }
@@ -0,0 +1,54 @@
+"""Tests of the forwarder scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from custom_components.sws12500.forwarder import ForwarderScheduler
+
+
+async def test_deferred_data_sent_at_deadline(hass) -> None:
+    """Data arriving early is sent once by the timer."""
+
+    send = AsyncMock()
+    scheduler = ForwarderScheduler(hass, interval=60, initial_delay=0.05, send=send)
+
+    assert not scheduler.due()
+    scheduler.defer()
+    scheduler.defer()
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+
+    send.assert_awaited_once()
+    assert scheduler.due()
+
+
+async def test_cancel_stops_timer_and_later_sends(hass) -> None:
+    """After cancel pending data is dropped and nothing is scheduled."""
+
+    send = AsyncMock()
+    scheduler = ForwarderScheduler(hass, interval=60, initial_delay=0.05, send=send)
+    scheduler.defer()
+
+    await scheduler.async_cancel()
+    scheduler.defer()
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+
+    send.assert_not_awaited()
+    assert not scheduler.pending
+    assert not scheduler.due()
+
+
+async def test_shutdown_drops_pending_payloads(hass, coordinator) -> None:
+    """Coordinator shutdown leaves forwarders nothing to send."""
+
+    coordinator.windy.aggregator.add({"tempf": "50"})
+    coordinator.windy.scheduler.defer()
+    coordinator.pocasi.aggregator.add({"tempf": "50"})
+
+    await coordinator.async_shutdown()
+
+    assert coordinator.windy.aggregator.samples == 0
+    assert coordinator.pocasi.aggregator.samples == 0
+    assert coordinator.windy.scheduler.cancelled
+    assert coordinator.windy.client.closed
@@ -0,0 +1,46 @@
+"""Tests of sensor entity updates."""
+
+from unittest.mock import Mock
+
+from custom_components.sws12500.const import OUTSIDE_TEMP
+from custom_components.sws12500.sensor import WeatherSensor
+from custom_components.sws12500.sensors_wslink import SENSOR_TYPES_WSLINK
+
+
+def _upload(temp: float) -> dict[str, str]:
+    return {"t1tem": str(temp), "t1hum": "50", "rbar": "1010"}
+
+
+async def test_rejected_spike_keeps_last_value(hass, coordinator) -> None:
+    """A spike rejected by validation is not written and the value is kept."""
+
+    sensor = WeatherSensor(hass, SENSOR_TYPES_WSLINK[OUTSIDE_TEMP], coordinator)
+    sensor.async_write_ha_state = Mock()
+
+    for temp in (20.0, 21.0, 22.0, 21.0, 20.0, 21.0):
+        await coordinator.async_ingest(_upload(temp), True)
+        sensor._handle_coordinator_update()
+    assert sensor.native_value == 21.0
+    writes = sensor.async_write_ha_state.call_count
+
+    await coordinator.async_ingest(_upload(45.0), True)
+    sensor._handle_coordinator_update()
+
+    assert OUTSIDE_TEMP not in coordinator.data
+    assert sensor.native_value == 21.0
+    assert sensor.async_write_ha_state.call_count == writes
+
+
+async def test_missing_value_keeps_last_value(hass, coordinator) -> None:
+    """Uploads without the field leave the sensor alone."""
+
+    sensor = WeatherSensor(hass, SENSOR_TYPES_WSLINK[OUTSIDE_TEMP], coordinator)
+    sensor.async_write_ha_state = Mock()
+
+    await coordinator.async_ingest(_upload(12.5), True)
+    sensor._handle_coordinator_update()
+    await coordinator.async_ingest({"rbar": "1011"}, True)
+    sensor._handle_coordinator_update()
+
+    assert sensor.native_value == 12.5
+    assert sensor.async_write_ha_state.call_count == 1
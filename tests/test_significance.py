@@ -0,0 +1,51 @@
+"""Tests of suppression of insignificant updates."""
+
+from unittest.mock import patch
+
+from custom_components.sws12500.const import DAILY_RAIN, OUTSIDE_TEMP
+from custom_components.sws12500.sensors_wslink import SENSOR_TYPES_WSLINK
+from custom_components.sws12500.significance import SignificanceFilter
+
+MONOTONIC = "custom_components.sws12500.significance.time.monotonic"
+
+
+def test_small_changes_suppressed_until_heartbeat() -> None:
+    """Changes below the threshold are written once the heartbeat passes."""
+
+    significance = SignificanceFilter(SENSOR_TYPES_WSLINK)
+    heartbeat = SENSOR_TYPES_WSLINK[OUTSIDE_TEMP].heartbeat
+
+    with patch(MONOTONIC, return_value=0.0):
+        assert significance.update({OUTSIDE_TEMP: 20.0}) == {OUTSIDE_TEMP}
+        assert significance.update({OUTSIDE_TEMP: 20.1}) == set()
+        assert significance.update({OUTSIDE_TEMP: 20.3}) == {OUTSIDE_TEMP}
+    with patch(MONOTONIC, return_value=heartbeat):
+        assert significance.update({OUTSIDE_TEMP: 20.3}) == {OUTSIDE_TEMP}
+
+    assert significance.diagnostics() == {
+        "published": 3,
+        "suppressed": 1,
+        "suppression_ratio": 0.25,
+    }
+
+
+def test_without_threshold_any_change_counts() -> None:
+    """Fields without thresholds are written whenever they change."""
+
+    significance = SignificanceFilter(SENSOR_TYPES_WSLINK)
+    significance.update({DAILY_RAIN: 0.0})
+
+    assert significance.update({DAILY_RAIN: 0.0}) == set()
+    assert significance.update({DAILY_RAIN: 0.1}) == {DAILY_RAIN}
+
+
+def test_unknown_and_missing_keys_not_significant() -> None:
+    """Undescribed fields are ignored, missing ones are never written."""
+
+    significance = SignificanceFilter(SENSOR_TYPES_WSLINK)
+    data = {OUTSIDE_TEMP: 20.0, "rain_increment": 0.2}
+    significance.update(data)
+
+    assert significance.is_significant(OUTSIDE_TEMP, data)
+    assert not significance.is_significant("rain_increment", data)
+    assert not significance.is_significant(OUTSIDE_TEMP, {})
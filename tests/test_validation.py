@@ -0,0 +1,124 @@
+"""Tests of upload validation."""
+
+import random
+import statistics
+
+import pytest
+
+from custom_components.sws12500.const import (
+    BARO_PRESSURE,
+    OUTSIDE_HUMIDITY,
+    OUTSIDE_TEMP,
+    SPIKE_MIN_SAMPLES,
+    UV,
+)
+from custom_components.sws12500.validation import (
+    RollingMedian,
+    UploadValidator,
+    purge_rejected,
+)
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 15])
+def test_rolling_median_matches_statistics(size: int) -> None:
+    """Median and MAD match a full sort over the window."""
+
+    rng = random.Random(size)
+    window = RollingMedian(size)
+    samples: list[float] = []
+
+    for _ in range(200):
+        value = round(rng.gauss(20, 5), 1)
+        window.add(value)
+        samples = [*samples, value][-size:]
+
+        median = statistics.median(samples)
+        assert window.median() == pytest.approx(median)
+        assert window.mad(median) == pytest.approx(
+            statistics.median(abs(sample - median) for sample in samples)
+        )
+
+
+def test_out_of_range_removed() -> None:
+    """Values outside physical limits are removed from data."""
+
+    validator = UploadValidator()
+    data = {OUTSIDE_TEMP: 85.0, UV: 3.0, BARO_PRESSURE: 1013.0}
+
+    assert validator.validate(data) == {OUTSIDE_TEMP}
+    assert data == {UV: 3.0, BARO_PRESSURE: 1013.0}
+    assert validator.rejected == {OUTSIDE_TEMP: 1}
+
+
+def test_non_float_values_skipped() -> None:
+    """Strings such as battery states are not validated."""
+
+    validator = UploadValidator()
+    data = {OUTSIDE_TEMP: "1", OUTSIDE_HUMIDITY: 150.0}
+
+    assert validator.validate(data) == {OUTSIDE_HUMIDITY}
+    assert data == {OUTSIDE_TEMP: "1"}
+    assert validator.checked == 1
+
+
+def test_spike_rejected_after_history() -> None:
+    """A jump far from the rolling median is rejected once there is history."""
+
+    validator = UploadValidator()
+    for value in (20.0, 20.1, 20.2, 20.1, 20.0):
+        assert not validator.validate({OUTSIDE_TEMP: value})
+
+    data = {OUTSIDE_TEMP: 35.0}
+    assert validator.validate(data) == {OUTSIDE_TEMP}
+    assert not data
+
+    # a small change is accepted
+    assert not validator.validate({OUTSIDE_TEMP: 21.5})
+
+
+def test_spike_not_checked_without_history() -> None:
+    """Fewer samples than the minimum do not reject anything."""
+
+    validator = UploadValidator()
+    for value in (20.0, 35.0, 5.0):
+        assert not validator.validate({OUTSIDE_TEMP: value})
+
+
+def test_level_change_accepted() -> None:
+    """A persistent new level is accepted after repeated rejections."""
+
+    validator = UploadValidator()
+    for _ in range(SPIKE_MIN_SAMPLES):
+        validator.validate({BARO_PRESSURE: 1013.0})
+
+    results = [
+        validator.validate({BARO_PRESSURE: 1040.0}) for _ in range(SPIKE_MIN_SAMPLES)
+    ]
+    assert results[:-1] == [{BARO_PRESSURE}] * (SPIKE_MIN_SAMPLES - 1)
+    assert results[-1] == set()
+    assert validator.windows[BARO_PRESSURE].median() == 1040.0
+
+
+def test_validate_without_learning() -> None:
+    """Replayed values are checked but do not change the windows."""
+
+    validator = UploadValidator()
+    for _ in range(SPIKE_MIN_SAMPLES):
+        validator.validate({OUTSIDE_TEMP: 20.0})
+
+    for _ in range(2 * SPIKE_MIN_SAMPLES):
+        assert validator.validate({OUTSIDE_TEMP: 40.0}, learn=False)
+    assert not validator.validate({OUTSIDE_TEMP: 20.5}, learn=False)
+
+    window = validator.windows[OUTSIDE_TEMP]
+    assert len(window) == SPIKE_MIN_SAMPLES
+    assert window.rejected_in_row == 0
+
+
+def test_purge_rejected() -> None:
+    """Raw fields of rejected values are dropped, the others kept."""
+
+    raw = {"tempf": "185", "UV": "3", "ID": "station"}
+    remap = {"tempf": OUTSIDE_TEMP, "UV": UV}
+
+    assert purge_rejected(raw, remap, {OUTSIDE_TEMP}) == {"UV": "3", "ID": "station"}
@@ -0,0 +1,44 @@
+"""Tests of the bulk ingest batch decoding."""
+
+import gzip
+import json
+import time
+
+import pytest
+
+from custom_components.sws12500.const import BULK_MAX_SKEW
+from custom_components.sws12500.views import decode_batch
+
+
+def _batch(uploads: list, wslink: bool = False) -> bytes:
+    return json.dumps({"wslink": wslink, "uploads": uploads}).encode()
+
+
+def test_decode_sorts_and_stringifies() -> None:
+    """Uploads come back ordered by time with string fields."""
+
+    now = time.time()
+    body = gzip.compress(_batch([[now, {"tempf": 50.5}], [now - 60, {"UV": 1}]], True))
+
+    wslink, uploads = decode_batch(body, True)
+
+    assert wslink is True
+    assert uploads == [(now - 60, {"UV": "1"}), (now, {"tempf": "50.5"})]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"[]",
+        _batch([[1.0, ["tempf", "50"]]]),
+        b'{"uploads": [[NaN, {}]]}',
+        b'{"uploads": [[Infinity, {}]]}',
+        _batch([[time.time() + BULK_MAX_SKEW + 60, {}]]),
+        _batch([[None, {}]]),
+    ],
+)
+def test_malformed_batch_raises(body: bytes) -> None:
+    """Malformed batches, non-finite and future timestamps are rejected."""
+
+    with pytest.raises((ValueError, TypeError)):
+        decode_batch(body, False)
@@ -0,0 +1,91 @@
+"""Tests of the weather entity condition."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from homeassistant.components.weather import (
+    ATTR_CONDITION_CLEAR_NIGHT,
+    ATTR_CONDITION_CLOUDY,
+    ATTR_CONDITION_PARTLYCLOUDY,
+    ATTR_CONDITION_POURING,
+    ATTR_CONDITION_RAINY,
+    ATTR_CONDITION_SUNNY,
+    ATTR_CONDITION_WINDY,
+)
+
+from custom_components.sws12500.weather import StationWeather
+
+DRY_CALM = {"t1tem": "15", "t1ws": "1.0", "t1raindy": "0"}
+
+
+async def _weather(hass, coordinator, upload: dict[str, str]) -> StationWeather:
+    """Return weather entity updated with upload."""
+
+    weather = StationWeather(coordinator)
+    weather.hass = hass
+    weather.async_write_ha_state = Mock()
+    await coordinator.async_ingest(upload, True)
+    weather._handle_coordinator_update()
+    return weather
+
+
+@pytest.mark.parametrize(
+    ("upload", "expected"),
+    [
+        ({"t1rainra": "2.0"}, ATTR_CONDITION_RAINY),
+        ({"t1rainra": "12.0"}, ATTR_CONDITION_POURING),
+        ({"t1ws": "14.0"}, ATTR_CONDITION_WINDY),
+    ],
+)
+async def test_measured_condition(
+    hass, coordinator, upload: dict[str, str], expected: str
+) -> None:
+    """Rain and wind are reported as measured."""
+
+    weather = await _weather(hass, coordinator, {"t1tem": "15"} | upload)
+
+    assert weather.condition == expected
+
+
+@pytest.mark.parametrize(
+    ("upload", "expected"),
+    [
+        ({"t1solrad": "820"}, ATTR_CONDITION_SUNNY),
+        ({"t1solrad": "450"}, ATTR_CONDITION_PARTLYCLOUDY),
+        ({"t1solrad": "120"}, ATTR_CONDITION_CLOUDY),
+        ({"t1uvi": "9"}, ATTR_CONDITION_SUNNY),
+        ({"t1uvi": "1"}, ATTR_CONDITION_CLOUDY),
+    ],
+)
+async def test_dry_calm_sky_from_sunlight(
+    hass, coordinator, upload: dict[str, str], expected: str
+) -> None:
+    """Dry and calm sky follows the share of clear sky sunlight."""
+
+    with patch("custom_components.sws12500.weather.sun_elevation", return_value=70.0):
+        weather = await _weather(hass, coordinator, DRY_CALM | upload)
+        assert weather.condition == expected
+
+
+@pytest.mark.parametrize(
+    ("forecast", "daytime", "expected"),
+    [
+        ("a", True, ATTR_CONDITION_SUNNY),
+        ("a", False, ATTR_CONDITION_CLEAR_NIGHT),
+        ("e", False, ATTR_CONDITION_PARTLYCLOUDY),
+        ("u", True, ATTR_CONDITION_CLOUDY),
+        (None, True, None),
+    ],
+)
+async def test_dry_calm_sky_from_forecast(
+    hass, coordinator, forecast: str | None, daytime: bool, expected: str | None
+) -> None:
+    """With the sun low the sky comes from the Zambretti forecast."""
+
+    with (
+        patch("custom_components.sws12500.weather.sun_elevation", return_value=5.0),
+        patch("custom_components.sws12500.weather.is_up", return_value=daytime),
+    ):
+        weather = await _weather(hass, coordinator, DRY_CALM | {"t1solrad": "5"})
+        weather._forecast = forecast
+        assert weather.condition == expected